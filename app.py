@@ -1,11 +1,24 @@
+import os
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from credit_core.shared_store import load_shared
+from credit_core.chart_data import box_data, histogram_data, violin_data
+from credit_core.charts import association_heatmap, box_figure, density_figure, histogram_figure, violin_figure
+from credit_core.density import grouped_density
+from credit_core.filter_index import get_filter_index
+from credit_core.fingerprint import dataset_fingerprint
+from credit_core.cross_filter import CrossFilter
+from credit_core.column_profile import status_percentages, value_distribution
+from credit_core.contingency import contingency_table
+from credit_core.column_types import identify_column_types
+from credit_core.multi_hot import array_contingency_table, array_value_distribution
+from credit_core.heavy_hitters import MAX_WIDGET_OPTIONS, TOP_K, bounded_options
+from credit_core.warmup import WARMUP_MAX_DATASETS, WarmupScheduler, record_column_use
+from credit_core.association import association_columns, association_matrix
+from credit_core.export import EXPORT_FORMATS, available_formats, get_export
+from credit_core.instrumentation import METRICS_DIR, Recorder, mark_cache_miss
+from perf_panel import performance_panel, warmup_status
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -53,29 +66,58 @@ st.markdown("""
 # Judul Aplikasi
 st.markdown('<H1 class="main-header">Eratani Credit Score Dashboard</H1>', unsafe_allow_html=True)
 
-# Fungsi untuk membaca data
-@st.cache_data
+# Panel performa: waktu, memori, cache, dan ukuran grafik per rerun
+show_performance = st.sidebar.checkbox("Tampilkan panel performa")
+recorder = Recorder('app', enabled=show_performance or METRICS_DIR is not None, trace_memory=show_performance)
+
+# Fungsi untuk menampilkan grafik sekaligus mencatat ukuran payload-nya
+def show_chart(fig, name):
+    recorder.record_payload(name, fig)
+    st.plotly_chart(fig, use_container_width=True)
+
+# Fungsi untuk membaca data. Dataset dipetakan dari file Arrow bersama
+# (read-only), sehingga semua sesi dan worker memakai memori yang sama.
+@st.cache_resource
 def load_data():
+    mark_cache_miss('load_data')
     try:
-        df = pd.read_csv('credit_score_dataset_new.csv')
+        df = load_shared('credit_score_dataset_new.csv')
         return df
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
+# Pemanasan cache dijalankan sekali per dataset untuk seluruh proses (semua sesi
+# memakai penjadwal dan thread pool yang sama)
+@st.cache_resource(max_entries=WARMUP_MAX_DATASETS)
+def get_warmup(fingerprint, _df):
+    return WarmupScheduler(_df)
+
 # Load data
-df = load_data()
+with recorder.section('load_data'):
+    df = recorder.track_cache('load_data', load_data)
 
 if df is not None:
+    # Pemanasan cache semua kolom di latar belakang selagi UI sudah bisa dipakai
+    warmup = get_warmup(dataset_fingerprint(df), df)
+    warmup_status(warmup)
+    
     # Pisahkan kolom numerik dan kategorikal
     numeric_cols = ['farmer_age', 'farmer_dependents', 'farmer_field_tiles', 
                    'farmer_field_owned_area', 'farmer_field_proposed_area', 
                    'proposed_field_size_ratio', 'farmer_field_ph', 
                    'farmer_credit_score', 'farmer_retention', 'farmer_financial_monthly_income', 
-                   'farmer_last_year_harvest', 'farmer_last_year_expenses', 'farmer_total_loan']
+                   'farmer_last_year_harvest', 'farmer_last_year_expense', 'farmer_total_loan']
+    numeric_cols = [col for col in numeric_cols if col in df.columns]
     
     categorical_cols = [col for col in df.columns if col not in numeric_cols]
     
+    # Kolom berformat "[...]" dianalisis per elemen dari representasi multi-hot
+    column_types = identify_column_types(df)
+    array_cols = [col for col, type_ in column_types.items() if type_ == 'array']
+    
+    repayment_percentages = status_percentages(df) if 'farmer_repayment_status' in df.columns else {}
+    
     # Tampilkan KPI utama di bagian atas
     st.markdown('<p class="sub-header">Metrik Utama</p>', unsafe_allow_html=True)
     col1, col2, col3, col4 = st.columns(4)
@@ -94,9 +136,7 @@ if df is not None:
     with col3:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         if 'farmer_repayment_status' in df.columns:
-            good_repayment = df['farmer_repayment_status'].value_counts().get('Lunas', 0)
-            good_percent = round((good_repayment / len(df)) * 100, 2)
-            st.metric("Repayment Status Lunas", f"{good_percent}%")
+            st.metric("Repayment Status Lunas", f"{repayment_percentages.get('Lunas', 0)}%")
         else:
             st.metric("Repayment Status Baik", "N/A")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -104,9 +144,7 @@ if df is not None:
     with col4:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         if 'farmer_repayment_status' in df.columns:
-            good_repayment = df['farmer_repayment_status'].value_counts().get('Outstanding', 0)
-            good_percent = round((good_repayment / len(df)) * 100, 2)
-            st.metric("Repayment Status Outstanding", f"{good_percent}%")
+            st.metric("Repayment Status Outstanding", f"{repayment_percentages.get('Outstanding', 0)}%")
         else:
             st.metric("Repayment Status Baik", "N/A")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -127,10 +165,24 @@ if df is not None:
     else:
         selected_column = st.sidebar.selectbox("Pilih Kolom Kategorikal", categorical_cols)
     
+    # Catat popularitas kolom (urutan pemanasan cache berikutnya)
+    if st.session_state.get('last_selected_column') != selected_column:
+        record_column_use(selected_column)
+        st.session_state['last_selected_column'] = selected_column
+    
+    # Indeks filter dibuat sekali per dataset, filter menghasilkan seleksi baris
+    with recorder.section('filter_index'):
+        filter_index = get_filter_index(df)
+    
+    # Cross-filter disimpan per sesi agar perubahan filter dihitung inkremental
+    cross_filter = st.session_state.get('cross_filter')
+    if cross_filter is None or cross_filter.index is not filter_index:
+        cross_filter = CrossFilter(filter_index, 'farmer_repayment_status', ['farmer_credit_score'])
+        st.session_state['cross_filter'] = cross_filter
+    
     # Filter data berdasarkan range (untuk numerik) atau nilai (untuk kategorikal)
     if data_type == "Numerik":
-        min_val = float(df[selected_column].min())
-        max_val = float(df[selected_column].max())
+        min_val, max_val = filter_index.value_range(selected_column)
         
         # Gunakan input box untuk filter rentang numerik
         st.sidebar.subheader(f"Filter rentang {selected_column}")
@@ -154,25 +206,72 @@ if df is not None:
             st.sidebar.error("Nilai minimum tidak boleh lebih besar dari nilai maksimum!")
             input_min = input_max
             
-        filtered_df = df[(df[selected_column] >= input_min) & 
-                         (df[selected_column] <= input_max)]
+        cross_filter.set_range(selected_column, input_min, input_max)
     else:
-        unique_values = df[selected_column].dropna().unique()
-        selected_values = st.sidebar.multiselect(f"Filter nilai {selected_column}", 
-                                              unique_values, default=unique_values)
+        # Kolom bernilai unik banyak hanya menawarkan nilai terbanyak, tanpa default
+        # (kosong = tanpa filter) agar sidebar tidak membuat ribuan pilihan
+        unique_values, truncated = bounded_options(df, selected_column, MAX_WIDGET_OPTIONS)
+        selected_values = st.sidebar.multiselect(
+            f"Filter nilai {selected_column}",
+            unique_values,
+            default=[] if truncated else unique_values,
+            help=f"Hanya {MAX_WIDGET_OPTIONS} nilai terbanyak yang ditampilkan; kosongkan untuk semua nilai."
+            if truncated else None
+        )
         if selected_values:
-            filtered_df = df[df[selected_column].isin(selected_values)]
+            cross_filter.set_values(selected_column, selected_values)
+        else:
+            cross_filter.clear(selected_column)
+    
+    # Filter tambahan: rentang/nilai pada kolom lain ditumpuk dengan AND
+    extra_filter_cols = st.sidebar.multiselect(
+        "Filter tambahan (cross-filter)",
+        [col for col in df.columns if col != selected_column]
+    )
+    for col in extra_filter_cols:
+        if column_types.get(col) == 'numeric':
+            col_min, col_max = filter_index.value_range(col)
+            col1, col2 = st.sidebar.columns(2)
+            with col1:
+                extra_min = st.number_input(f"Min {col}", min_value=col_min, max_value=col_max,
+                                            value=col_min, key=f"cross_min_{col}")
+            with col2:
+                extra_max = st.number_input(f"Max {col}", min_value=col_min, max_value=col_max,
+                                            value=col_max, key=f"cross_max_{col}")
+            cross_filter.set_range(col, min(extra_min, extra_max), extra_max)
         else:
-            filtered_df = df
+            col_values, truncated = bounded_options(df, col, MAX_WIDGET_OPTIONS)
+            extra_values = st.sidebar.multiselect(f"Nilai {col}", col_values,
+                                                  default=[] if truncated else col_values,
+                                                  key=f"cross_values_{col}")
+            if extra_values:
+                cross_filter.set_values(col, extra_values)
+            else:
+                cross_filter.clear(col)
+    cross_filter.keep_only([selected_column] + extra_filter_cols)
+    selection = cross_filter.selection()
+    
+    # Statistik kolom numerik terpilih diambil dari agregat inkremental cross-filter
+    cross_filter.track_columns([selected_column] if data_type == "Numerik" else [])
+    
+    # Hanya kolom yang dianalisis yang diambil dari baris terpilih
+    analysis_cols = [selected_column]
+    if 'farmer_repayment_status' in df.columns:
+        analysis_cols.append('farmer_repayment_status')
+    with recorder.section('take_filtered'):
+        filtered_df = filter_index.take(selection, analysis_cols)
     
     # Tampilkan jumlah data setelah filter
-    st.sidebar.info(f"Jumlah data setelah filter: {len(filtered_df):,} dari {len(df):,}")
+    st.sidebar.info(f"Jumlah data setelah filter: {cross_filter.count():,} dari {len(df):,}")
+    if 'farmer_repayment_status' in df.columns:
+        st.sidebar.dataframe(cross_filter.group_summary().round(2), use_container_width=True)
     
     # Membuat dua tabs
-    tab1, tab2, tab3 = st.tabs(["Distribusi Kolom", "Perbandingan dengan Repayment Status", "Data Mentah"])
+    tab1, tab2, tab3, tab4 = st.tabs(["Distribusi Kolom", "Perbandingan dengan Repayment Status", "Data Mentah",
+                                      "Asosiasi Antar Kolom"])
     
     # Tab 1: Distribusi Kolom
-    with tab1:
+    with tab1, recorder.section('tab_distribusi'):
         st.markdown(f'<p class="sub-header">Distribusi {selected_column}</p>', unsafe_allow_html=True)
         
         if data_type == "Numerik":
@@ -181,41 +280,35 @@ if df is not None:
             
             with col1:
                 st.subheader("Statistik Deskriptif")
-                stats = filtered_df[selected_column].describe().reset_index()
+                stats = cross_filter.describe(selected_column).reset_index()
                 stats.columns = ['Statistik', 'Nilai']
                 st.dataframe(stats, use_container_width=True)
                 
-                # Distribusi sebagai box plot
-                fig_box = px.box(filtered_df, y=selected_column, 
-                                color_discrete_sequence=[COLOR_GREEN])
-                st.plotly_chart(fig_box, use_container_width=True)
+                # Distribusi sebagai box plot (statistik dihitung di server)
+                fig_box = box_figure(box_data(filtered_df, selected_column),
+                                     [COLOR_GREEN], selected_column)
+                show_chart(fig_box, 'distribusi_box')
             
             with col2:
                 st.subheader("Histogram")
-                fig_hist = px.histogram(filtered_df, x=selected_column, 
-                                     color_discrete_sequence=[COLOR_GREEN],
-                                     nbins=30,
-                                     marginal="rug")
-                fig_hist.update_layout(bargap=0.1)
-                st.plotly_chart(fig_hist, use_container_width=True)
+                fig_hist = histogram_figure(histogram_data(filtered_df, selected_column, nbins=30),
+                                            [COLOR_GREEN])
+                show_chart(fig_hist, 'distribusi_histogram')
                 
-                # Tambahkan KDE plot
-                fig_kde = px.density_contour(filtered_df, x=selected_column,
-                                          color_discrete_sequence=[COLOR_ORANGE])
-                fig_kde.update_traces(contours_coloring="fill", contours_showlabels=True)
-                st.plotly_chart(fig_kde, use_container_width=True)
+                # Tambahkan KDE plot (binning linear + FFT, dihitung di server)
+                fig_kde = density_figure(grouped_density(df, selected_column, selection=selection),
+                                         [COLOR_ORANGE], title="KDE")
+                show_chart(fig_kde, 'distribusi_kde')
         
         else:
             # Menampilkan distribusi untuk kolom kategorikal
             st.subheader("Distribusi Nilai")
             
             # Menghitung nilai absolut dan persentase
-            value_counts = filtered_df[selected_column].value_counts().reset_index()
-            value_counts.columns = ['Nilai', 'Jumlah']
-            
-            # Tambahkan persentase
-            total = value_counts['Jumlah'].sum()
-            value_counts['Persentase'] = (value_counts['Jumlah'] / total * 100).round(2)
+            if selected_column in array_cols:
+                value_counts = array_value_distribution(df, selected_column, filter_index.row_ids(selection))
+            else:
+                value_counts = value_distribution(df, selected_column, top_k=TOP_K, selection=selection)
             value_counts['Persentase Label'] = value_counts['Persentase'].apply(lambda x: f"{x}%")
             
             # Tampilkan tabel
@@ -232,7 +325,7 @@ if df is not None:
                               color_continuous_scale=[COLOR_LIGHT_GREEN, COLOR_GREEN])
                 fig_bar.update_traces(texttemplate='%{text}', textposition='outside')
                 fig_bar.update_layout(title="Distribusi Nilai (Absolute)")
-                st.plotly_chart(fig_bar, use_container_width=True)
+                show_chart(fig_bar, 'distribusi_bar')
             
             with col2:
                 # Tampilkan pie chart
@@ -241,58 +334,63 @@ if df is not None:
                               color_discrete_sequence=COLOR_PALETTE)
                 fig_pie.update_traces(textinfo='percent+label')
                 fig_pie.update_layout(title="Distribusi Nilai (Persentase)")
-                st.plotly_chart(fig_pie, use_container_width=True)
+                show_chart(fig_pie, 'distribusi_pie')
     
     # Tab 2: Perbandingan dengan Repayment Status
-    with tab2:
+    with tab2, recorder.section('tab_perbandingan'):
         st.markdown(f'<p class="sub-header">{selected_column} vs Repayment Status</p>', unsafe_allow_html=True)
         
         # Pastikan kolom repayment status ada dalam dataset
         if 'farmer_repayment_status' in filtered_df.columns:
             # Dapatkan nilai unik repayment status
-            repayment_values = filtered_df['farmer_repayment_status'].dropna().unique()
+            repayment_values = filtered_df['farmer_repayment_status'].dropna().unique().tolist()
             
             if data_type == "Numerik":
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     # Boxplot untuk numerik berdasarkan repayment status
-                    fig_box = px.box(filtered_df, x='farmer_repayment_status', y=selected_column, 
-                                 color='farmer_repayment_status', 
-                                 color_discrete_sequence=[COLOR_GREEN, COLOR_ORANGE])
-                    fig_box.update_layout(title="Box Plot berdasarkan Repayment Status")
-                    st.plotly_chart(fig_box, use_container_width=True)
+                    fig_box = box_figure(box_data(filtered_df, selected_column, 'farmer_repayment_status'),
+                                         [COLOR_GREEN, COLOR_ORANGE], selected_column,
+                                         'farmer_repayment_status',
+                                         title="Box Plot berdasarkan Repayment Status")
+                    show_chart(fig_box, 'repayment_box')
                 
                 with col2:
                     # Violin plot
-                    fig_violin = px.violin(filtered_df, x='farmer_repayment_status', y=selected_column, 
-                                      color='farmer_repayment_status', box=True, 
-                                      color_discrete_sequence=[COLOR_GREEN, COLOR_ORANGE])
-                    fig_violin.update_layout(title="Violin Plot berdasarkan Repayment Status")
-                    st.plotly_chart(fig_violin, use_container_width=True)
+                    fig_violin = violin_figure(violin_data(filtered_df, selected_column, 'farmer_repayment_status'),
+                                               [COLOR_GREEN, COLOR_ORANGE], selected_column,
+                                               'farmer_repayment_status',
+                                               title="Violin Plot berdasarkan Repayment Status")
+                    show_chart(fig_violin, 'repayment_violin')
                 
                 # Histogram dengan overlay untuk setiap repayment status
-                fig_hist = px.histogram(filtered_df, x=selected_column, 
-                                     color='farmer_repayment_status',
-                                     nbins=30,
-                                     opacity=0.7,
-                                     color_discrete_sequence=[COLOR_GREEN, COLOR_ORANGE])
-                fig_hist.update_layout(title="Histogram berdasarkan Repayment Status")
-                st.plotly_chart(fig_hist, use_container_width=True)
+                fig_hist = histogram_figure(histogram_data(filtered_df, selected_column, nbins=30,
+                                                           group_column='farmer_repayment_status'),
+                                            [COLOR_GREEN, COLOR_ORANGE],
+                                            title="Histogram berdasarkan Repayment Status",
+                                            opacity=0.7)
+                show_chart(fig_hist, 'repayment_histogram')
                 
                 # Statistik deskriptif per repayment status
                 st.subheader("Statistik berdasarkan Repayment Status")
-                desc_stats = filtered_df.groupby('farmer_repayment_status')[selected_column].describe().reset_index()
+                desc_stats = cross_filter.describe(selected_column, by_group=True).reset_index()
                 st.dataframe(desc_stats, use_container_width=True)
                 
             else:
+                # Tabel kontingensi dihitung sekali, semua normalisasi diturunkan darinya
+                if selected_column in array_cols:
+                    contingency = array_contingency_table(df, selected_column, 'farmer_repayment_status',
+                                                          filter_index.row_ids(selection))
+                else:
+                    contingency = contingency_table(df, selected_column, 'farmer_repayment_status',
+                                                    top_k=TOP_K, selection=selection)
+                
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     # Hitung distribusi kolom kategorikal untuk setiap nilai repayment status
-                    cross_tab_pct = pd.crosstab(filtered_df[selected_column], filtered_df['farmer_repayment_status'], 
-                                             normalize='index') * 100
-                    cross_tab_pct = cross_tab_pct.reset_index()
+                    cross_tab_pct = contingency['row_percentage'].reset_index()
                     
                     # Tampilkan sebagai tabel
                     st.subheader("Distribusi (%) berdasarkan Repayment Status")
@@ -318,12 +416,11 @@ if df is not None:
                         title="Distribusi (%) berdasarkan Repayment Status"
                     )
                     
-                    st.plotly_chart(fig_stacked, use_container_width=True)
+                    show_chart(fig_stacked, 'repayment_stacked')
                 
                 with col2:
                     # Hitung jumlah absolut
-                    cross_tab_abs = pd.crosstab(filtered_df[selected_column], filtered_df['farmer_repayment_status'])
-                    cross_tab_abs = cross_tab_abs.reset_index()
+                    cross_tab_abs = contingency['absolute'].reset_index()
                     
                     # Tampilkan sebagai tabel
                     st.subheader("Jumlah Absolut berdasarkan Repayment Status")
@@ -349,11 +446,11 @@ if df is not None:
                         title="Jumlah Absolut berdasarkan Repayment Status"
                     )
                     
-                    st.plotly_chart(fig_grouped, use_container_width=True)
+                    show_chart(fig_grouped, 'repayment_grouped')
                 
                 # Heatmap untuk melihat korelasi
                 # Modifikasi data untuk heatmap
-                heat_data = pd.crosstab(filtered_df[selected_column], filtered_df['farmer_repayment_status'], normalize='all') * 100
+                heat_data = contingency['total_percentage']
                 
                 # Buat heatmap
                 fig_heat = px.imshow(heat_data,
@@ -371,35 +468,102 @@ if df is not None:
                 # Tambahkan nilai sebagai anotasi
                 fig_heat.update_traces(text=heat_data.values.round(1), texttemplate="%{text}%")
                 
-                st.plotly_chart(fig_heat, use_container_width=True)
+                show_chart(fig_heat, 'repayment_heatmap')
         else:
             st.error("Kolom 'farmer_repayment_status' tidak ditemukan dalam dataset")
     
     # Tab 3: Data Mentah
-    with tab3:
+    with tab3, recorder.section('tab_data_mentah'):
         st.markdown('<p class="sub-header">Data Mentah</p>', unsafe_allow_html=True)
         
         # Tampilkan filter kolom
         cols_to_show = st.multiselect(
             "Pilih kolom yang akan ditampilkan",
-            options=filtered_df.columns.tolist(),
+            options=df.columns.tolist(),
             default=[selected_column, 'farmer_repayment_status', 'farmer_credit_score']
         )
         
         if not cols_to_show:
-            cols_to_show = filtered_df.columns.tolist()
+            cols_to_show = df.columns.tolist()
+        
+        # Kontrol halaman dan pengurutan (diproses di server)
+        total_rows = filter_index.count(selection)
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            page_size = st.selectbox("Baris per halaman", [25, 50, 100, 500], index=1)
+        page_count = max(1, -(-total_rows // page_size))
+        with col2:
+            page_number = st.number_input("Halaman", min_value=1, max_value=page_count, value=1, step=1)
+        with col3:
+            sort_choice = st.selectbox("Urutkan berdasarkan", ["(tanpa urutan)"] + cols_to_show)
+        with col4:
+            sort_ascending = st.radio("Arah urutan", ["Naik", "Turun"], horizontal=True) == "Naik"
         
-        # Tampilkan data mentah dengan filter
-        st.dataframe(filtered_df[cols_to_show], use_container_width=True)
+        # Tampilkan data mentah dengan filter: hanya baris di halaman ini yang dibentuk
+        offset = (int(page_number) - 1) * page_size
+        sort_column = None if sort_choice == "(tanpa urutan)" else sort_choice
+        page_df = filter_index.page(selection, cols_to_show, offset, page_size, sort_column, sort_ascending)
+        st.dataframe(page_df, use_container_width=True)
+        st.caption(f"Menampilkan baris {min(offset + 1, total_rows):,}-{offset + len(page_df):,} "
+                   f"dari {total_rows:,} (halaman {int(page_number)} dari {page_count})")
         
-        # Opsi download data
-        csv = filtered_df[cols_to_show].to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="Download data sebagai CSV",
-            data=csv,
-            file_name=f"credit_score_data_{selected_column}.csv",
-            mime="text/csv",
+        # Opsi download data: file hanya dibuat setelah tombol "Siapkan" ditekan di sesi ini,
+        # ditulis per potongan ke disk, lalu dipakai ulang per (filter, kolom, format) tanpa
+        # menyerialisasi ulang. Rerun hanya membandingkan status filter yang dicatat saat
+        # tombol ditekan; kunci ekspor (hash seleksi) tidak dihitung ulang.
+        export_format = st.selectbox(
+            "Format unduhan",
+            available_formats(),
+            format_func=lambda fmt: EXPORT_FORMATS[fmt]['label']
         )
+        export_state = (dataset_fingerprint(df), cross_filter.filters, tuple(cols_to_show), export_format)
+        if st.button("Siapkan file unduhan"):
+            with st.spinner("Menyiapkan file..."):
+                st.session_state['export'] = {
+                    'state': export_state,
+                    'path': get_export(filter_index, selection, cols_to_show, export_format),
+                }
+        
+        prepared = st.session_state.get('export')
+        if prepared is not None and prepared['state'] == export_state and os.path.exists(prepared['path']):
+            with open(prepared['path'], 'rb') as export_file:
+                st.download_button(
+                    label=f"Download data sebagai {EXPORT_FORMATS[export_format]['label']}",
+                    data=export_file,
+                    file_name=f"credit_score_data_{selected_column}.{EXPORT_FORMATS[export_format]['extension']}",
+                    mime=EXPORT_FORMATS[export_format]['mime'],
+                )
+
+    # Tab 4: Asosiasi Antar Kolom (mengikuti filter aktif)
+    with tab4, recorder.section('tab_asosiasi'):
+        st.markdown('<p class="sub-header">Asosiasi Antar Kolom</p>', unsafe_allow_html=True)
+        st.caption("Numerik-numerik: korelasi Pearson/Spearman (-1 s.d. 1). Kategorikal-kategorikal: Cramér's V. "
+                   "Kategorikal-numerik: correlation ratio (eta). Keduanya 0 s.d. 1. "
+                   "Kolom array (berisi daftar nilai) tidak diikutkan.")
+        
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            numeric_method = st.radio("Korelasi numerik", ["pearson", "spearman"], format_func=str.capitalize)
+        with col2:
+            available_association_cols = association_columns(df)
+            association_cols = st.multiselect("Kolom", available_association_cols,
+                                              default=available_association_cols)
+        
+        if len(association_cols) >= 2:
+            # Di-cache per (dataset, seleksi filter, kolom, metode): rerun tanpa perubahan langsung tampil
+            association = association_matrix(filter_index, selection, association_cols, numeric_method)
+            show_chart(association_heatmap(association, title=f"Matriks Asosiasi ({association['rows']:,} baris)"),
+                       'asosiasi_heatmap')
+            if association['skipped']:
+                st.caption(f"Kolom dengan terlalu banyak kategori dilewati: {', '.join(association['skipped'])}")
+            
+            st.markdown("**Pasangan dengan asosiasi terkuat**")
+            st.dataframe(association['pairs'].head(20).round({'value': 3}), use_container_width=True,
+                         hide_index=True)
+            st.download_button("Unduh semua pasangan (CSV)", association['pairs'].to_csv(index=False),
+                               file_name="asosiasi_kolom.csv", mime="text/csv")
+        else:
+            st.info("Pilih minimal dua kolom.")
 
     # Footer dengan informasi tambahan
     st.markdown("---")
@@ -419,8 +583,15 @@ if df is not None:
         2. Tab 'Distribusi Kolom' menampilkan statistik dan visualisasi dari satu kolom
         3. Tab 'Perbandingan dengan Repayment Status' menampilkan hubungan antara kolom dengan status pembayaran
         4. Tab 'Data Mentah' memungkinkan Anda melihat dan mengunduh data mentah
+        5. Tab 'Asosiasi Antar Kolom' menampilkan kekuatan hubungan antar semua pasangan kolom
         """)
     
 
 else:
     st.error("Gagal memuat data. Silakan periksa file CSV Anda.")
+
+# Metrik performa rerun ini: tulis ke folder metrik dan tampilkan panel jika diminta
+recorder.finish()
+recorder.write()
+if show_performance:
+    performance_panel(recorder)
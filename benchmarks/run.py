@@ -0,0 +1,199 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.synthetic import generate_dataset
+from credit_core.column_profile import get_categorical_stats, get_numeric_stats
+from credit_core.column_types import identify_column_types
+from credit_core.contingency import contingency_table
+from credit_core.cross_filter import CrossFilter
+from credit_core.data_loader import read_dataset
+from credit_core.dataset_cache import load_cached
+from credit_core.filter_index import get_filter_index
+from credit_core.fingerprint import clear_caches
+from credit_core.group_stats import get_comparison_with_repayment
+from credit_core.grouping import REPAYMENT_COLUMN
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BENCHMARK_DIR, 'data')
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baselines.json')
+
+DEFAULT_SIZES = [100000, 1000000]
+
+# Langkah dianggap regresi jika lebih lambat dari baseline melebihi porsi ini
+DEFAULT_TOLERANCE = 0.5
+
+# Langkah yang lebih cepat dari ini tidak diperiksa (noise timer terlalu besar)
+MIN_CHECKED_SECONDS = 0.05
+
+
+# Kosongkan semua cache turunan yang terdaftar (dan memo hash kategori) sebelum
+# setiap langkah agar waktu yang diukur adalah kondisi dingin
+def _clear_caches():
+    clear_caches()
+    gc.collect()
+
+
+# Fungsi untuk mengukur waktu (tercepat dari beberapa ulangan) dan puncak alokasi memori
+# satu langkah. Memori diukur di putaran terpisah karena tracemalloc memperlambat eksekusi.
+def measure(step, repeat=1):
+    timings = []
+    for _ in range(repeat):
+        _clear_caches()
+        start = time.perf_counter()
+        step()
+        timings.append(time.perf_counter() - start)
+
+    _clear_caches()
+    tracemalloc.start()
+    step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'seconds': round(min(timings), 4), 'peak_mb': round(peak / 2 ** 20, 2)}
+
+
+# Filter seperti di app.py: rentang numerik, nilai kategorikal, lalu cross-filter dan ambil baris
+def _app_filters(df):
+    index = get_filter_index(df)
+    low, high = index.value_range('farmer_credit_score')
+    middle = (low + high) / 2
+    values = df['farmer_seeds_type'].dropna().unique().tolist()[:2]
+
+    cross_filter = CrossFilter(index, REPAYMENT_COLUMN, ['farmer_credit_score'])
+    cross_filter.set_range('farmer_credit_score', low, middle)
+    cross_filter.set_values('farmer_seeds_type', values)
+    cross_filter.set_range('farmer_age', *index.value_range('farmer_age'))
+    cross_filter.group_summary()
+    index.take(cross_filter.selection(), ['farmer_credit_score', REPAYMENT_COLUMN])
+
+
+# Fungsi untuk menyusun daftar langkah yang diukur untuk satu file dataset
+def benchmark_steps(path):
+    df = load_cached(path)
+    types = identify_column_types(df)
+    numeric = [col for col, type_ in types.items() if type_ == 'numeric']
+    categorical = [col for col, type_ in types.items() if type_ in ('categorical', 'array')]
+    compared = [col for col in numeric + categorical if col != REPAYMENT_COLUMN]
+
+    return {
+        'load_csv': lambda: read_dataset(path),
+        'load_cached': lambda: load_cached(path),
+        'identify_column_types': lambda: identify_column_types(df),
+        'numeric_stats': lambda: [get_numeric_stats(df, col) for col in numeric],
+        'categorical_stats': lambda: [get_categorical_stats(df, col) for col in categorical],
+        'comparison_with_repayment': lambda: [
+            get_comparison_with_repayment(df, col, types[col] if types[col] == 'numeric' else 'categorical')
+            for col in compared
+        ],
+        'app_filters': lambda: _app_filters(df),
+        'crosstabs': lambda: [contingency_table(df, col, REPAYMENT_COLUMN)
+                              for col in categorical if col != REPAYMENT_COLUMN],
+    }
+
+
+def dataset_path(rows):
+    path = os.path.join(DATA_DIR, f"synthetic_{rows}.csv")
+    if not os.path.exists(path):
+        print(f"Membuat dataset sintetis {rows:,} baris...", flush=True)
+        generate_dataset(rows, path)
+    return path
+
+
+def run(sizes, repeat=1, steps=None):
+    results = {}
+    for rows in sizes:
+        path = dataset_path(rows)
+        # Siapkan cache Parquet agar load_cached mengukur jalur cache, bukan pembuatan cache
+        load_cached(path)
+        results[str(rows)] = {}
+        for name, step in benchmark_steps(path).items():
+            if steps and name not in steps:
+                continue
+            results[str(rows)][name] = measure(step, repeat)
+            print(f"{rows:>10,}  {name:<28} {results[str(rows)][name]['seconds']:>9.3f} s"
+                  f"  {results[str(rows)][name]['peak_mb']:>9.1f} MB", flush=True)
+    return results
+
+
+# Fungsi untuk membandingkan hasil dengan baseline tersimpan; mengembalikan daftar regresi
+def compare(results, baselines, tolerance=DEFAULT_TOLERANCE):
+    regressions = []
+    for rows, steps in results.items():
+        for name, result in steps.items():
+            baseline = baselines.get(rows, {}).get(name)
+            if baseline is None or baseline['seconds'] < MIN_CHECKED_SECONDS:
+                continue
+            ratio = result['seconds'] / baseline['seconds']
+            if ratio > 1 + tolerance:
+                regressions.append(f"{rows} baris / {name}: {result['seconds']:.3f} s "
+                                   f"(baseline {baseline['seconds']:.3f} s, x{ratio:.2f})")
+    return regressions
+
+
+def load_baselines(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get('results', {})
+
+
+def save_baselines(results, path=BASELINE_PATH):
+    baselines = load_baselines(path)
+    for rows, steps in results.items():
+        baselines.setdefault(rows, {}).update(steps)
+
+    with open(path, 'w') as f:
+        json.dump({
+            'machine': {
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+            },
+            'results': baselines,
+        }, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pemuatan, profil, dan filter dashboard credit score.")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Ukuran dataset sintetis, misalnya 100000 1000000 10000000")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah ulangan per langkah (diambil yang tercepat)")
+    parser.add_argument('--steps', nargs='+', help="Hanya jalankan langkah tertentu")
+    parser.add_argument('--save-baseline', action='store_true', help="Simpan hasil sebagai baseline")
+    parser.add_argument('--check', action='store_true', help="Keluar dengan kode 1 jika ada regresi")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Batas perlambatan relatif terhadap baseline (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--output', help="Simpan hasil mentah ke file JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.rows, args.repeat, args.steps)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        save_baselines(results)
+        print(f"Baseline disimpan ke {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, load_baselines(), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESI: {regression}")
+    if not regressions:
+        print("Tidak ada regresi terhadap baseline.")
+    return 1 if regressions and args.check else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Dataset contoh yang skemanya ditiru generator
+SEED_DATASET = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'credit_score_dataset_new.csv')
+
+# Jumlah baris yang dibuat dan ditulis per langkah
+GENERATE_CHUNK_ROWS = 500000
+
+# Kolom numerik dengan rasio nilai unik di atas ini dianggap kontinu dan diberi noise,
+# sehingga jumlah nilai unik ikut tumbuh bersama jumlah baris
+CONTINUOUS_UNIQUE_RATIO = 0.25
+
+# Simpangan noise log-normal untuk kolom numerik kontinu
+CONTINUOUS_NOISE = 0.05
+
+CODE_COLUMN = 'farmer_code'
+CODE_PREFIX = 'PTN-'
+
+
+def _parse_number(values):
+    return pd.to_numeric(values.str.replace(',', '', regex=False), errors='coerce')
+
+
+def _format_thousands(values):
+    return values.map(lambda value: f"{int(value):,}" if pd.notna(value) else np.nan)
+
+
+# Fungsi untuk mempelajari pola dataset contoh: baris mentah (string apa adanya,
+# termasuk format ribuan dan pola missing), distribusi jumlah pinjaman per petani,
+# dan kolom numerik kontinu yang perlu diberi noise
+def fit_seed(path=SEED_DATASET):
+    seed = pd.read_csv(path, dtype=str)
+
+    repeats = seed[CODE_COLUMN].value_counts().value_counts().sort_index()
+    continuous = []
+    for column in seed.columns:
+        if column == CODE_COLUMN:
+            continue
+        non_null = seed[column].dropna()
+        numbers = _parse_number(non_null)
+        if len(non_null) and numbers.notna().all() and non_null.nunique() / len(non_null) > CONTINUOUS_UNIQUE_RATIO:
+            continuous.append(column)
+
+    return {
+        'rows': seed,
+        'repeat_counts': repeats.index.to_numpy(),
+        'repeat_weights': (repeats / repeats.sum()).to_numpy(),
+        'continuous': continuous,
+    }
+
+
+# Fungsi untuk membuat id petani: setiap petani muncul 1..n kali mengikuti
+# distribusi pinjaman berulang di dataset contoh, lalu urutannya diacak
+def _farmer_ids(model, rows, rng):
+    mean_repeat = float((model['repeat_counts'] * model['repeat_weights']).sum())
+    farmers = int(rows / mean_repeat) + 16
+    counts = rng.choice(model['repeat_counts'], size=farmers, p=model['repeat_weights'])
+    ids = np.repeat(np.arange(1, farmers + 1, dtype=np.int64), counts)[:rows]
+    while len(ids) < rows:
+        ids = np.concatenate([ids, np.arange(farmers + 1, farmers + 1 + rows - len(ids))])
+    rng.shuffle(ids)
+    return ids
+
+
+# Fungsi untuk membuat satu potongan data sintetis dari baris contoh yang diambil ulang
+def _generate_chunk(model, farmer_ids, rng):
+    seed = model['rows']
+    chunk = seed.iloc[rng.integers(0, len(seed), size=len(farmer_ids))].reset_index(drop=True)
+    chunk[CODE_COLUMN] = [f"{CODE_PREFIX}{farmer_id}" for farmer_id in farmer_ids]
+
+    for column in model['continuous']:
+        numbers = _parse_number(chunk[column])
+        noise = np.exp(rng.normal(0.0, CONTINUOUS_NOISE, size=len(chunk)))
+        chunk[column] = _format_thousands((numbers * noise).round())
+
+    return chunk
+
+
+# Fungsi untuk menulis dataset sintetis dengan skema sama seperti dataset contoh.
+# Data dibuat per potongan sehingga 10 juta baris tidak perlu muat di memori.
+def generate_dataset(rows, path, seed=0, seed_path=SEED_DATASET, chunk_rows=GENERATE_CHUNK_ROWS):
+    rng = np.random.default_rng(seed)
+    model = fit_seed(seed_path)
+    farmer_ids = _farmer_ids(model, rows, rng)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', newline='') as f:
+        for start in range(0, rows, chunk_rows):
+            chunk = _generate_chunk(model, farmer_ids[start:start + chunk_rows], rng)
+            chunk.to_csv(f, index=False, header=(start == 0))
+    os.replace(tmp_path, path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat dataset petani sintetis dengan skema dataset contoh.")
+    parser.add_argument('rows', type=int, help="Jumlah baris, misalnya 100000, 1000000, 10000000")
+    parser.add_argument('-o', '--output', help="File CSV output (default: benchmarks/data/synthetic_<rows>.csv)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed generator acak")
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data',
+                                         f"synthetic_{args.rows}.csv")
+    generate_dataset(args.rows, output, seed=args.seed)
+    print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
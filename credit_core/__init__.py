@@ -0,0 +1,3 @@
+# Inti analitik dashboard credit score: pemuatan data, profil kolom, statistik
+# per grup, indeks filter, dan data grafik. Paket ini tidak mengimpor Streamlit,
+# dan Plotly baru dimuat saat figur dibuat, sehingga bisa dipakai di batch job.
@@ -0,0 +1,219 @@
+import numpy as np
+import pandas as pd
+
+from .column_types import identify_column_types
+from .filter_index import selection_digest
+from .fingerprint import BoundedCache, dataset_fingerprint
+
+# Jumlah baris yang diproses per langkah (memori sementara tetap kecil untuk data besar)
+ROW_BLOCK = 262144
+MIN_ROW_BLOCK = 4096
+
+# Batas jumlah sel matriks one-hot per blok (baris x total kategori, float64)
+ONE_HOT_BUDGET = 2 ** 22
+
+# Kolom kategorikal dengan nilai unik lebih banyak dari ini tidak diikutkan
+# (biaya tabel kontingensi tumbuh kuadratik terhadap total kategori)
+MAX_CATEGORIES = 100
+
+NUMERIC_METHODS = ('pearson', 'spearman')
+
+MAX_CACHED_MATRICES = 8
+
+_association_cache = BoundedCache(MAX_CACHED_MATRICES, 'association')
+
+
+# Fungsi untuk memilih kolom yang bisa dihitung asosiasinya. Teks/ID dilewati, begitu
+# juga kolom array: satu baris bisa memuat beberapa elemen, sehingga tidak punya satu
+# kode kategori per baris untuk tabel kontingensi.
+def association_columns(df):
+    column_types = identify_column_types(df)
+    return [col for col, type_ in column_types.items() if type_ in ('numeric', 'categorical')]
+
+
+# Fungsi untuk matriks nilai numerik (NaN = kosong), dipusatkan agar penjumlahan stabil
+def _numeric_matrix(df, columns, rows, method):
+    values = np.empty((len(rows), len(columns)), dtype=np.float64)
+    for j, column in enumerate(columns):
+        values[:, j] = pd.to_numeric(df[column].iloc[rows], errors='coerce').to_numpy(dtype=np.float64,
+                                                                                         na_value=np.nan)
+    if method == 'spearman':
+        # Peringkat per kolom (rata-rata untuk nilai sama); nilai kosong tetap kosong.
+        # Peringkat tidak dihitung ulang per pasangan, jadi hasil bisa sedikit berbeda
+        # dari pandas pada kolom yang punya nilai kosong.
+        values = pd.DataFrame(values).rank().to_numpy()
+    with np.errstate(invalid='ignore'):
+        values -= np.nan_to_num(np.nanmean(values, axis=0)) if len(rows) else 0.0
+    return values
+
+
+# Fungsi untuk kode kategori semua kolom kategorikal (-1 = kosong)
+def _category_codes(df, columns, rows):
+    codes, sizes = [], []
+    for column in columns:
+        values = df[column].iloc[rows]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            column_codes, labels = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            column_codes, labels = pd.factorize(values)
+        codes.append(column_codes.astype(np.int64))
+        sizes.append(len(labels))
+    return codes, sizes
+
+
+# Fungsi untuk mengumpulkan semua jumlah yang dibutuhkan dalam satu lintasan per blok baris.
+# Numerik: jumlah observasi, sum, sum kuadrat, dan hasil kali silang per pasangan
+# (observasi lengkap per pasangan) lewat perkalian matriks p x p. Kategorikal: matriks
+# one-hot H semua kolom digabung, sehingga H^T H berisi tabel kontingensi semua
+# pasangan sekaligus dan H^T [ada, x, x^2] berisi jumlah per kategori untuk semua
+# kolom numerik.
+def _accumulate(values, codes, sizes):
+    p = values.shape[1]
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    width = int(offsets[-1])
+    block_rows = int(np.clip(ONE_HOT_BUDGET // max(width, 1), MIN_ROW_BLOCK, ROW_BLOCK))
+
+    sums = {
+        'n': np.zeros((p, p)),
+        'sums': np.zeros((p, p)),
+        'sumsq': np.zeros((p, p)),
+        'cross': np.zeros((p, p)),
+        'pairs': np.zeros((width, width)),
+        'groups': np.zeros((width, 3 * p)),
+    }
+    for start in range(0, len(values), block_rows):
+        block = values[start:start + block_rows]
+        present = (~np.isnan(block)).astype(np.float64)
+        filled = np.nan_to_num(block)
+        sums['n'] += present.T @ present
+        sums['sums'] += filled.T @ present
+        sums['sumsq'] += (filled ** 2).T @ present
+        sums['cross'] += filled.T @ filled
+
+        if width:
+            one_hot = np.zeros((len(block), width))
+            for column_codes, offset in zip(codes, offsets):
+                block_codes = column_codes[start:start + block_rows]
+                valid = np.flatnonzero(block_codes >= 0)
+                one_hot[valid, block_codes[valid] + offset] = 1.0
+            sums['pairs'] += one_hot.T @ one_hot
+            sums['groups'] += one_hot.T @ np.hstack([present, filled, filled ** 2])
+    sums['offsets'] = offsets
+    return sums
+
+
+def _correlation(sums):
+    n, total, sumsq, cross = sums['n'], sums['sums'], sums['sumsq'], sums['cross']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        covariance = n * cross - total * total.T
+        variance = (n * sumsq - total ** 2) * (n * sumsq - total ** 2).T
+        return covariance / np.sqrt(variance)
+
+
+# Fungsi untuk Cramér's V semua pasangan kategorikal dari blok-blok tabel kontingensi
+def _cramers_v(sums):
+    offsets = sums['offsets']
+    k = len(offsets) - 1
+    result = np.eye(k)
+    for i in range(k):
+        for j in range(i + 1, k):
+            table = sums['pairs'][offsets[i]:offsets[i + 1], offsets[j]:offsets[j + 1]]
+            result[i, j] = result[j, i] = _cramers_v_from_table(table)
+    return result
+
+
+def _cramers_v_from_table(table):
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    total = table.sum()
+    if total == 0 or min(table.shape) < 2:
+        return np.nan
+    row_totals = table.sum(axis=1, keepdims=True)
+    col_totals = table.sum(axis=0, keepdims=True)
+    # chi2 = n * (sum(O^2 / (baris * kolom)) - 1)
+    chi2 = total * ((table ** 2 / (row_totals * col_totals)).sum() - 1)
+    return float(np.sqrt(max(chi2, 0.0) / total / (min(table.shape) - 1)))
+
+
+# Fungsi untuk correlation ratio (eta) setiap pasangan kategorikal-numerik:
+# akar dari porsi variansi numerik yang dijelaskan oleh kategori
+def _correlation_ratio(sums, p):
+    offsets = sums['offsets']
+    result = np.full((len(offsets) - 1, p), np.nan)
+    for i in range(len(offsets) - 1):
+        groups = sums['groups'][offsets[i]:offsets[i + 1]]
+        count, total, sumsq = groups[:, :p], groups[:, p:2 * p], groups[:, 2 * p:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            within = (sumsq - np.where(count > 0, total ** 2 / count, 0.0)).sum(axis=0)
+            overall = sumsq.sum(axis=0) - total.sum(axis=0) ** 2 / count.sum(axis=0)
+            result[i] = np.sqrt(np.clip(1 - within / overall, 0.0, 1.0))
+    return result
+
+
+# Fungsi untuk matriks asosiasi semua pasangan kolom pada baris terpilih:
+# Pearson/Spearman untuk numerik-numerik, Cramér's V untuk kategorikal-kategorikal,
+# dan correlation ratio untuk pasangan campuran. Di-cache per (sidik jari data,
+# isi seleksi filter, kolom, metode numerik).
+def association_matrix(index, selection, columns=None, method='pearson'):
+    if method not in NUMERIC_METHODS:
+        raise ValueError(f"Metode numerik tidak dikenal: {method}")
+    df = index.df
+    columns = list(dict.fromkeys(columns)) if columns is not None else association_columns(df)
+    key = (dataset_fingerprint(df), selection_digest(selection), tuple(columns), method)
+    result = _association_cache.get(key)
+    if result is not None:
+        return result
+
+    column_types = identify_column_types(df)
+    rows = index.row_ids(selection)
+    numeric = [col for col in columns if column_types.get(col) == 'numeric']
+    # Kolom array tidak diikutkan (lihat association_columns)
+    categorical = [col for col in columns if column_types.get(col) not in ('numeric', 'array')]
+
+    codes, sizes = _category_codes(df, categorical, rows)
+    too_many = [col for col, size in zip(categorical, sizes) if size > MAX_CATEGORIES]
+    if too_many:
+        keep = [size <= MAX_CATEGORIES for size in sizes]
+        categorical = [col for col, kept in zip(categorical, keep) if kept]
+        codes = [column_codes for column_codes, kept in zip(codes, keep) if kept]
+        sizes = [size for size, kept in zip(sizes, keep) if kept]
+
+    values = _numeric_matrix(df, numeric, rows, method)
+    order = numeric + categorical
+    matrix = pd.DataFrame(np.nan, index=order, columns=order)
+    measure = pd.DataFrame('', index=order, columns=order)
+
+    sums = _accumulate(values, codes, sizes)
+    if numeric:
+        matrix.loc[numeric, numeric] = _correlation(sums)
+        measure.loc[numeric, numeric] = method
+    if categorical:
+        matrix.loc[categorical, categorical] = _cramers_v(sums)
+        measure.loc[categorical, categorical] = 'cramers_v'
+    if numeric and categorical:
+        ratio = _correlation_ratio(sums, len(numeric))
+        matrix.loc[categorical, numeric] = ratio
+        matrix.loc[numeric, categorical] = ratio.T
+        measure.loc[categorical, numeric] = 'correlation_ratio'
+        measure.loc[numeric, categorical] = 'correlation_ratio'
+    for column in order:
+        matrix.loc[column, column] = 1.0
+
+    # Daftar pasangan (tanpa diagonal dan duplikat), diurutkan dari asosiasi terkuat
+    upper = np.triu_indices(len(order), k=1)
+    pairs = pd.DataFrame({
+        'column_a': np.asarray(order)[upper[0]],
+        'column_b': np.asarray(order)[upper[1]],
+        'measure': measure.to_numpy()[upper],
+        'value': matrix.to_numpy()[upper],
+    })
+    pairs = pairs.reindex(pairs['value'].abs().sort_values(ascending=False, kind='stable').index)
+
+    result = {
+        'matrix': matrix,
+        'measure': measure,
+        'pairs': pairs.reset_index(drop=True),
+        'rows': int(len(rows)),
+        'method': method,
+        'skipped': too_many,
+    }
+    return _association_cache.set(key, result)
@@ -0,0 +1,88 @@
+import numpy as np
+
+from .density import grouped_density
+from .grouping import group_slices
+from .quantile_sketch import EXACT_LIMIT, get_sketches
+
+# Jumlah maksimum titik outlier yang dikirim ke grafik box plot per grup
+MAX_OUTLIERS = 200
+
+# Jumlah titik grid kurva densitas violin
+VIOLIN_POINTS = 200
+
+
+# Fungsi untuk menghitung jumlah per bin histogram (bin sama untuk semua grup)
+def histogram_data(df, column, nbins=30, group_column=None):
+    slices = group_slices(df, column, group_column)
+    all_values = np.concatenate([values for _, values in slices]) if slices else np.array([])
+    edges = np.histogram_bin_edges(all_values, bins=nbins)
+
+    return {
+        'column': column,
+        'edges': edges,
+        'groups': [label for label, _ in slices],
+        'counts': [np.histogram(values, bins=edges)[0] for _, values in slices],
+    }
+
+
+# Fungsi untuk menghitung statistik box plot satu grup (kuartil, whisker 1.5 IQR, sampel outlier)
+def _box_stats(name, values, max_outliers, sketch=None):
+    if len(values) == 0:
+        return None
+
+    if sketch is not None:
+        q1, median, q3 = sketch.quantile([0.25, 0.5, 0.75])
+    else:
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = np.sort(values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)])
+
+    # Batasi outlier dengan sampel berjarak tetap agar nilai ekstrem tetap terlihat
+    if len(outliers) > max_outliers:
+        outliers = outliers[np.linspace(0, len(outliers) - 1, max_outliers).astype(np.int64)]
+
+    return {
+        'name': name,
+        'count': int(len(values)),
+        'q1': float(q1),
+        'median': float(median),
+        'q3': float(q3),
+        'mean': float(values.mean()),
+        'lowerfence': float(inside.min()),
+        'upperfence': float(inside.max()),
+        'outliers': outliers,
+    }
+
+
+# Fungsi untuk mengambil sketch kuantil grup jika datanya besar (kecil: eksak)
+def _group_sketch(df, column, group_column, label, values):
+    if len(values) <= EXACT_LIMIT:
+        return None
+    return get_sketches(df, column, group_column)['groups'][label]
+
+
+# Fungsi untuk menghitung statistik box plot per grup
+def box_data(df, column, group_column=None, max_outliers=MAX_OUTLIERS):
+    boxes = [_box_stats(label, values, max_outliers, _group_sketch(df, column, group_column, label, values))
+             for label, values in group_slices(df, column, group_column)]
+    return [box for box in boxes if box is not None]
+
+
+# Fungsi untuk menghitung data violin plot per grup: kurva densitas plus statistik box
+def violin_data(df, column, group_column=None, points=VIOLIN_POINTS):
+    densities = grouped_density(df, column, group_column, points)
+    slices = dict(group_slices(df, column, group_column))
+
+    violins = []
+    for label, density, (low, high) in zip(densities['groups'], densities['densities'], densities['ranges']):
+        # Kurva violin dipotong di rentang nilai grupnya sendiri
+        inside = (densities['grid'] >= low) & (densities['grid'] <= high)
+        if not inside.any():
+            inside = density == density.max()
+
+        values = slices[label]
+        violin = _box_stats(label, values, 0, _group_sketch(df, column, group_column, label, values))
+        violin.update({'grid': densities['grid'][inside], 'density': density[inside]})
+        violins.append(violin)
+    return violins
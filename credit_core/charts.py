@@ -0,0 +1,179 @@
+import numpy as np
+
+
+# Plotly dimuat saat figur pertama dibuat, bukan saat modul diimpor
+def _graph_objects():
+    import plotly.graph_objects as go
+    return go
+
+
+# Fungsi untuk memilih warna per grup dari daftar (berulang) atau peta warna
+def _color(colors, i, name, default='#8884d8'):
+    if isinstance(colors, dict):
+        return colors.get(name, default)
+    return colors[i % len(colors)]
+
+
+# Fungsi untuk membuat histogram dari jumlah per bin yang sudah dihitung di server
+def histogram_figure(hist, colors, title=None, opacity=None):
+    edges = hist['edges']
+    centers = (edges[:-1] + edges[1:]) / 2
+    widths = np.diff(edges)
+    grouped = len(hist['groups']) > 1
+
+    go = _graph_objects()
+    fig = go.Figure()
+    for i, (name, counts) in enumerate(zip(hist['groups'], hist['counts'])):
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=counts,
+            width=widths,
+            name=str(name),
+            showlegend=grouped,
+            opacity=opacity,
+            marker_color=_color(colors, i, name)
+        ))
+
+    fig.update_layout(
+        barmode='overlay' if grouped else 'relative',
+        bargap=0.1,
+        title=title,
+        xaxis_title=hist['column'],
+        yaxis_title='count',
+        legend_title=None
+    )
+    return fig
+
+
+# Fungsi untuk membuat box plot dari statistik kuartil dan sampel outlier
+def box_figure(boxes, colors, column, group_column=None, title=None):
+    go = _graph_objects()
+    fig = go.Figure()
+    for i, box in enumerate(boxes):
+        color = _color(colors, i, box['name'])
+        x = [str(box['name'])] if group_column else None
+
+        fig.add_trace(go.Box(
+            x=x,
+            q1=[box['q1']],
+            median=[box['median']],
+            q3=[box['q3']],
+            mean=[box['mean']],
+            lowerfence=[box['lowerfence']],
+            upperfence=[box['upperfence']],
+            name=str(box['name']),
+            marker_color=color,
+            showlegend=bool(group_column)
+        ))
+
+        if len(box['outliers']):
+            fig.add_trace(go.Scatter(
+                x=[str(box['name'])] * len(box['outliers']),
+                y=box['outliers'],
+                mode='markers',
+                marker=dict(color=color, size=4),
+                name=f"{box['name']} outlier",
+                showlegend=False
+            ))
+
+    fig.update_layout(title=title, xaxis_title=group_column, yaxis_title=column)
+    return fig
+
+
+# Fungsi untuk membuat violin plot dari kurva densitas yang sudah dihitung
+def violin_figure(violins, colors, column, group_column=None, title=None):
+    go = _graph_objects()
+    fig = go.Figure()
+    for i, violin in enumerate(violins):
+        color = _color(colors, i, violin['name'])
+        peak = violin['density'].max()
+        half_width = 0.4 * violin['density'] / peak if peak > 0 else violin['density']
+
+        # Bentuk violin: kurva densitas dicerminkan di sekitar posisi grup
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([i - half_width, (i + half_width)[::-1]]),
+            y=np.concatenate([violin['grid'], violin['grid'][::-1]]),
+            fill='toself',
+            mode='lines',
+            line=dict(color=color),
+            name=str(violin['name'])
+        ))
+
+        # Box kecil di tengah violin (kuartil dan median)
+        fig.add_trace(go.Scatter(
+            x=[i, i],
+            y=[violin['q1'], violin['q3']],
+            mode='lines',
+            line=dict(color='black', width=6),
+            showlegend=False,
+            hoverinfo='y'
+        ))
+        fig.add_trace(go.Scatter(
+            x=[i],
+            y=[violin['median']],
+            mode='markers',
+            marker=dict(color='white', size=6),
+            showlegend=False,
+            hoverinfo='y'
+        ))
+
+    fig.update_layout(
+        title=title,
+        xaxis=dict(
+            title=group_column,
+            tickmode='array',
+            tickvals=list(range(len(violins))),
+            ticktext=[str(violin['name']) for violin in violins]
+        ),
+        yaxis_title=column
+    )
+    return fig
+
+
+# Fungsi untuk membuat grafik KDE dari kurva densitas yang sudah dihitung di server
+def density_figure(densities, colors, title=None):
+    grouped = len(densities['groups']) > 1
+
+    go = _graph_objects()
+    fig = go.Figure()
+    for i, (name, density) in enumerate(zip(densities['groups'], densities['densities'])):
+        fig.add_trace(go.Scatter(
+            x=densities['grid'],
+            y=density,
+            mode='lines',
+            fill='tozeroy',
+            line=dict(color=_color(colors, i, name)),
+            name=str(name),
+            showlegend=grouped
+        ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title=densities['column'],
+        yaxis_title='density'
+    )
+    return fig
+
+
+# Fungsi untuk membuat heatmap matriks asosiasi; jenis ukuran tiap sel ditampilkan saat hover
+def association_heatmap(association, title=None):
+    matrix = association['matrix']
+    labels = list(matrix.columns)
+
+    go = _graph_objects()
+    fig = go.Figure(go.Heatmap(
+        z=matrix.to_numpy().round(3),
+        x=labels,
+        y=labels,
+        customdata=association['measure'].to_numpy(),
+        zmin=-1,
+        zmax=1,
+        colorscale='RdBu',
+        hovertemplate='%{y} - %{x}<br>%{customdata}: %{z}<extra></extra>'
+    ))
+    fig.update_layout(
+        title=title,
+        height=max(500, 22 * len(labels)),
+        yaxis=dict(autorange='reversed')
+    )
+    return fig
@@ -0,0 +1,166 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from .column_types import identify_column_types
+from .filter_index import selection_rows
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .grouping import REPAYMENT_COLUMN
+from .heavy_hitters import OTHER_LABEL, TOP_K, get_top_values
+from .multi_hot import get_array_stats, get_multi_hot
+from .quantile_sketch import EXACT_LIMIT, get_sketches
+
+# Jumlah bin histogram yang disimpan di profil kolom numerik
+PROFILE_BINS = 5
+
+MAX_CACHED_PROFILES = 8
+
+_profile_cache = BoundedCache(MAX_CACHED_PROFILES, 'profile')
+
+
+# Fungsi untuk mendapatkan statistik kolom kategorikal
+def get_categorical_stats(df, column):
+    value_counts = df[column].value_counts(dropna=False)
+    value_counts = value_counts[value_counts > 0]
+    value_counts.index = value_counts.index.map(lambda x: 'Missing/Null' if pd.isna(x) else str(x))
+
+    total = len(df)
+    stats = []
+    for value, count in value_counts.items():
+        stats.append({
+            'value': value,
+            'count': int(count),
+            'percentage': round((count / total) * 100, 2)
+        })
+
+    return stats
+
+
+# Fungsi untuk mendapatkan statistik kolom numerik
+def get_numeric_stats(df, column):
+    values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+
+    if len(values) == 0:
+        return {
+            'count': 0,
+            'min': float('nan'),
+            'max': float('nan'),
+            'mean': float('nan'),
+            'median': float('nan'),
+            'missing': int(len(df)),
+            'bins': []
+        }
+
+    stats = {
+        'count': int(len(values)),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'mean': float(values.mean()),
+        'median': float(np.median(values)) if len(values) <= EXACT_LIMIT
+        else get_sketches(df, column)['all'].quantile(0.5),
+        'missing': int(len(df) - len(values))
+    }
+
+    # Membuat bins untuk distribusi
+    bin_values, bin_edges = np.histogram(values, bins=PROFILE_BINS)
+
+    stats['bins'] = [{
+        'min': float(bin_edges[i]),
+        'max': float(bin_edges[i+1]),
+        'count': int(bin_values[i])
+    } for i in range(PROFILE_BINS)]
+
+    return stats
+
+
+# Fungsi untuk tabel distribusi nilai satu kolom (jumlah dan persentase per nilai).
+# Dengan top_k, hanya k nilai terbanyak yang ditampilkan dan sisanya digabung
+# menjadi satu baris "Lainnya". Dengan selection, hanya baris seleksi filter yang dihitung.
+def value_distribution(df, column, top_k=None, selection=None):
+    if top_k is not None:
+        summary = get_top_values(df, column, top_k, selection)
+        value_counts = pd.DataFrame({'Nilai': [str(value) for value in summary['values']],
+                                     'Jumlah': summary['counts']})
+        if summary['other']:
+            other = pd.DataFrame({'Nilai': [f"{OTHER_LABEL} ({summary['other_unique']:,} nilai)"],
+                                  'Jumlah': [summary['other']]})
+            value_counts = pd.concat([value_counts, other], ignore_index=True)
+    else:
+        values = df[column] if selection is None else df[column].iloc[selection_rows(selection, len(df))]
+        value_counts = values.value_counts()
+        value_counts = value_counts[value_counts > 0].reset_index()
+        value_counts.columns = ['Nilai', 'Jumlah']
+
+    total = value_counts['Jumlah'].sum()
+    value_counts['Persentase'] = (value_counts['Jumlah'] / total * 100).round(2)
+    return value_counts
+
+
+# Fungsi untuk persentase setiap status pembayaran terhadap seluruh baris
+def status_percentages(df, column=REPAYMENT_COLUMN):
+    counts = df[column].value_counts()
+    return {status: round(count / len(df) * 100, 2) for status, count in counts.items()}
+
+
+# Fungsi untuk membangun profil semua kolom sekaligus setelah data dimuat
+def build_profile(df, column_types=None):
+    if column_types is None:
+        column_types = identify_column_types(df)
+
+    total = len(df)
+    missing_counts = df.isna().sum()
+
+    columns = {}
+    for column in df.columns:
+        column_type = column_types.get(column, 'unknown')
+        missing = int(missing_counts[column])
+
+        entry = {
+            'type': column_type,
+            'count': total - missing,
+            'missing': missing,
+            'missing_percentage': round(missing / total * 100, 2) if total else 0.0,
+        }
+
+        if column_type == 'numeric':
+            entry['numeric'] = get_numeric_stats(df, column)
+        elif column_type == 'categorical':
+            entry['categories'] = get_categorical_stats(df, column)
+            entry['unique'] = sum(1 for stat in entry['categories'] if stat['value'] != 'Missing/Null')
+        elif column_type == 'array':
+            # Statistik per elemen dari representasi multi-hot (diparse sekali saat profil dibuat)
+            entry['categories'] = get_array_stats(df, column)
+            entry['unique'] = len(get_multi_hot(df, column).vocabulary)
+        elif column_type == 'text':
+            # Kolom teks bernilai unik banyak: hanya nilai teratas dan bucket "Lainnya"
+            summary = get_top_values(df, column, TOP_K)
+            entry['top_values'] = [{'value': str(value), 'count': int(count)}
+                                   for value, count in zip(summary['values'], summary['counts'])]
+            entry['other'] = summary['other']
+            entry['unique'] = summary['unique']
+
+        columns[column] = entry
+
+    return {'rows': total, 'columns': columns}
+
+
+# Fungsi untuk mengambil profil dataset dari cache (dibangun sekali per sidik jari)
+def get_profile(df, column_types=None):
+    key = dataset_fingerprint(df)
+    profile = _profile_cache.get(key)
+    if profile is None:
+        profile = _profile_cache.set(key, build_profile(df, column_types))
+    return profile
+
+
+# Fungsi untuk menyimpan dan membaca profil sebagai JSON
+def save_profile(profile, path):
+    with open(path, 'w') as f:
+        json.dump(profile, f)
+
+
+def load_profile(path):
+    with open(path) as f:
+        return json.load(f)
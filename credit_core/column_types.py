@@ -0,0 +1,80 @@
+import pandas as pd
+
+from .fingerprint import BoundedCache, dataset_fingerprint
+
+# Batas nilai unik untuk kolom kategorikal (di atasnya dianggap teks)
+CATEGORICAL_MAX_UNIQUE = 20
+
+# Jumlah nilai unik yang diperiksa dulu sebelum memeriksa seluruh kolom
+SAMPLE_SIZE = 1000
+
+# Jumlah hasil inferensi yang disimpan (per sidik jari dataset)
+MAX_CACHED_DATASETS = 16
+
+_type_cache = BoundedCache(MAX_CACHED_DATASETS, 'column_types')
+
+
+# Fungsi untuk mengecek apakah semua nilai bisa dibaca sebagai angka
+def _all_numeric(values):
+    return bool(pd.to_numeric(values, errors='coerce').notna().all())
+
+
+# Fungsi untuk mengecek format array "[...]" pada nilai string. Cukup kumpulkan
+# karakter pertama/terakhir tiap nilai; jauh lebih murah daripada .str.startswith
+# pada ratusan ribu nilai unik (misalnya kode petani).
+def _has_array_format(values):
+    strings = values.to_numpy(dtype=object)
+    return '[' in {value[:1] for value in strings} and ']' in {value[-1:] for value in strings}
+
+
+# Fungsi untuk menyeragamkan nilai unik menjadi string. Nilai yang sudah berupa
+# string dan sudah unik (misalnya kategori) tidak perlu diubah dan dideduplikasi lagi.
+def _as_unique_strings(values, unique=False):
+    values = pd.Series(values, dtype=object)
+    if unique and pd.api.types.infer_dtype(values, skipna=False) == 'string':
+        return values
+    return values.astype(str).drop_duplicates().reset_index(drop=True)
+
+
+# Fungsi untuk menentukan tipe dari daftar nilai unik (non-null) sebuah kolom
+def _classify_unique(unique_values):
+    if unique_values.empty:
+        return 'unknown'
+
+    # Cek angka pada sampel dulu: satu nilai non-angka sudah cukup untuk menolak
+    sample = unique_values.iloc[:SAMPLE_SIZE]
+    if _all_numeric(sample) and (len(unique_values) <= SAMPLE_SIZE or _all_numeric(unique_values)):
+        return 'numeric'
+
+    # Cek format array pada sampel, lalu konfirmasi ke seluruh nilai unik
+    if _has_array_format(sample) or (len(unique_values) > SAMPLE_SIZE and _has_array_format(unique_values)):
+        return 'array'
+
+    if len(unique_values) <= CATEGORICAL_MAX_UNIQUE:
+        return 'categorical'
+    return 'text'
+
+
+# Fungsi untuk menentukan tipe satu kolom
+def infer_column_type(values):
+    # Jalur cepat berdasarkan dtype
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return 'numeric' if values.notna().any() else 'unknown'
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Cukup periksa kategori yang benar-benar muncul, bukan setiap baris
+        observed = values.cat.categories[pd.unique(values.cat.codes[values.cat.codes >= 0])]
+        return _classify_unique(_as_unique_strings(observed, unique=True))
+
+    return _classify_unique(_as_unique_strings(values.dropna().unique()))
+
+
+# Fungsi untuk mengidentifikasi tipe data kolom, disimpan per sidik jari dataset
+def identify_column_types(df):
+    key = dataset_fingerprint(df)
+    column_types = _type_cache.get(key)
+    if column_types is None:
+        column_types = {column: infer_column_type(df[column]) for column in df.columns}
+        _type_cache.set(key, column_types)
+
+    return dict(column_types)
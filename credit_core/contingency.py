@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from .filter_index import selection_key, selection_rows
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .heavy_hitters import OTHER_LABEL
+
+MAX_CACHED_TABLES = 64
+
+_table_cache = BoundedCache(MAX_CACHED_TABLES, 'contingency')
+
+
+# Fungsi untuk menghitung matriks jumlah dua kolom dari kode kategori dengan np.bincount
+def count_matrix(row_codes, col_codes, n_rows, n_cols):
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    flat = row_codes[valid].astype(np.int64) * n_cols + col_codes[valid]
+    return np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+
+# Fungsi untuk membuat tabel kontingensi sekali, lalu menurunkan semua normalisasi
+# dan margin dari matriks jumlah yang sama (pengganti beberapa pd.crosstab).
+# Dengan top_k, baris di luar k nilai terbanyak digabung menjadi satu baris "Lainnya".
+# Dengan selection (bitset FilterIndex dataset ini), hanya baris terpilih yang dihitung.
+# Hasil di-cache per (sidik jari data, isi seleksi, kolom, kolom grup, top_k).
+def contingency_table(df, column, group_column='farmer_repayment_status', top_k=None, selection=None):
+    scope = selection_key(selection, len(df))
+    key = (dataset_fingerprint(df), scope, column, group_column, top_k)
+    table = _table_cache.get(key)
+    if table is not None:
+        return table
+
+    row_codes, row_labels = pd.factorize(df[column], sort=True)
+    col_codes, col_labels = pd.factorize(df[group_column], sort=True)
+    if scope is not None:
+        rows = selection_rows(selection, len(df))
+        row_codes, col_codes = row_codes[rows], col_codes[rows]
+    counts = count_matrix(row_codes, col_codes, len(row_labels), len(col_labels))
+
+    # Sama seperti crosstab: baris/kolom tanpa data tidak ditampilkan
+    keep_rows = counts.sum(axis=1) > 0
+    keep_cols = counts.sum(axis=0) > 0
+    counts = counts[keep_rows][:, keep_cols]
+
+    row_labels = np.asarray(row_labels)[keep_rows]
+    if top_k is not None and len(counts) > top_k:
+        order = np.argsort(-counts.sum(axis=1), kind='stable')
+        top, rest = order[:top_k], order[top_k:]
+        counts = np.vstack([counts[top], counts[rest].sum(axis=0, keepdims=True)])
+        row_labels = np.append(row_labels[top].astype(object), f"{OTHER_LABEL} ({len(rest):,} nilai)")
+
+    index = pd.Index(row_labels, name=column)
+    columns = pd.Index(np.asarray(col_labels)[keep_cols], name=group_column)
+
+    row_totals = counts.sum(axis=1)
+    col_totals = counts.sum(axis=0)
+    total = counts.sum()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        table = {
+            'absolute': pd.DataFrame(counts, index=index, columns=columns),
+            'row_percentage': pd.DataFrame(counts / row_totals[:, None] * 100, index=index, columns=columns),
+            'column_percentage': pd.DataFrame(counts / col_totals[None, :] * 100, index=index, columns=columns),
+            'total_percentage': pd.DataFrame(counts / total * 100 if total else counts * 0.0,
+                                             index=index, columns=columns),
+            'row_totals': pd.Series(row_totals, index=index, name='All'),
+            'column_totals': pd.Series(col_totals, index=columns, name='All'),
+            'total': int(total),
+        }
+    return _table_cache.set(key, table)
@@ -0,0 +1,216 @@
+import numpy as np
+import pandas as pd
+
+# Jika perubahan seleksi melebihi porsi ini, agregat dihitung ulang dari awal
+FULL_RECOMPUTE_RATIO = 0.5
+
+# Statistik ringkasan kolom, urutannya mengikuti Series.describe()
+DESCRIBE_STATS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+# Cross-filter: beberapa filter rentang/nilai pada kolom mana pun digabung
+# dengan AND. Setiap filter menyimpan bitset-nya sendiri, sehingga perubahan
+# satu filter hanya menghitung ulang bitset filter itu. Agregat per grup
+# (jumlah, sum, sum kuadrat) diperbarui hanya dari baris yang masuk/keluar.
+# Sum dan sum kuadrat dihitung dari nilai yang digeser rata-rata kolomnya agar
+# std tetap presisi untuk nilai besar dengan sebaran kecil.
+# Baris tanpa grup dikumpulkan di bucket terakhir agar ringkasan keseluruhan lengkap.
+class CrossFilter:
+    def __init__(self, index, group_column=None, value_columns=()):
+        self.index = index
+        self.group_column = group_column
+        self.value_columns = [col for col in value_columns if col in index.df.columns]
+        self._base_columns = list(self.value_columns)
+        self._filters = {}
+        self._bitsets = {}
+        self._selection = index.all_selection()
+
+        if group_column is not None and group_column in index.df.columns:
+            codes, labels = pd.factorize(index.df[group_column], sort=False)
+        else:
+            codes, labels = np.zeros(index.rows, dtype=np.int64), ['Semua']
+        self.group_labels = list(labels)
+        self._codes = np.where(codes >= 0, codes, len(self.group_labels))
+        self._group_bitsets = None
+        self._shifts = {}
+        self._values = {col: self._numeric(col) for col in self.value_columns}
+        self._aggregates = self._aggregate_rows(np.arange(index.rows))
+
+    # Fungsi untuk nilai numerik kolom yang digeser dengan rata-rata seluruh kolom.
+    # Pergeseran tetap selama objek hidup, jadi agregat tetap aditif.
+    def _numeric(self, column):
+        values = pd.to_numeric(self.index.df[column], errors='coerce')
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        finite = values[np.isfinite(values)]
+        self._shifts[column] = float(finite.mean()) if len(finite) else 0.0
+        return values - self._shifts[column]
+
+    # Fungsi untuk menghitung agregat aditif (count, sum, sum kuadrat) per grup
+    def _aggregate_rows(self, rows, columns=None):
+        buckets = len(self.group_labels) + 1
+        codes = self._codes[rows]
+
+        aggregates = {'rows': np.bincount(codes, minlength=buckets).astype(np.float64)}
+        for col in self._values if columns is None else columns:
+            col_values = self._values[col][rows]
+            present = ~np.isnan(col_values)
+            present_values = col_values[present]
+            aggregates[col] = {
+                'count': np.bincount(codes[present], minlength=buckets).astype(np.float64),
+                'sum': np.bincount(codes[present], weights=present_values, minlength=buckets),
+                'sumsq': np.bincount(codes[present], weights=present_values ** 2, minlength=buckets),
+            }
+        return aggregates
+
+    def _update_aggregates(self, rows, sign):
+        delta = self._aggregate_rows(rows)
+        self._aggregates['rows'] += sign * delta['rows']
+        for col in self.value_columns:
+            for stat in ('count', 'sum', 'sumsq'):
+                self._aggregates[col][stat] += sign * delta[col][stat]
+
+    # Fungsi untuk menggabungkan ulang seleksi lalu memperbarui agregat secara inkremental
+    def _refresh(self):
+        selection = self.index.all_selection()
+        for bitset in self._bitsets.values():
+            selection = selection & bitset
+
+        added = self.index.row_ids(selection & ~self._selection)
+        removed = self.index.row_ids(self._selection & ~selection)
+
+        if len(added) + len(removed) > self.index.rows * FULL_RECOMPUTE_RATIO:
+            self._aggregates = self._aggregate_rows(self.index.row_ids(selection))
+        else:
+            if len(added):
+                self._update_aggregates(added, 1)
+            if len(removed):
+                self._update_aggregates(removed, -1)
+
+        self._selection = selection
+
+    def _set_filter(self, column, spec, build):
+        if self._filters.get(column) == spec:
+            return
+        self._filters[column] = spec
+        self._bitsets[column] = build()
+        self._refresh()
+
+    # Fungsi untuk memasang filter rentang numerik
+    def set_range(self, column, low, high):
+        self._set_filter(column, ('range', low, high),
+                         lambda: self.index.range_selection(column, low, high))
+
+    # Fungsi untuk memasang filter nilai kategorikal
+    def set_values(self, column, values):
+        values = tuple(values)
+        self._set_filter(column, ('values', values),
+                         lambda: self.index.values_selection(column, values))
+
+    # Fungsi untuk menghapus filter satu kolom
+    def clear(self, column):
+        if column in self._filters:
+            del self._filters[column]
+            del self._bitsets[column]
+            self._refresh()
+
+    # Fungsi untuk menghapus filter kolom yang tidak lagi dipakai
+    def keep_only(self, columns):
+        for column in list(self._filters):
+            if column not in columns:
+                self.clear(column)
+
+    # Fungsi untuk menentukan kolom numerik tambahan yang agregatnya dijaga (misalnya
+    # kolom yang sedang dianalisis). Kolom baru dihitung sekali dari seleksi saat ini,
+    # lalu ikut diperbarui inkremental; kolom tambahan lama dilepas.
+    def track_columns(self, columns):
+        wanted = list(dict.fromkeys(self._base_columns + [col for col in columns if col in self.index.df.columns]))
+        for col in [col for col in self.value_columns if col not in wanted]:
+            del self._values[col]
+            del self._shifts[col]
+            del self._aggregates[col]
+
+        added = [col for col in wanted if col not in self._values]
+        for col in added:
+            self._values[col] = self._numeric(col)
+        if added:
+            self._aggregates.update(self._aggregate_rows(self.index.row_ids(self._selection), added))
+        self.value_columns = wanted
+
+    @property
+    def filters(self):
+        return dict(self._filters)
+
+    def selection(self):
+        return self._selection
+
+    # Seleksi semua filter kecuali filter kolom ini (untuk grafik kolom itu sendiri)
+    def selection_excluding(self, column):
+        selection = self.index.all_selection()
+        for other, bitset in self._bitsets.items():
+            if other != column:
+                selection = selection & bitset
+        return selection
+
+    def count(self):
+        return self.index.count(self._selection)
+
+    # Fungsi untuk ringkasan per grup dari agregat inkremental: jumlah baris, mean dan std
+    def group_summary(self):
+        groups = len(self.group_labels)
+        summary = pd.DataFrame({'count': self._aggregates['rows'][:groups].astype(np.int64)},
+                               index=pd.Index(self.group_labels, name=self.group_column))
+        for col in self.value_columns:
+            count, mean, std = _moments(self._aggregates[col], self._shifts[col])
+            summary[f'mean_{col}'] = mean[:groups]
+            summary[f'std_{col}'] = std[:groups]
+        return summary
+
+    def _group_bitset(self, group):
+        if self._group_bitsets is None:
+            self._group_bitsets = [np.packbits(self._codes == code) for code in range(len(self.group_labels))]
+        return self._group_bitsets[group]
+
+    # Fungsi untuk statistik deskriptif kolom yang dilacak pada seleksi saat ini (setara
+    # Series.describe(), atau describe per grup). count/mean/std dari agregat inkremental;
+    # min, kuartil, dan max dari indeks terurut FilterIndex yang dibatasi ke seleksi,
+    # tanpa menyalin baris terfilter.
+    def describe(self, column, by_group=False):
+        if column not in self._values:
+            self.track_columns([col for col in self.value_columns if col not in self._base_columns] + [column])
+        count, mean, std = _moments(self._aggregates[column], self._shifts[column])
+
+        if not by_group:
+            total = {stat: self._aggregates[column][stat].sum(keepdims=True) for stat in ('count', 'sum', 'sumsq')}
+            overall = [float(value[0]) for value in _moments(total, self._shifts[column])]
+            values = self.index.sorted_values(column, self._selection)
+            return pd.Series(overall + _order_stats(values), index=DESCRIBE_STATS, name=column)
+
+        rows = []
+        for group, label in enumerate(self.group_labels):
+            if count[group] == 0:
+                continue
+            values = self.index.sorted_values(column, self._selection & self._group_bitset(group))
+            rows.append((label, [count[group], mean[group], std[group]] + _order_stats(values)))
+        return pd.DataFrame([stats for _, stats in rows], columns=DESCRIBE_STATS,
+                            index=pd.Index([label for label, _ in rows], name=self.group_column)).sort_index()
+
+
+# Fungsi untuk count, mean, dan std (ddof=1) dari agregat count/sum/sum kuadrat
+# nilai yang digeser sebesar shift
+def _moments(aggregate, shift=0.0):
+    count = aggregate['count']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shifted_mean = aggregate['sum'] / count
+        variance = (aggregate['sumsq'] - count * shifted_mean ** 2) / (count - 1)
+    return count, shifted_mean + shift, np.sqrt(np.clip(variance, 0.0, None))
+
+
+# Fungsi untuk min, kuartil (interpolasi linear seperti pandas), dan max dari nilai terurut
+def _order_stats(values):
+    if len(values) == 0:
+        return [np.nan] * 5
+    positions = np.array([0.25, 0.5, 0.75]) * (len(values) - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, len(values) - 1)
+    quartiles = values[lower] + (values[upper] - values[lower]) * (positions - lower)
+    return [float(values[0])] + [float(q) for q in quartiles] + [float(values[-1])]
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Skema kolom numerik dataset credit score: nama kolom -> tipe target.
+# Kolom uang seperti "4,000,000" diparsing langsung saat membaca CSV.
+NUMERIC_SCHEMA = {
+    'farmer_age': 'int32',
+    'farmer_experience': 'int32',
+    'farmer_dependents': 'int32',
+    'farmer_financial_monthly_income': 'int32',
+    'farmer_field_range_to_water': 'int32',
+    'farming_frequency_in_year': 'int32',
+    'farmer_field_tiles': 'int32',
+    'farmer_field_owned_area': 'float32',
+    'farmer_field_proposed_area': 'float32',
+    'proposed_field_size_ratio': 'float32',
+    'farmer_field_ph': 'float32',
+    'historical_harvest': 'int32',
+    'farmer_last_year_harvest': 'int32',
+    'farmer_last_year_expense': 'int32',
+    'farmer_credit_score': 'int32',
+    'farmer_total_loan': 'int32',
+    'farmer_count': 'int32',
+}
+
+# Kolom kategorikal dengan sedikit nilai unik disimpan sebagai 'category'
+CATEGORICAL_SCHEMA = [
+    'farmer_gender',
+    'farmer_house_ownership_status',
+    'farmer_job_status',
+    'farmer_marital_status',
+    'farmer_other_job_status',
+    'farmer_other_job_type',
+    'farmer_financial_loan_history',
+    'farmer_financial_loan_performance',
+    'farmer_insurance_status',
+    'farmer_savings_status',
+    'farmer_field_irrigation',
+    'farmer_planting_phase',
+    'farmer_planting_season',
+    'farmer_seeds_certificate',
+    'farmer_seeds_type',
+    'farmer_seeds_variety',
+    'farmer_farming_failure_history',
+    'farmer_planting_rotation',
+    'farmer_partnership_eratani_history',
+    'farmer_repayment_status',
+]
+
+# Batas nilai integer yang masih presisi di float32
+FLOAT32_EXACT_LIMIT = 2 ** 24
+
+# Batas ukuran array unicode sementara untuk mengurutkan kategori teks (byte)
+TEXT_SORT_BYTES = 256 * 2 ** 20
+
+# Kolom teks hanya dienkode kamus jika nilai uniknya paling banyak porsi ini dari
+# jumlah baris. Kolom yang hampir semuanya unik (misalnya farmer_code) tidak hemat
+# memori sebagai 'category' dan justru memperlambat baca CSV/Parquet.
+TEXT_DICTIONARY_MAX_RATIO = 0.5
+
+# Jumlah baris per potongan saat membaca CSV. Setiap potongan langsung diringkas
+# tipenya, sehingga salinan bertipe lebar hanya ada untuk satu potongan.
+READ_CHUNK_ROWS = 200000
+
+
+# Fungsi untuk mengecilkan tipe kolom numerik tanpa kehilangan nilai
+def downcast_numeric(values, target='int32'):
+    values = pd.to_numeric(values, errors='coerce')
+
+    if target.startswith('float'):
+        return values.astype(target)
+
+    if values.isna().any():
+        # Integer dengan missing value disimpan sebagai float
+        max_abs = values.abs().max()
+        if pd.isna(max_abs) or max_abs < FLOAT32_EXACT_LIMIT:
+            return values.astype('float32')
+        return values.astype('float64')
+
+    info = np.iinfo(target)
+    if len(values) and (values.min() < info.min or values.max() > info.max):
+        return values.astype('int64')
+    return values.astype(target)
+
+
+# Fungsi untuk menentukan tipe baca per kolom dari header CSV. Kolom float dan
+# kategorikal langsung dibaca dengan tipe ringkas. Kolom integer tidak: parser pandas
+# memotong nilai di luar batas int32 tanpa error, jadi kolom integer dibaca per
+# potongan lalu divalidasi dan diringkas oleh downcast_numeric.
+def _read_dtypes(header):
+    dtypes = {}
+    for column in header:
+        if column in CATEGORICAL_SCHEMA:
+            dtypes[column] = 'category'
+        elif NUMERIC_SCHEMA.get(column, '').startswith('float'):
+            dtypes[column] = NUMERIC_SCHEMA[column]
+    return dtypes
+
+
+# Fungsi untuk membaca dataset CSV dengan tipe data yang ringkas
+def read_dataset(source, columns=None):
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    header = pd.read_csv(source, nrows=0).columns.tolist()
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+    reader = pd.read_csv(
+        source,
+        usecols=columns,
+        thousands=',',
+        dtype=_read_dtypes(header),
+        chunksize=READ_CHUNK_ROWS,
+    )
+    with reader:
+        chunks = [apply_schema(chunk, categorize_text=False) for chunk in reader]
+    return _concat_chunks(chunks)
+
+
+# Fungsi untuk menggabungkan potongan yang sudah diringkas. Kategori digabung dengan
+# union_categoricals (pd.concat akan mengubahnya jadi object jika kategorinya berbeda),
+# lalu skema diterapkan lagi untuk menyamakan tipe numerik antar potongan dan
+# mengenkode kolom teks di luar skema (sekali, bukan per potongan).
+def _concat_chunks(chunks):
+    if len(chunks) == 1:
+        return apply_schema(chunks[0])
+
+    columns = {}
+    for column in chunks[0].columns:
+        parts = [chunk[column] for chunk in chunks]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            columns[column] = pd.Series(union_categoricals(parts, sort_categories=True), name=column)
+        else:
+            columns[column] = pd.concat(parts, ignore_index=True)
+        for chunk in chunks:
+            del chunk[column]
+    return apply_schema(pd.DataFrame(columns))
+
+
+# Fungsi untuk menerapkan skema tipe ke DataFrame yang sudah dibaca
+def apply_schema(df, categorize_text=True):
+    for column in df.columns:
+        values = df[column]
+
+        if column in NUMERIC_SCHEMA:
+            df[column] = downcast_numeric(values, NUMERIC_SCHEMA[column])
+        elif column in CATEGORICAL_SCHEMA:
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                df[column] = values.astype('category')
+        elif pd.api.types.is_integer_dtype(values):
+            df[column] = downcast_numeric(values, 'int32')
+        elif values.dtype == 'float64' and _fits_float32(values):
+            df[column] = values.astype('float32')
+        elif categorize_text and values.dtype == object and len(values):
+            # Kolom teks di luar skema (misalnya farmer_seeds_variety) disimpan terenkode
+            # kamus: kode integer per baris dan setiap string unik hanya sekali
+            df[column] = _categorize_text(values)
+
+    return df
+
+
+# Fungsi untuk mengenkode kolom teks sebagai 'category' (hasil sama dengan
+# astype('category'): kategori terurut). Kolom dengan terlalu banyak nilai unik
+# dibiarkan sebagai object. Nilai unik diurutkan sebagai array unicode numpy, lebih
+# cepat daripada pengurutan string Python.
+def _categorize_text(values):
+    codes, uniques = pd.factorize(values)
+    if len(uniques) > len(values) * TEXT_DICTIONARY_MAX_RATIO:
+        return values
+
+    uniques = np.asarray(uniques, dtype=object)
+    if pd.api.types.infer_dtype(uniques, skipna=False) != 'string' or \
+            len(uniques) * max(map(len, uniques), default=0) * 4 > TEXT_SORT_BYTES:
+        return values.astype('category')
+
+    order = np.argsort(uniques.astype(str))
+    positions = np.empty(len(order) + 1, dtype=codes.dtype)
+    positions[order] = np.arange(len(order))
+    positions[-1] = -1
+    categorical = pd.Categorical.from_codes(positions[codes], dtype=pd.CategoricalDtype(uniques[order]),
+                                            validate=False)
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+
+# Fungsi untuk mengecek apakah kolom float bisa disimpan sebagai float32 tanpa kehilangan presisi
+def _fits_float32(values):
+    non_null = values.dropna()
+    return bool((non_null.astype('float32').astype('float64') == non_null).all())
@@ -0,0 +1,164 @@
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+from contextlib import suppress
+
+import pandas as pd
+
+from .data_loader import read_dataset
+from .fingerprint import dataset_token, register_dataset
+
+# pyarrow hanya dicek keberadaannya; baru dimuat pandas saat membaca/menulis Parquet
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Folder cache kolumnar (Parquet) untuk dataset CSV
+CACHE_DIR = os.environ.get('CREDIT_SCORE_CACHE_DIR', '.cache')
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# umask proses, dibaca sekali saat import (os.umask hanya bisa dibaca sambil mengubahnya)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Versi format file cache (Parquet dan Arrow bersama). Dinaikkan jika tipe kolom hasil read_dataset berubah,
+# agar cache lama (isi CSV sama, tipe berbeda) dibangun ulang.
+CACHE_FORMAT = 2
+
+
+# Fungsi untuk menghitung hash isi file atau buffer upload
+def content_hash(source):
+    digest = hashlib.sha256()
+
+    if hasattr(source, 'read'):
+        position = source.tell()
+        source.seek(0)
+        for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        source.seek(position)
+    else:
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+# Fungsi untuk nama cache sebuah sumber. File di disk diberi hash path absolutnya,
+# sehingga file bernama sama di folder berbeda tidak saling menimpa cache.
+def _cache_name(source):
+    if not isinstance(source, str):
+        name = getattr(source, 'name', 'upload')
+        return os.path.splitext(os.path.basename(str(name)))[0]
+
+    path_digest = hashlib.sha256(os.path.realpath(source).encode()).hexdigest()[:8]
+    return f"{os.path.splitext(os.path.basename(source))[0]}.{path_digest}"
+
+
+def _meta_path(source):
+    return os.path.join(CACHE_DIR, f"{_cache_name(source)}.meta.json")
+
+
+# Fungsi untuk kunci file cache turunan dari hash isi sumber dan versi formatnya
+def _cache_key(digest):
+    return hashlib.sha256(f"{CACHE_FORMAT}:{digest}".encode()).hexdigest()[:16]
+
+
+def _parquet_path(source, digest):
+    return os.path.join(CACHE_DIR, f"{_cache_name(source)}-{_cache_key(digest)}.parquet")
+
+
+def _read_meta(source):
+    try:
+        with open(_meta_path(source)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# Fungsi untuk file sementara unik di folder tujuan (aman untuk penulis bersamaan,
+# baik antar proses maupun antar thread), lalu dipindahkan secara atomik. mkstemp
+# membuat file 0600; izinnya disamakan dengan file biasa (0666 dikurangi umask)
+# agar worker dengan user lain tetap bisa membacanya.
+def _atomic_write(path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_meta(source, meta):
+    def write(tmp_path):
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+
+    _atomic_write(_meta_path(source), write)
+
+
+# Fungsi untuk mencari hash isi file, memakai ukuran/mtime agar tidak perlu hashing ulang
+def _resolve_digest(source):
+    if not isinstance(source, str):
+        return content_hash(source)
+
+    stat = os.stat(source)
+    meta = _read_meta(source)
+    if meta and meta.get('size') == stat.st_size and meta.get('mtime_ns') == stat.st_mtime_ns:
+        return meta['sha256']
+
+    digest = content_hash(source)
+    _write_meta(source, {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest})
+    return digest
+
+
+# Fungsi untuk menulis dataset ke file Parquet secara atomik
+def _write_parquet(df, path):
+    _atomic_write(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+    # Hapus cache versi lama dari file yang sama
+    prefix = path.rsplit('-', 1)[0]
+    for old_path in glob.glob(f"{glob.escape(prefix)}-{'?' * 16}.parquet"):
+        if old_path != path:
+            with suppress(FileNotFoundError):
+                os.remove(old_path)
+
+
+# Fungsi untuk membaca dataset lewat cache Parquet, dibuat saat pertama kali dibaca.
+# Hasilnya didaftarkan dengan identitas dari hash isi file dan kolom yang dibaca,
+# sehingga cache turunan tidak perlu meng-hash ulang DataFrame-nya.
+def load_cached(source, columns=None):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    digest = _resolve_digest(source)
+    token = dataset_token('csv', digest, tuple(columns) if columns is not None else None)
+    return register_dataset(_load(source, digest, columns), token)
+
+
+def _load(source, digest, columns):
+    if not PARQUET_AVAILABLE:
+        return read_dataset(source, columns=columns)
+
+    path = _parquet_path(source, digest)
+    if os.path.exists(path):
+        try:
+            return pd.read_parquet(path, columns=columns)
+        except Exception:
+            # File cache rusak: bangun ulang dari CSV (bisa sudah dihapus proses lain)
+            with suppress(FileNotFoundError):
+                os.remove(path)
+
+    df = read_dataset(source)
+    try:
+        _write_parquet(df, path)
+    except OSError:
+        pass
+
+    if columns is not None:
+        return df[list(columns)]
+    return df
@@ -0,0 +1,106 @@
+import numpy as np
+
+from .filter_index import selection_key, selection_rows
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .grouping import group_slices
+
+# Jumlah titik grid default untuk kurva densitas
+DENSITY_POINTS = 512
+
+# Lebar kernel Gaussian yang dihitung (kelipatan bandwidth)
+KERNEL_RADIUS = 4
+
+MAX_CACHED_DENSITIES = 64
+
+_density_cache = BoundedCache(MAX_CACHED_DENSITIES, 'density')
+
+
+# Fungsi untuk binning linear: setiap nilai dibagi ke dua titik grid terdekat
+# sesuai jaraknya, sehingga KDE di atas grid hampir sama dengan KDE eksak.
+def linear_binning(values, low, high, points):
+    weights = np.zeros(points)
+    if len(values) == 0:
+        return weights
+    if high == low:
+        weights[0] = len(values)
+        return weights
+
+    position = (values - low) / (high - low) * (points - 1)
+    left = np.clip(np.floor(position).astype(np.int64), 0, points - 2)
+    fraction = np.clip(position - left, 0.0, 1.0)
+
+    weights += np.bincount(left, weights=1.0 - fraction, minlength=points)
+    weights += np.bincount(left + 1, weights=fraction, minlength=points)
+    return weights
+
+
+# Fungsi untuk bandwidth aturan Scott (referensi distribusi normal)
+def scott_bandwidth(values):
+    if len(values) < 2:
+        return 0.0
+    return 1.06 * values.std(ddof=1) * len(values) ** (-1 / 5)
+
+
+# Fungsi untuk konvolusi bobot grid dengan kernel Gaussian lewat FFT
+def fft_convolve_gaussian(weights, step, bandwidth):
+    points = len(weights)
+    radius = min(int(np.ceil(KERNEL_RADIUS * bandwidth / step)), points - 1)
+    offsets = np.arange(-radius, radius + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+
+    # Zero padding agar konvolusi tidak melingkar
+    size = int(2 ** np.ceil(np.log2(points + len(kernel) - 1)))
+    result = np.fft.irfft(np.fft.rfft(weights, size) * np.fft.rfft(kernel, size), size)
+    return result[radius:radius + points]
+
+
+# Fungsi untuk menghitung kurva densitas satu kumpulan nilai di atas grid tetap
+def kde_on_grid(values, grid, bandwidth=None):
+    points = len(grid)
+    if len(values) == 0:
+        return np.zeros(points)
+
+    bandwidth = scott_bandwidth(values) if bandwidth is None else bandwidth
+    step = grid[1] - grid[0] if points > 1 else 0.0
+
+    if bandwidth <= 0 or step <= 0:
+        # Semua nilai sama: densitas terpusat di satu titik grid
+        density = np.zeros(points)
+        density[np.argmin(np.abs(grid - values.mean()))] = 1.0 / step if step > 0 else 1.0
+        return density
+
+    weights = linear_binning(values, grid[0], grid[-1], points)
+    return np.clip(fft_convolve_gaussian(weights, step, bandwidth), 0.0, None) / len(values)
+
+
+# Fungsi untuk menghitung kurva densitas per grup (misalnya per status pembayaran)
+# di atas grid yang sama, opsional hanya untuk baris seleksi filter (bitset dari
+# FilterIndex dataset ini). Hasil di-cache per (sidik jari data, isi seleksi, kolom, grup).
+def grouped_density(df, column, group_column=None, points=DENSITY_POINTS, selection=None):
+    scope = selection_key(selection, len(df))
+    key = (dataset_fingerprint(df), scope, column, group_column, points)
+    result = _density_cache.get(key)
+    if result is not None:
+        return result
+
+    rows = None if scope is None else selection_rows(selection, len(df))
+    slices = [(label, values) for label, values in group_slices(df, column, group_column, rows) if len(values)]
+    if not slices:
+        empty = {'column': column, 'grid': np.array([]), 'groups': [], 'densities': [], 'ranges': []}
+        return _density_cache.set(key, empty)
+
+    low = min(values.min() for _, values in slices)
+    high = max(values.max() for _, values in slices)
+
+    # Grid diperlebar sejauh bandwidth terbesar agar ekor kurva tidak terpotong
+    padding = KERNEL_RADIUS * max(scott_bandwidth(values) for _, values in slices) / 2
+    grid = np.linspace(low - padding, high + padding, points)
+
+    result = {
+        'column': column,
+        'grid': grid,
+        'groups': [label for label, _ in slices],
+        'densities': [kde_on_grid(values, grid) for _, values in slices],
+        'ranges': [(float(values.min()), float(values.max())) for _, values in slices],
+    }
+    return _density_cache.set(key, result)
@@ -0,0 +1,135 @@
+import glob
+import gzip
+import hashlib
+import os
+from contextlib import suppress
+
+from .dataset_cache import CACHE_DIR, PARQUET_AVAILABLE, _atomic_write
+from .filter_index import selection_digest
+from .fingerprint import BoundedCache, dataset_fingerprint
+
+# Jumlah baris yang diserialisasi per langkah saat menulis file ekspor
+EXPORT_CHUNK_ROWS = 50000
+
+# Tingkat kompresi gzip (6 = default gzip, seimbang antara ukuran dan waktu)
+GZIP_LEVEL = 6
+
+# Format ekspor: ekstensi file dan tipe MIME
+EXPORT_FORMATS = {
+    'csv.gz': {'label': 'CSV (gzip)', 'extension': 'csv.gz', 'mime': 'application/gzip'},
+    'parquet': {'label': 'Parquet', 'extension': 'parquet', 'mime': 'application/vnd.apache.parquet'},
+}
+
+# Folder file ekspor. File ditulis per potongan langsung ke disk dan dikirim dari
+# sana, sehingga isi ekspor tidak pernah disimpan utuh di memori.
+EXPORT_DIR = os.environ.get('CREDIT_SCORE_EXPORT_DIR', os.path.join(CACHE_DIR, 'exports'))
+
+# Jumlah file ekspor terbaru yang disimpan di EXPORT_DIR (yang lebih lama dihapus)
+MAX_CACHED_EXPORTS = 4
+
+# Cache hanya menyimpan path file (untuk statistik hit/miss panel performa)
+_export_cache = BoundedCache(MAX_CACHED_EXPORTS, 'export')
+
+
+# Fungsi untuk daftar format ekspor yang bisa dipakai di lingkungan ini
+def available_formats():
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet' or PARQUET_AVAILABLE]
+
+
+# Fungsi untuk kunci ekspor: sidik jari data, isi seleksi filter, kolom, dan format
+def export_key(index, selection, columns, fmt):
+    return (dataset_fingerprint(index.df), selection_digest(selection), tuple(dict.fromkeys(columns)), fmt)
+
+
+# Fungsi untuk membagi baris terpilih menjadi potongan DataFrame kecil
+def iter_chunks(index, selection, columns, chunk_rows=EXPORT_CHUNK_ROWS):
+    columns = list(dict.fromkeys(columns))
+    positions = index.df.columns.get_indexer(columns)
+    rows = index.row_ids(selection)
+    for start in range(0, len(rows), chunk_rows):
+        yield index.df.iloc[rows[start:start + chunk_rows], positions]
+
+    if len(rows) == 0:
+        yield index.df.iloc[:0, positions]
+
+
+def _write_csv_gzip(chunks, output):
+    with gzip.GzipFile(fileobj=output, mode='wb', compresslevel=GZIP_LEVEL, mtime=0) as f:
+        for i, chunk in enumerate(chunks):
+            f.write(chunk.to_csv(index=False, header=(i == 0)).encode('utf-8'))
+
+
+def _write_parquet(chunks, output):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema, compression='snappy')
+            else:
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+# Fungsi untuk menulis ekspor per potongan ke file atau objek file,
+# tanpa pernah membentuk seluruh CSV/tabel di memori sekaligus
+def write_export(index, selection, columns, fmt, output, chunk_rows=EXPORT_CHUNK_ROWS):
+    if fmt not in available_formats():
+        raise ValueError(f"Format ekspor tidak didukung: {fmt}")
+
+    chunks = iter_chunks(index, selection, columns, chunk_rows)
+    if isinstance(output, str):
+        with open(output, 'wb') as f:
+            _write_format(chunks, fmt, f)
+    else:
+        _write_format(chunks, fmt, output)
+
+
+def _write_format(chunks, fmt, output):
+    if fmt == 'csv.gz':
+        _write_csv_gzip(chunks, output)
+    else:
+        _write_parquet(chunks, output)
+
+
+# Fungsi untuk path file ekspor sebuah kunci (nama dari hash kunci, sehingga proses
+# lain dengan data dan filter yang sama memakai file yang sama)
+def export_path(key):
+    name = hashlib.sha1(repr(key).encode()).hexdigest()[:24]
+    return os.path.join(EXPORT_DIR, f"{name}.{EXPORT_FORMATS[key[-1]]['extension']}")
+
+
+# Fungsi untuk membuat file ekspor hanya saat diminta dan mengembalikan path-nya.
+# File di-cache per (data, filter, kolom, format) agar rerun tidak menyerialisasi ulang.
+def get_export(index, selection, columns, fmt):
+    key = export_key(index, selection, columns, fmt)
+    path = _export_cache.get(key)
+    if path is not None and os.path.exists(path):
+        os.utime(path)
+        return path
+
+    path = export_path(key)
+    if not os.path.exists(path):
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        _atomic_write(path, lambda tmp_path: write_export(index, selection, columns, fmt, tmp_path))
+        _prune_exports(path)
+    else:
+        os.utime(path)
+    return _export_cache.set(key, path)
+
+
+# Fungsi untuk menghapus file ekspor lama (paling lama tidak dipakai) di luar MAX_CACHED_EXPORTS
+def _prune_exports(keep):
+    paths = [path for fmt in EXPORT_FORMATS.values()
+             for path in glob.glob(os.path.join(EXPORT_DIR, f"*.{fmt['extension']}"))]
+    paths.sort(key=lambda path: os.stat(path).st_mtime_ns if os.path.exists(path) else 0, reverse=True)
+    for path in paths[MAX_CACHED_EXPORTS:]:
+        if path != keep:
+            with suppress(FileNotFoundError):
+                os.remove(path)
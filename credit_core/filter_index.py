@@ -0,0 +1,215 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint import BoundedCache, dataset_fingerprint, dataset_token, register_dataset
+
+# Kolom dengan nilai unik lebih banyak dari ini tidak dibuatkan bitmap per nilai
+MAX_BITMAP_VALUES = 256
+
+# Jumlah baris urutan yang diperiksa per langkah saat mencari isi satu halaman
+PAGE_SCAN_BLOCK = 65536
+
+MAX_CACHED_INDEXES = 4
+
+_index_cache = BoundedCache(MAX_CACHED_INDEXES, 'filter_index')
+
+# Tabel jumlah bit aktif untuk setiap nilai byte
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+# Indeks filter untuk satu dataset. Seleksi baris disimpan sebagai bitset
+# terkompresi (np.packbits), sehingga beberapa filter cukup digabung dengan
+# operasi AND/OR per byte tanpa menyalin DataFrame. Indeks per kolom dibuat
+# saat kolom pertama kali difilter lalu dipakai ulang.
+class FilterIndex:
+    def __init__(self, df):
+        self.df = df
+        self.rows = len(df)
+        self._numeric = {}
+        self._categorical = {}
+        self._sort_orders = {}
+
+    # Indeks numerik: permutasi baris terurut dan nilai terurut (NaN di akhir)
+    def _numeric_index(self, column):
+        if column not in self._numeric:
+            values = pd.to_numeric(self.df[column], errors='coerce')
+            values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            order_dtype = np.int32 if self.rows < 2 ** 31 else np.int64
+            order = np.argsort(values, kind='stable').astype(order_dtype)
+            sorted_values = values[order]
+            self._numeric[column] = {
+                'order': order,
+                'sorted': sorted_values,
+                'valid': int(len(values) - np.isnan(values).sum()),
+            }
+        return self._numeric[column]
+
+    # Indeks kategorikal: satu bitmap terkompresi per nilai unik
+    def _categorical_index(self, column):
+        if column not in self._categorical:
+            codes, labels = pd.factorize(self.df[column], sort=False)
+            if len(labels) > MAX_BITMAP_VALUES:
+                self._categorical[column] = None
+            else:
+                bitmaps = np.zeros((len(labels), (self.rows + 7) // 8), dtype=np.uint8)
+                for code in range(len(labels)):
+                    bitmaps[code] = np.packbits(codes == code)
+
+                self._categorical[column] = {
+                    'codes': {label: code for code, label in enumerate(labels)},
+                    'bitmaps': bitmaps,
+                }
+        return self._categorical[column]
+
+    # Fungsi untuk nilai minimum dan maksimum kolom numerik dari indeks terurut
+    def value_range(self, column):
+        index = self._numeric_index(column)
+        if index['valid'] == 0:
+            return float('nan'), float('nan')
+        return float(index['sorted'][0]), float(index['sorted'][index['valid'] - 1])
+
+    # Fungsi untuk nilai terurut (tanpa NaN) kolom numerik pada baris terpilih,
+    # langsung dari indeks terurut tanpa menyalin kolom atau mengurutkan ulang
+    def sorted_values(self, column, selection):
+        index = self._numeric_index(column)
+        mask = selection_rows_mask(selection, self.rows)
+        return index['sorted'][:index['valid']][mask[index['order'][:index['valid']]]]
+
+    # Fungsi untuk seleksi semua baris
+    def all_selection(self):
+        return np.packbits(np.ones(self.rows, dtype=bool))
+
+    # Fungsi untuk seleksi baris dari daftar posisi baris
+    def selection_from_rows(self, rows):
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[rows] = True
+        return np.packbits(mask)
+
+    # Fungsi untuk filter rentang numerik (low <= nilai <= high) memakai searchsorted
+    def range_selection(self, column, low, high):
+        index = self._numeric_index(column)
+        valid_values = index['sorted'][:index['valid']]
+        start = np.searchsorted(valid_values, low, side='left')
+        end = np.searchsorted(valid_values, high, side='right')
+        return self.selection_from_rows(index['order'][start:end])
+
+    # Fungsi untuk filter nilai kategorikal (setara isin) dengan OR antar bitmap
+    def values_selection(self, column, values):
+        index = self._categorical_index(column)
+        if index is None:
+            return np.packbits(self.df[column].isin(values).to_numpy())
+
+        codes = [index['codes'][value] for value in values if value in index['codes']]
+        if not codes:
+            return np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        return np.bitwise_or.reduce(index['bitmaps'][codes], axis=0)
+
+    # Fungsi untuk menghitung jumlah baris terpilih tanpa membuka bitset
+    def count(self, selection):
+        return int(_POPCOUNT[selection].sum())
+
+    # Fungsi untuk mengubah bitset menjadi posisi baris
+    def row_ids(self, selection):
+        return selection_rows(selection, self.rows)
+
+    # Urutan baris untuk pengurutan kolom: numerik dari indeks terurut,
+    # kolom lain dari kode kategori terurut. Nilai kosong selalu di akhir.
+    def _sort_order(self, column, ascending):
+        key = (column, ascending)
+        if key not in self._sort_orders:
+            values = self.df[column]
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                index = self._numeric_index(column)
+                valid = index['order'][:index['valid']]
+                missing = index['order'][index['valid']:]
+            else:
+                codes, _ = pd.factorize(values, sort=True)
+                order = np.argsort(codes, kind='stable')
+                missing_count = int((codes < 0).sum())
+                valid, missing = order[missing_count:], order[:missing_count]
+            if not ascending:
+                valid = valid[::-1]
+            self._sort_orders[key] = np.concatenate([valid, missing])
+        return self._sort_orders[key]
+
+    # Fungsi untuk posisi baris satu halaman tanpa membuka seluruh bitset
+    def _page_rows(self, selection, offset, limit):
+        counts = np.cumsum(_POPCOUNT[selection])
+        first_byte = int(np.searchsorted(counts, offset, side='right'))
+        last_byte = int(np.searchsorted(counts, offset + limit, side='left')) + 1
+        skipped = int(counts[first_byte - 1]) if first_byte > 0 else 0
+
+        bits = np.unpackbits(selection[first_byte:last_byte])
+        rows = np.flatnonzero(bits) + first_byte * 8
+        rows = rows[rows < self.rows]
+        return rows[offset - skipped:offset - skipped + limit]
+
+    # Fungsi untuk mengambil satu halaman baris terpilih (opsional terurut),
+    # hanya baris yang terlihat dan kolom yang dipilih yang dibentuk
+    def page(self, selection, columns, offset, limit, sort_column=None, ascending=True):
+        if sort_column is None:
+            rows = self._page_rows(selection, offset, limit)
+        else:
+            # Telusuri urutan per blok sampai isi halaman terkumpul
+            order = self._sort_order(sort_column, ascending)
+            mask = selection_rows_mask(selection, self.rows)
+            found = []
+            needed = offset + limit
+            seen = 0
+            for start in range(0, len(order), PAGE_SCAN_BLOCK):
+                block = order[start:start + PAGE_SCAN_BLOCK]
+                block = block[mask[block]]
+                found.append(block)
+                seen += len(block)
+                if seen >= needed:
+                    break
+            rows = np.concatenate(found)[offset:needed] if found else np.array([], dtype=np.int64)
+
+        positions = self.df.columns.get_indexer(list(dict.fromkeys(columns)))
+        return self.df.iloc[rows, positions]
+
+    # Fungsi untuk mengambil baris terpilih, hanya untuk kolom yang dibutuhkan.
+    # Hasilnya didaftarkan dengan identitas (dataset, seleksi, kolom) agar cache
+    # turunan pada hasil filter tidak meng-hash ulang isinya setiap rerun.
+    def take(self, selection, columns=None):
+        columns = list(dict.fromkeys(columns)) if columns is not None else list(self.df.columns)
+        token = dataset_token('take', dataset_fingerprint(self.df), selection_key(selection, self.rows),
+                              tuple(columns))
+        if self.count(selection) == self.rows:
+            return register_dataset(self.df[columns], token)
+        positions = self.df.columns.get_indexer(columns)
+        return register_dataset(self.df.iloc[self.row_ids(selection), positions], token)
+
+
+# Fungsi untuk ringkasan isi seleksi (dipakai sebagai bagian kunci cache hasil terfilter)
+def selection_digest(selection):
+    return hashlib.sha1(np.ascontiguousarray(selection).tobytes()).hexdigest()
+
+
+# Fungsi untuk posisi baris dari bitset seleksi dataset berukuran row_count
+def selection_rows(selection, row_count):
+    return np.flatnonzero(np.unpackbits(selection, count=row_count))
+
+
+# Fungsi untuk mask boolean per baris dari bitset seleksi
+def selection_rows_mask(selection, row_count):
+    return np.unpackbits(selection, count=row_count).view(bool)
+
+
+# Fungsi untuk bagian kunci cache sebuah seleksi: None jika tanpa seleksi atau semua
+# baris terpilih (hasilnya sama dengan dataset penuh), selain itu ringkasan isinya
+def selection_key(selection, row_count):
+    if selection is None or int(_POPCOUNT[selection].sum()) == row_count:
+        return None
+    return selection_digest(selection)
+
+
+# Fungsi untuk mengambil indeks filter dataset (dibuat sekali per sidik jari)
+def get_filter_index(df):
+    key = dataset_fingerprint(df)
+    index = _index_cache.get(key)
+    if index is None:
+        index = _index_cache.set(key, FilterIndex(df))
+    return index
@@ -0,0 +1,169 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Semua cache turunan yang dibuat, untuk statistik hit/miss
+_caches = []
+
+# Identitas tetap per objek DataFrame yang didaftarkan saat dimuat:
+# {id(df): (weakref, struktur, token)}, dihapus otomatis saat objeknya dibuang
+_identities = {}
+
+# Hash daftar kategori per objek Index kategori. Index pandas tidak bisa diubah,
+# jadi hash-nya aman diingat selama objeknya hidup.
+_category_digests = {}
+
+
+# Fungsi untuk membuat token identitas dataset dari bagian-bagian penentunya
+# (misalnya hash file sumber dan kolom yang dibaca)
+def dataset_token(*parts):
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+# Fungsi untuk memberi DataFrame identitas tetap, sehingga pencarian cache tidak
+# perlu meng-hash isinya. Semua array-nya dijadikan read-only agar perubahan di
+# tempat (df.loc[...] = ...) gagal alih-alih membuat sidik jari usang; kolom yang
+# diganti atau ditambah terdeteksi dari struktur blok dan sidik jarinya kembali
+# di-hash dari isi.
+def register_dataset(df, token):
+    for values in df._mgr.arrays:
+        for array in (values, getattr(values, '_ndarray', None), getattr(values, '_data', None),
+                      getattr(values, '_mask', None)):
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+
+    key = id(df)
+    _identities[key] = (weakref.ref(df, lambda _, key=key: _identities.pop(key, None)), _structure(df), token)
+    return df
+
+
+# Struktur DataFrame: objek index, kolom, dan array setiap blok (berubah jika
+# kolom diganti, ditambah, atau dihapus)
+def _structure(df):
+    return (df.index, df.columns, *df._mgr.arrays)
+
+
+def _registered_token(df):
+    identity = _identities.get(id(df))
+    if identity is None or identity[0]() is not df:
+        return None
+
+    structure = _structure(df)
+    if len(structure) == len(identity[1]) and all(a is b for a, b in zip(structure, identity[1])):
+        return identity[2]
+    _identities.pop(id(df), None)
+    return None
+
+
+# Fungsi untuk membuat sidik jari DataFrame. DataFrame yang didaftarkan saat dimuat
+# (register_dataset) memakai token identitasnya. DataFrame lain di-hash dari isinya:
+# bentuk, nama kolom, tipe, index, dan semua nilai setiap kolom, sehingga dua dataset
+# yang berbeda satu nilai pun mendapat sidik jari berbeda. Kolom numerik di-hash
+# langsung dari byte array-nya (tanpa konversi per nilai), kolom kategori dari kode
+# integer ditambah hash kategorinya.
+def dataset_fingerprint(df):
+    token = _registered_token(df)
+    if token is not None:
+        return token
+
+    digest = hashlib.sha1()
+    digest.update(repr(df.shape).encode())
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode())
+
+    if isinstance(df.index, pd.RangeIndex):
+        digest.update(repr((df.index.start, df.index.stop, df.index.step)).encode())
+    else:
+        digest.update(_values_bytes(df.index))
+
+    for _, values in df.items():
+        dtype = values.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            digest.update(_values_bytes(values.cat.codes))
+            digest.update(_category_digest(dtype.categories))
+            digest.update(b'ordered' if dtype.ordered else b'unordered')
+        else:
+            digest.update(_values_bytes(values))
+
+    return digest.hexdigest()
+
+
+# Fungsi untuk byte isi satu kolom/index: array numpy numerik dipakai apa adanya,
+# tipe lain (object, extension array) lewat pd.util.hash_pandas_object
+def _values_bytes(values):
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biufcmM':
+        return np.ascontiguousarray(values.to_numpy()).view(np.uint8)
+    if isinstance(values, pd.Index):
+        return pd.util.hash_pandas_object(values).to_numpy()
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _category_digest(categories):
+    key = id(categories)
+    memo = _category_digests.get(key)
+    if memo is not None and memo[0]() is categories:
+        return memo[1]
+
+    category_digest = hashlib.sha1(_values_bytes(categories)).digest()
+    _category_digests[key] = (weakref.ref(categories, lambda _, key=key: _category_digests.pop(key, None)),
+                              category_digest)
+    return category_digest
+
+
+# Cache LRU sederhana untuk hasil turunan dataset (tipe kolom, profil, agregasi).
+# Jumlah hit/miss dihitung untuk panel performa. Aman dipakai dari beberapa thread
+# (sesi Streamlit dan thread pemanasan cache).
+class BoundedCache:
+    def __init__(self, max_size=16, name=None):
+        self.max_size = max_size
+        self.name = name or f"cache_{len(_caches)}"
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+# Fungsi untuk statistik semua cache turunan: {nama: {hits, misses, size}}
+def cache_stats():
+    return {cache.name: {'hits': cache.hits, 'misses': cache.misses, 'size': len(cache)}
+            for cache in _caches}
+
+
+# Fungsi untuk mengosongkan semua cache turunan yang terdaftar beserta memo hash
+# kategori, misalnya agar benchmark mengukur kondisi dingin
+def clear_caches():
+    for cache in _caches:
+        cache.clear()
+    _category_digests.clear()
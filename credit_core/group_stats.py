@@ -0,0 +1,148 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .column_types import identify_column_types
+from .contingency import contingency_table
+from .filter_index import selection_key, selection_rows
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .grouping import REPAYMENT_COLUMN, factorize_groups, select_groups
+from .multi_hot import array_contingency_table
+from .quantile_sketch import EXACT_LIMIT, get_sketches
+
+# Statistik yang dihitung per grup, urutannya mengikuti DataFrame.describe()
+SUMMARY_STATS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+# Jumlah kolom yang diproses sekaligus agar memori tetap terbatas
+COLUMN_BLOCK = 8
+
+MAX_CACHED_SUMMARIES = 32
+
+_summary_cache = BoundedCache(MAX_CACHED_SUMMARIES, 'group_summary')
+
+
+# Fungsi untuk mengambil blok kolom sebagai matriks float64 terurut per grup
+def _sorted_block(df, columns, order):
+    block = np.empty((len(order), len(columns)), dtype=np.float64)
+    for i, column in enumerate(columns):
+        values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        block[:, i] = values[order]
+    return block
+
+
+# Fungsi untuk menghitung statistik satu grup (irisan baris) untuk semua kolom di blok.
+# Kuartil bisa diberikan dari sketch; jika tidak, dihitung eksak.
+def _summarize_slice(values, quartiles=None):
+    with warnings.catch_warnings():
+        # Kolom yang seluruhnya kosong di grup ini menghasilkan NaN
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        if quartiles is None:
+            quartiles = np.nanpercentile(values, [25, 50, 75], axis=0)
+        return {
+            'count': (~np.isnan(values)).sum(axis=0).astype(np.float64),
+            'mean': np.nanmean(values, axis=0),
+            'std': np.nanstd(values, axis=0, ddof=1),
+            'min': np.nanmin(values, axis=0),
+            '25%': quartiles[0],
+            '50%': quartiles[1],
+            '75%': quartiles[2],
+            'max': np.nanmax(values, axis=0),
+        }
+
+
+# Fungsi untuk menghitung statistik deskriptif semua kolom numerik per grup dalam satu kali jalan,
+# opsional hanya untuk baris seleksi filter (di-cache per isi seleksi).
+# Hasil: {kolom: DataFrame (index = grup, kolom = SUMMARY_STATS)}
+def grouped_numeric_summary(df, group_column=REPAYMENT_COLUMN, columns=None, selection=None):
+    if columns is None:
+        column_types = identify_column_types(df)
+        columns = [col for col, type_ in column_types.items()
+                   if type_ == 'numeric' and col != group_column]
+    columns = list(columns)
+
+    scope = selection_key(selection, len(df))
+    key = (dataset_fingerprint(df), scope, group_column, tuple(columns))
+    summary = _summary_cache.get(key)
+    if summary is not None:
+        return summary
+
+    groups = factorize_groups(df, group_column)
+    if scope is not None:
+        groups = select_groups(groups, selection_rows(selection, len(df)), len(df))
+    summary = {}
+
+    for block_start in range(0, len(columns), COLUMN_BLOCK):
+        block_columns = columns[block_start:block_start + COLUMN_BLOCK]
+        block = _sorted_block(df, block_columns, groups['order'])
+
+        per_group = []
+        for label, start, end in zip(groups['labels'], groups['starts'], groups['ends']):
+            quartiles = None
+            if end - start > EXACT_LIMIT and scope is None:
+                # Grup besar: kuartil dari sketch KLL per (kolom, grup) yang di-cache.
+                # Sketch dibuat untuk dataset penuh, jadi seleksi memakai kuartil eksak.
+                quartiles = np.column_stack([
+                    get_sketches(df, column, group_column)['groups'][label].quantile([0.25, 0.5, 0.75])
+                    for column in block_columns
+                ])
+            per_group.append(_summarize_slice(block[start:end], quartiles))
+
+        for i, column in enumerate(block_columns):
+            summary[column] = pd.DataFrame(
+                [[stats[stat][i] for stat in SUMMARY_STATS] for stats in per_group],
+                index=pd.Index(groups['labels'], name=group_column),
+                columns=SUMMARY_STATS,
+            )
+
+    return _summary_cache.set(key, summary)
+
+
+# Fungsi pengganti groupby(...).describe() untuk satu kolom numerik
+def describe_by_group(df, column, group_column=REPAYMENT_COLUMN, selection=None):
+    stats = grouped_numeric_summary(df, group_column, [column], selection)[column]
+    return stats[stats['count'] > 0].sort_index()
+
+
+# Fungsi untuk mendapatkan perbandingan dengan status pembayaran
+def get_comparison_with_repayment(df, column, column_type, repayment_column=REPAYMENT_COLUMN):
+    if column_type == 'categorical':
+        # Tabel kontingensi dihitung sekali untuk nilai absolut dan persentase
+        table = contingency_table(df, column, repayment_column)
+
+        return {
+            'absolute': table['absolute'],
+            'percentage': table['row_percentage']
+        }
+
+    elif column_type == 'array':
+        # Setiap elemen array dihitung terpisah (satu baris bisa masuk ke beberapa elemen)
+        table = array_contingency_table(df, column, repayment_column)
+
+        return {
+            'absolute': table['absolute'],
+            'percentage': table['row_percentage']
+        }
+
+    elif column_type == 'numeric':
+        # Statistik per status pembayaran diambil dari ringkasan semua kolom numerik
+        summary = grouped_numeric_summary(df, repayment_column)
+        if column not in summary:
+            summary = grouped_numeric_summary(df, repayment_column, [column])
+
+        stats = {}
+        for status, row in summary[column].iterrows():
+            if row['count'] == 0:
+                continue
+
+            stats[status] = {
+                'count': int(row['count']),
+                'min': float(row['min']),
+                'max': float(row['max']),
+                'mean': float(row['mean']),
+                'median': float(row['50%'])
+            }
+
+        return stats
+
+    return None
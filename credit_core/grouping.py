@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from .fingerprint import BoundedCache, dataset_fingerprint
+
+REPAYMENT_COLUMN = 'farmer_repayment_status'
+
+MAX_CACHED_GROUPINGS = 32
+
+_group_cache = BoundedCache(MAX_CACHED_GROUPINGS, 'grouping')
+
+
+# Fungsi untuk memfaktorisasi kolom grup sekali per dataset.
+# Hasilnya: label grup (urutan kemunculan), urutan baris terurut per grup,
+# dan batas awal/akhir tiap grup di urutan tersebut.
+def factorize_groups(df, group_column=REPAYMENT_COLUMN):
+    key = (dataset_fingerprint(df), group_column)
+    groups = _group_cache.get(key)
+    if groups is not None:
+        return groups
+
+    codes, labels = pd.factorize(df[group_column], sort=False)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+
+    # Baris dengan grup kosong (kode -1) berada di awal dan dilewati
+    starts = np.searchsorted(sorted_codes, np.arange(len(labels)), side='left')
+    ends = np.searchsorted(sorted_codes, np.arange(len(labels)), side='right')
+
+    groups = {
+        'labels': list(labels),
+        'order': order,
+        'starts': starts,
+        'ends': ends,
+    }
+    return _group_cache.set(key, groups)
+
+
+# Fungsi untuk membatasi faktorisasi grup ke posisi baris tertentu tanpa
+# memfaktorisasi ulang: urutan per grup disaring, lalu batas grup digeser.
+# Label tetap sama dengan dataset penuh (grup tanpa baris terpilih menjadi kosong).
+def select_groups(groups, rows, row_count):
+    mask = np.zeros(row_count, dtype=bool)
+    mask[rows] = True
+    keep = mask[groups['order']]
+    kept_before = np.concatenate([[0], np.cumsum(keep)])
+
+    return {
+        'labels': groups['labels'],
+        'order': groups['order'][keep],
+        'starts': kept_before[groups['starts']],
+        'ends': kept_before[groups['ends']],
+    }
+
+
+# Fungsi untuk mengambil nilai numerik kolom sebagai array float64 (tanpa NaN)
+def numeric_values(values):
+    values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[~np.isnan(values)]
+
+
+# Fungsi untuk membagi nilai kolom per grup memakai faktorisasi yang di-cache.
+# Tanpa kolom grup, seluruh kolom menjadi satu grup bernama sesuai kolomnya.
+# Dengan rows, hanya posisi baris tersebut yang diambil.
+def group_slices(df, column, group_column=None, rows=None):
+    if group_column is None:
+        return [(column, numeric_values(df[column] if rows is None else df[column].iloc[rows]))]
+
+    groups = factorize_groups(df, group_column)
+    if rows is not None:
+        groups = select_groups(groups, rows, len(df))
+    values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[groups['order']]
+
+    slices = []
+    for label, start, end in zip(groups['labels'], groups['starts'], groups['ends']):
+        group_values = values[start:end]
+        slices.append((label, group_values[~np.isnan(group_values)]))
+    return slices
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+from .filter_index import selection_key, selection_rows
+from .fingerprint import BoundedCache, dataset_fingerprint
+
+# Jumlah nilai teratas yang ditampilkan di grafik; sisanya digabung ke OTHER_LABEL
+TOP_K = 20
+
+# Jumlah counter Space-Saving per kolom saat streaming (lebih besar dari TOP_K agar
+# nilai teratas tetap akurat)
+SPACE_SAVING_CAPACITY = 200
+
+OTHER_LABEL = 'Lainnya'
+
+# Batas jumlah pilihan nilai di widget filter (nilai terbanyak ditampilkan dulu)
+MAX_WIDGET_OPTIONS = 50
+
+MAX_CACHED_SUMMARIES = 64
+
+_top_cache = BoundedCache(MAX_CACHED_SUMMARIES, 'heavy_hitters')
+
+
+# Ringkasan Space-Saving yang bisa digabung (mergeable): paling banyak `capacity`
+# nilai disimpan beserta jumlah (batas atas) dan error-nya. Setiap nilai dengan
+# frekuensi di atas total/capacity dijamin ada di ringkasan.
+class SpaceSaving:
+    def __init__(self, capacity=SPACE_SAVING_CAPACITY):
+        self.capacity = capacity
+        self.total = 0
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+
+    # Jumlah minimum yang bisa dimiliki nilai yang tidak tercatat
+    def _floor(self):
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    # Fungsi untuk menggabungkan ringkasan lain: nilai yang tidak ada di salah satu
+    # ringkasan dianggap bernilai minimum ringkasan itu, lalu hanya `capacity` teratas disimpan
+    def merge(self, other):
+        floor, other_floor = self._floor(), other._floor()
+        counts = self.counts.add(other.counts, fill_value=0)
+        errors = self.errors.add(other.errors, fill_value=0)
+        if floor:
+            missing = ~counts.index.isin(self.counts.index)
+            counts[missing] += floor
+            errors[missing] += floor
+        if other_floor:
+            missing = ~counts.index.isin(other.counts.index)
+            counts[missing] += other_floor
+            errors[missing] += other_floor
+
+        keep = counts.sort_values(ascending=False, kind='stable').index[:self.capacity]
+        self.counts = counts[keep].astype(np.int64)
+        self.errors = errors[keep].astype(np.int64)
+        self.total += other.total
+        return self
+
+    # Fungsi untuk menambahkan satu batch nilai (nilai kosong diabaikan). Batch
+    # diringkas secara eksak lalu digabung; nilai batch yang tidak masuk `capacity`
+    # teratas terwakili oleh jumlah minimum ringkasan batch saat penggabungan.
+    def update(self, values):
+        return self.update_counts(pd.Series(values).value_counts())
+
+    # Fungsi untuk menambahkan jumlah per nilai yang sudah dihitung (Series nilai -> jumlah)
+    def update_counts(self, batch_counts):
+        batch_counts = batch_counts[batch_counts > 0].sort_values(ascending=False, kind='stable')
+        batch = SpaceSaving(self.capacity)
+        batch.total = int(batch_counts.sum())
+        batch.counts = batch_counts.iloc[:self.capacity].astype(np.int64)
+        batch.counts.index = batch.counts.index.map(str)
+        batch.errors = pd.Series(0, index=batch.counts.index, dtype=np.int64)
+        return self.merge(batch)
+
+    # Fungsi untuk k nilai teratas: daftar (nilai, perkiraan jumlah, error)
+    def top(self, k=TOP_K):
+        order = self.counts.sort_values(ascending=False, kind='stable').index[:k]
+        return [(value, int(self.counts[value]), int(self.errors[value])) for value in order]
+
+
+# Fungsi untuk kode kamus kolom (-1 = kosong) beserta daftar nilainya
+def dictionary_codes(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values)
+
+
+# Fungsi untuk k nilai teratas secara eksak dari kode kamus (np.bincount + argpartition).
+# Baris di luar k teratas dijumlahkan ke bucket "Lainnya".
+def top_values(values, k=TOP_K):
+    codes, labels = dictionary_codes(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+    observed = np.flatnonzero(counts)
+
+    if len(observed) > k:
+        top = observed[np.argpartition(-counts[observed], k - 1)[:k]]
+    else:
+        top = observed
+    top = top[np.lexsort((top, -counts[top]))]
+
+    return {
+        'values': [labels[i] for i in top],
+        'counts': counts[top],
+        'other': int(counts.sum() - counts[top].sum()),
+        'other_unique': int(len(observed) - len(top)),
+        'unique': int(len(observed)),
+        'missing': int((codes < 0).sum()),
+    }
+
+
+# Fungsi untuk ringkasan nilai teratas satu kolom, opsional hanya untuk baris seleksi
+# filter (di-cache per sidik jari dataset dan isi seleksi)
+def get_top_values(df, column, k=TOP_K, selection=None):
+    scope = selection_key(selection, len(df))
+    key = (dataset_fingerprint(df), scope, column, k)
+    summary = _top_cache.get(key)
+    if summary is None:
+        values = df[column] if scope is None else df[column].iloc[selection_rows(selection, len(df))]
+        summary = _top_cache.set(key, top_values(values, k))
+    return summary
+
+
+# Fungsi untuk daftar pilihan widget yang dibatasi: nilai terbanyak dulu, paling
+# banyak `limit` pilihan. Hasil kedua menandai apakah masih ada nilai lain.
+def bounded_options(df, column, limit):
+    summary = get_top_values(df, column, limit)
+    return summary['values'], summary['other_unique'] > 0
@@ -0,0 +1,298 @@
+import argparse
+import glob
+import os
+import pickle
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: hanya thread dalam satu proses yang saling dikunci
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import apply_schema
+from .dataset_cache import PARQUET_AVAILABLE, content_hash
+from .grouping import REPAYMENT_COLUMN
+from .streaming import accumulate_chunk, finish_stream_state, new_stream_state
+
+# Folder penyimpanan riwayat dataset yang ditambah per batch
+STORE_DIR = os.environ.get('CREDIT_SCORE_STORE_DIR', 'data_store')
+
+# Kolom identitas petani; baris dengan kode dan isi yang sama dianggap duplikat
+DEDUPE_COLUMN = 'farmer_code'
+
+STATE_FILE = 'state.pkl'
+LOCK_FILE = 'state.lock'
+STATE_VERSION = 3
+
+
+# Penyimpanan dataset inkremental: setiap batch baru dideduplikasi terhadap
+# riwayat, digabung ke agregat yang bisa di-merge (profil kolom, sketch kuantil,
+# statistik per status, jumlah pasangan untuk tabel kontingensi), lalu ditulis
+# sebagai part Parquet baru. Riwayat lama tidak pernah dibaca ulang, sehingga
+# waktu refresh sebanding dengan ukuran batch. Kunci baris setiap batch disimpan
+# di file .npy sendiri (hanya ditambah), state hanya mencatat daftar file-nya.
+# Beberapa proses boleh memakai folder yang sama: append memegang kunci file,
+# membaca ulang state terbaru, baru kemudian menggabungkan batch-nya.
+class IncrementalStore:
+    def __init__(self, directory=STORE_DIR, group_column=REPAYMENT_COLUMN):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._result = None
+        self._stamp = None
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._loaded_key_files = 0
+        self.state = self._read_state() or {
+            'version': STATE_VERSION,
+            'columns': None,
+            'rows': 0,
+            'key_files': [],
+            'batches': [],
+            'stream': new_stream_state(group_column),
+        }
+        self._load_keys()
+
+    @property
+    def rows(self):
+        return self.state['rows']
+
+    @property
+    def batches(self):
+        return list(self.state['batches'])
+
+    def _state_path(self):
+        return os.path.join(self.directory, STATE_FILE)
+
+    # Fungsi untuk penanda versi file state (mtime dan ukuran), None jika belum ada
+    def _state_stamp(self):
+        try:
+            stat = os.stat(self._state_path())
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_state(self):
+        stamp = self._state_stamp()
+        try:
+            with open(self._state_path(), 'rb') as f:
+                state = pickle.load(f)
+        except OSError:
+            return None
+        if state.get('version') == 2:
+            state = self._migrate_v2(state)
+        elif state.get('version') != STATE_VERSION:
+            raise ValueError(f"Versi penyimpanan tidak didukung: {state.get('version')}")
+        self._stamp = stamp
+        return state
+
+    # Fungsi untuk mengubah state versi 2 (semua kunci di dalam state.pkl) ke versi 3:
+    # kunci lama dipindah ke satu file kunci
+    def _migrate_v2(self, state):
+        state = dict(state, version=STATE_VERSION, key_files=[])
+        keys = state.pop('keys')
+        if len(keys):
+            state['key_files'].append(self._write_keys(keys, 0))
+        return state
+
+    # Fungsi untuk memuat state terbaru jika file-nya sudah diubah proses lain
+    # (force: selalu baca ulang, dipakai saat memegang kunci)
+    def _reload(self, force=False):
+        if not force and self._state_stamp() == self._stamp:
+            return
+        state = self._read_state()
+        if state is not None:
+            self.state = state
+            self._result = None
+            self._load_keys()
+
+    # Fungsi untuk menambahkan kunci dari file kunci yang belum dimuat ke array kunci terurut
+    def _load_keys(self):
+        for relative_path in self.state['key_files'][self._loaded_key_files:]:
+            keys = np.load(os.path.join(self.directory, relative_path))
+            self._keys = _insert_sorted(self._keys, keys)
+            self._loaded_key_files += 1
+
+    def _write_state(self):
+        path = self._state_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self.state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._stamp = self._state_stamp()
+
+    def _write_keys(self, keys, number):
+        path = os.path.join(self.directory, 'keys', f"keys-{number:05d}.npy")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.sort(keys))
+        os.replace(tmp_path, path)
+        return os.path.relpath(path, self.directory)
+
+    # Kunci eksklusif antar proses selama satu append (dilepas otomatis jika proses mati)
+    @contextmanager
+    def _store_lock(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, LOCK_FILE), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_part(self, batch, number):
+        extension = 'parquet' if PARQUET_AVAILABLE else 'pkl'
+        path = os.path.join(self.directory, 'parts', f"part-{number:05d}.{extension}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        table = apply_schema(batch.reset_index(drop=True))
+        if PARQUET_AVAILABLE:
+            table.to_parquet(tmp_path, index=False)
+        else:
+            table.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+        return os.path.relpath(path, self.directory)
+
+    # Fungsi untuk menambahkan satu batch CSV (path atau buffer upload).
+    # Batch dengan isi yang sama persis dengan batch sebelumnya langsung dilewati.
+    def append(self, source):
+        with self._lock, self._store_lock():
+            self._reload(force=True)
+            digest = content_hash(source)
+            for batch_info in self.state['batches']:
+                if batch_info['sha256'] == digest:
+                    return dict(batch_info, already_ingested=True)
+
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            batch = pd.read_csv(source, thousands=',')
+            batch = self._align_columns(batch)
+
+            keys = row_keys(batch)
+            new_rows = _unseen_rows(keys, self._keys)
+            batch, keys = batch[new_rows], keys[new_rows]
+
+            number = len(self.state['batches']) + 1
+            batch_info = {
+                'sha256': digest,
+                'name': getattr(source, 'name', source if isinstance(source, str) else 'upload'),
+                'rows_added': int(len(batch)),
+                'duplicates': int((~new_rows).sum()),
+                'part': None,
+                'ingested_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            }
+            if len(batch):
+                accumulate_chunk(self.state['stream'], batch)
+                batch_info['part'] = self._write_part(batch, number)
+                self.state['key_files'].append(self._write_keys(keys, number))
+                self.state['rows'] += len(batch)
+
+            self.state['batches'].append(batch_info)
+            self._write_state()
+            self._load_keys()
+            self._result = None
+            return dict(batch_info, already_ingested=False)
+
+    def _align_columns(self, batch):
+        columns = self.state['columns']
+        if columns is None:
+            self.state['columns'] = list(batch.columns)
+            return batch
+        if set(batch.columns) != set(columns):
+            missing = sorted(set(columns) - set(batch.columns))
+            extra = sorted(set(batch.columns) - set(columns))
+            raise ValueError(f"Kolom batch tidak sama dengan riwayat (hilang: {missing}, tambahan: {extra})")
+        return batch[columns]
+
+    # Fungsi untuk hasil agregat dengan format sama seperti stream_profile
+    # (dipakai stream_comparison/stream_histogram dan tampilan profil)
+    def result(self):
+        with self._lock:
+            self._reload()
+        if self._result is None:
+            self._result = finish_stream_state(self.state['stream'])
+        return self._result
+
+    # Fungsi untuk memuat seluruh riwayat sebagai satu DataFrame (untuk filter dan grafik per baris)
+    def load(self, columns=None):
+        with self._lock:
+            self._reload()
+        parts = [os.path.join(self.directory, info['part']) for info in self.state['batches'] if info['part']]
+        if not parts:
+            return pd.DataFrame(columns=columns or self.state['columns'] or [])
+
+        frames = []
+        for path in parts:
+            if path.endswith('.parquet'):
+                frames.append(pd.read_parquet(path, columns=columns))
+            else:
+                frame = pd.read_pickle(path)
+                frames.append(frame[list(columns)] if columns is not None else frame)
+        # Tipe tiap part bisa berbeda (kategori, int/float); skema diterapkan ulang setelah digabung
+        combined = pd.concat([frame.astype({col: object for col in frame.columns
+                                            if isinstance(frame[col].dtype, pd.CategoricalDtype)})
+                              for frame in frames], ignore_index=True)
+        return apply_schema(combined)
+
+
+# Fungsi untuk kunci baris: hash kode petani beserta isi baris. Kode petani
+# sendiri bisa muncul berkali-kali (pinjaman berulang), jadi hanya baris yang
+# identik untuk kode yang sama yang dianggap duplikat. Angka dinormalkan ke
+# float64 agar int/float dari batch berbeda menghasilkan kunci yang sama.
+def row_keys(batch):
+    normalized = {}
+    for column in batch.columns:
+        values = batch[column]
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            values = values.astype(np.float64)
+        normalized[column] = values.astype(str)
+    # Kode petani di depan agar kunci selalu terikat pada identitas petani
+    columns = [DEDUPE_COLUMN] + [col for col in batch.columns if col != DEDUPE_COLUMN] \
+        if DEDUPE_COLUMN in normalized else list(batch.columns)
+    return pd.util.hash_pandas_object(pd.DataFrame(normalized)[columns], index=False).to_numpy()
+
+
+# Fungsi untuk menandai baris yang belum pernah ada (di riwayat maupun sebelumnya di batch yang sama)
+def _unseen_rows(keys, known_keys):
+    positions = np.searchsorted(known_keys, keys)
+    known = (positions < len(known_keys)) & (known_keys[np.minimum(positions, len(known_keys) - 1)] == keys) \
+        if len(known_keys) else np.zeros(len(keys), dtype=bool)
+    first = np.zeros(len(keys), dtype=bool)
+    first[np.unique(keys, return_index=True)[1]] = True
+    return first & ~known
+
+
+# Fungsi untuk menyisipkan kunci baru ke array kunci terurut (salin memori linear, tanpa sort ulang)
+def _insert_sorted(known_keys, keys):
+    keys = np.sort(keys)
+    return np.insert(known_keys, np.searchsorted(known_keys, keys), keys)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tambahkan batch CSV baru ke riwayat dataset inkremental.")
+    parser.add_argument('files', nargs='+', help="File CSV batch baru (glob diperbolehkan)")
+    parser.add_argument('-s', '--store', default=STORE_DIR, help=f"Folder penyimpanan (default: {STORE_DIR})")
+    args = parser.parse_args(argv)
+
+    store = IncrementalStore(args.store)
+    for pattern in args.files:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            start = time.perf_counter()
+            info = store.append(path)
+            status = 'sudah pernah ditambahkan' if info['already_ingested'] else \
+                f"{info['rows_added']:,} baris baru, {info['duplicates']:,} duplikat"
+            print(f"{path}: {status} ({time.perf_counter() - start:.2f} detik)")
+    print(f"Total riwayat: {store.rows:,} baris dari {len(store.batches)} batch")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from .fingerprint import cache_stats
+
+# Folder tujuan file metrik (JSON dan teks Prometheus); jika diisi, metrik selalu dicatat
+METRICS_DIR = os.environ.get('CREDIT_SCORE_METRICS_DIR')
+
+# Awalan nama metrik Prometheus
+METRIC_PREFIX = 'credit_dashboard'
+
+# Recorder aktif per thread (Streamlit menjalankan setiap sesi di thread sendiri)
+_local = threading.local()
+
+
+# Pencatat performa satu kali rerun: waktu dan alokasi memori per bagian,
+# hit/miss cache, dan ukuran payload grafik. Jika tidak aktif semua
+# pemanggilan langsung kembali tanpa biaya.
+class Recorder:
+    def __init__(self, app, enabled=True, trace_memory=False):
+        self.app = app
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.sections = []
+        self.payloads = {}
+        self.cache_events = {}
+        self._depth = 0
+        self._started_tracing = False
+        self._cache_start = cache_stats() if enabled else {}
+        self._start = time.perf_counter()
+        self.timestamp = time.time()
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        _local.recorder = self
+
+    # Bagian yang diukur; bagian bersarang hanya dicatat waktunya
+    @contextmanager
+    def section(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        measure_memory = self.trace_memory and self._depth == 0
+        if measure_memory:
+            memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._depth -= 1
+            entry = {'name': name, 'seconds': seconds}
+            if measure_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                entry['allocated_bytes'] = current - memory_start
+                entry['peak_bytes'] = peak - memory_start
+            self.sections.append(entry)
+
+    # Fungsi untuk memanggil fungsi ber-cache (misalnya st.cache_data) dan mencatat hit/miss.
+    # Badan fungsi memanggil mark_cache_miss(name) sehingga miss terdeteksi.
+    def track_cache(self, name, func, *args, **kwargs):
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        events = self.cache_events.setdefault(name, {'hits': 0, 'misses': 0})
+        misses = events['misses']
+        result = func(*args, **kwargs)
+        if events['misses'] == misses:
+            events['hits'] += 1
+        return result
+
+    def _mark_miss(self, name):
+        if self.enabled:
+            self.cache_events.setdefault(name, {'hits': 0, 'misses': 0})['misses'] += 1
+
+    # Fungsi untuk mencatat ukuran payload grafik yang dikirim ke browser
+    def record_payload(self, name, figure):
+        if not self.enabled:
+            return
+        payload = figure.to_json() if hasattr(figure, 'to_json') else json.dumps(figure, default=str)
+        self.payloads[name] = self.payloads.get(name, 0) + len(payload.encode('utf-8'))
+
+    # Fungsi untuk menutup pencatatan rerun dan menghitung selisih statistik cache
+    def finish(self):
+        if not self.enabled:
+            return self
+        self.total_seconds = time.perf_counter() - self._start
+        caches = {}
+        for name, stats in cache_stats().items():
+            before = self._cache_start.get(name, {'hits': 0, 'misses': 0})
+            caches[name] = {
+                'hits': stats['hits'] - before['hits'],
+                'misses': stats['misses'] - before['misses'],
+                'size': stats['size'],
+            }
+        caches.update({name: dict(events) for name, events in self.cache_events.items()})
+        self.caches = caches
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if getattr(_local, 'recorder', None) is self:
+            _local.recorder = None
+        return self
+
+    def to_dict(self):
+        return {
+            'app': self.app,
+            'timestamp': self.timestamp,
+            'total_seconds': getattr(self, 'total_seconds', None),
+            'sections': self.sections,
+            'caches': getattr(self, 'caches', {}),
+            'payloads': self.payloads,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    # Fungsi untuk format teks eksposisi Prometheus
+    def to_prometheus(self):
+        app = _label(self.app)
+        lines = [
+            f"# HELP {METRIC_PREFIX}_rerun_seconds Durasi total satu rerun.",
+            f"# TYPE {METRIC_PREFIX}_rerun_seconds gauge",
+            f"{METRIC_PREFIX}_rerun_seconds{{app=\"{app}\"}} {getattr(self, 'total_seconds', 0.0):.6f}",
+            f"# HELP {METRIC_PREFIX}_section_seconds Durasi per bagian skrip.",
+            f"# TYPE {METRIC_PREFIX}_section_seconds gauge",
+        ]
+        for entry in self.sections:
+            lines.append(f"{METRIC_PREFIX}_section_seconds{{app=\"{app}\",section=\"{_label(entry['name'])}\"}} "
+                         f"{entry['seconds']:.6f}")
+
+        memory_sections = [entry for entry in self.sections if 'allocated_bytes' in entry]
+        if memory_sections:
+            lines += [f"# HELP {METRIC_PREFIX}_section_peak_bytes Puncak alokasi memori per bagian.",
+                      f"# TYPE {METRIC_PREFIX}_section_peak_bytes gauge"]
+            for entry in memory_sections:
+                lines.append(f"{METRIC_PREFIX}_section_peak_bytes{{app=\"{app}\",section=\"{_label(entry['name'])}\"}} "
+                             f"{entry['peak_bytes']}")
+
+        for kind in ('hits', 'misses'):
+            lines += [f"# HELP {METRIC_PREFIX}_cache_{kind} Jumlah cache {kind} selama rerun.",
+                      f"# TYPE {METRIC_PREFIX}_cache_{kind} gauge"]
+            for name, stats in getattr(self, 'caches', {}).items():
+                lines.append(f"{METRIC_PREFIX}_cache_{kind}{{app=\"{app}\",cache=\"{_label(name)}\"}} {stats[kind]}")
+
+        lines += [f"# HELP {METRIC_PREFIX}_chart_payload_bytes Ukuran JSON grafik yang dikirim ke browser.",
+                  f"# TYPE {METRIC_PREFIX}_chart_payload_bytes gauge"]
+        for name, size in self.payloads.items():
+            lines.append(f"{METRIC_PREFIX}_chart_payload_bytes{{app=\"{app}\",chart=\"{_label(name)}\"}} {size}")
+
+        return '\n'.join(lines) + '\n'
+
+    # Fungsi untuk menulis metrik ke folder (JSON dan .prom) secara atomik
+    def write(self, directory=METRICS_DIR):
+        if not self.enabled or not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        for extension, content in (('json', self.to_json()), ('prom', self.to_prometheus())):
+            path = os.path.join(directory, f"{self.app}.{extension}")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Fungsi untuk menandai miss dari dalam badan fungsi ber-cache (dicatat ke recorder aktif)
+def mark_cache_miss(name):
+    recorder = getattr(_local, 'recorder', None)
+    if recorder is not None:
+        recorder._mark_miss(name)
@@ -0,0 +1,165 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .grouping import REPAYMENT_COLUMN
+
+MISSING_LABEL = 'Missing/Null'
+
+MAX_CACHED_COLUMNS = 32
+
+_multi_hot_cache = BoundedCache(MAX_CACHED_COLUMNS, 'multi_hot')
+
+
+# Fungsi untuk memecah satu nilai "[a, b, c]" menjadi daftar elemen unik.
+# Format JSON dicoba dulu; jika gagal (misalnya repr list Python), dipecah per koma.
+def parse_array(text):
+    text = str(text).strip()
+    try:
+        items = json.loads(text)
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        inner = text[1:-1] if text.startswith('[') and text.endswith(']') else text
+        items = [item.strip().strip('\'"').strip() for item in inner.split(',')]
+    return list(dict.fromkeys(str(item) for item in items if str(item) != ''))
+
+
+# Representasi multi-hot kolom array dalam format CSR: elemen baris i adalah
+# indices[indptr[i]:indptr[i + 1]] (kode ke vocabulary). entry_rows menyimpan
+# nomor baris setiap entri sehingga filter dan pengelompokan cukup satu indeks
+# array diikuti np.bincount.
+class MultiHot:
+    def __init__(self, values):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            codes, uniques = pd.factorize(values)
+        codes = codes.astype(np.int64)
+
+        # Setiap string unik diparse sekali, bukan setiap baris
+        parsed = [parse_array(value) for value in uniques]
+        self.vocabulary = pd.Index(sorted({item for items in parsed for item in items}), dtype=object)
+        positions = {item: i for i, item in enumerate(self.vocabulary)}
+        unique_lengths = np.array([len(items) for items in parsed], dtype=np.int64)
+        unique_indptr = np.concatenate([[0], np.cumsum(unique_lengths)])
+        unique_indices = np.array([positions[item] for items in parsed for item in items], dtype=np.int32)
+
+        self.rows = len(codes)
+        self.missing = codes < 0
+        row_lengths = np.where(self.missing, 0, unique_lengths[np.maximum(codes, 0)] if len(uniques) else 0)
+        self.indptr = np.concatenate([[0], np.cumsum(row_lengths)])
+        self.entry_rows = np.repeat(np.arange(self.rows), row_lengths)
+        offsets = np.arange(len(self.entry_rows)) - self.indptr[self.entry_rows]
+        self.indices = unique_indices[unique_indptr[codes[self.entry_rows]] + offsets]
+
+    # Fungsi untuk daftar elemen satu baris
+    def row(self, i):
+        return list(self.vocabulary[self.indices[self.indptr[i]:self.indptr[i + 1]]])
+
+    def _entries(self, rows):
+        if rows is None:
+            return self.indices, self.entry_rows
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[rows] = True
+        keep = mask[self.entry_rows]
+        return self.indices[keep], self.entry_rows[keep]
+
+    # Fungsi untuk jumlah baris yang memuat setiap elemen (opsional hanya baris terpilih)
+    def element_counts(self, rows=None):
+        indices, _ = self._entries(rows)
+        return np.bincount(indices, minlength=len(self.vocabulary))
+
+    # Fungsi untuk matriks jumlah elemen x grup dari kode grup per baris (-1 dilewati)
+    def element_group_counts(self, group_codes, n_groups, rows=None):
+        indices, entry_rows = self._entries(rows)
+        entry_groups = group_codes[entry_rows]
+        valid = entry_groups >= 0
+        flat = indices[valid].astype(np.int64) * n_groups + entry_groups[valid]
+        return np.bincount(flat, minlength=len(self.vocabulary) * n_groups).reshape(len(self.vocabulary), n_groups)
+
+
+# Fungsi untuk mengambil representasi multi-hot kolom (diparse sekali per sidik jari dataset)
+def get_multi_hot(df, column):
+    key = (dataset_fingerprint(df), column)
+    multi_hot = _multi_hot_cache.get(key)
+    if multi_hot is None:
+        multi_hot = _multi_hot_cache.set(key, MultiHot(df[column]))
+    return multi_hot
+
+
+def _row_count(multi_hot, rows):
+    return multi_hot.rows if rows is None else len(rows)
+
+
+def _missing_count(multi_hot, rows):
+    return int(multi_hot.missing.sum() if rows is None else multi_hot.missing[rows].sum())
+
+
+# Fungsi untuk statistik per elemen kolom array (format sama dengan get_categorical_stats).
+# Persentase dihitung terhadap jumlah baris, sehingga totalnya bisa lebih dari 100%.
+def get_array_stats(df, column, rows=None):
+    multi_hot = get_multi_hot(df, column)
+    counts = multi_hot.element_counts(rows)
+    total = _row_count(multi_hot, rows)
+    missing = _missing_count(multi_hot, rows)
+
+    order = np.argsort(-counts, kind='stable')
+    stats = [{'value': str(multi_hot.vocabulary[i]), 'count': int(counts[i]),
+              'percentage': round(counts[i] / total * 100, 2) if total else 0.0}
+             for i in order if counts[i] > 0]
+    if missing:
+        stats.append({'value': MISSING_LABEL, 'count': missing,
+                      'percentage': round(missing / total * 100, 2)})
+        stats.sort(key=lambda stat: stat['count'], reverse=True)
+    return stats
+
+
+# Fungsi untuk tabel distribusi elemen (kolom sama dengan value_distribution).
+# Persentase dihitung terhadap jumlah baris seperti get_array_stats.
+def array_value_distribution(df, column, rows=None):
+    multi_hot = get_multi_hot(df, column)
+    counts = multi_hot.element_counts(rows)
+    present = counts > 0
+    table = pd.DataFrame({'Nilai': multi_hot.vocabulary[present], 'Jumlah': counts[present]})
+    table = table.sort_values('Jumlah', ascending=False, kind='stable').reset_index(drop=True)
+
+    total = _row_count(multi_hot, rows)
+    table['Persentase'] = (table['Jumlah'] / total * 100).round(2) if total else 0.0
+    return table
+
+
+# Fungsi untuk tabel elemen x status (format sama dengan contingency_table).
+# Satu baris dihitung sekali untuk setiap elemen yang dimuatnya; persentase kolom
+# dihitung terhadap jumlah baris per status.
+def array_contingency_table(df, column, group_column=REPAYMENT_COLUMN, rows=None):
+    multi_hot = get_multi_hot(df, column)
+    group_codes, group_labels = pd.factorize(df[group_column], sort=True)
+    counts = multi_hot.element_group_counts(group_codes, len(group_labels), rows)
+
+    selected_codes = group_codes if rows is None else group_codes[rows]
+    group_rows = np.bincount(selected_codes[selected_codes >= 0], minlength=len(group_labels))
+
+    keep_rows = counts.sum(axis=1) > 0
+    keep_cols = group_rows > 0
+    counts = counts[keep_rows][:, keep_cols]
+    group_rows = group_rows[keep_cols]
+
+    index = pd.Index(multi_hot.vocabulary[keep_rows], name=column)
+    columns = pd.Index(np.asarray(group_labels)[keep_cols], name=group_column)
+    row_totals = counts.sum(axis=1)
+    total = int(group_rows.sum())
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'absolute': pd.DataFrame(counts, index=index, columns=columns),
+            'row_percentage': pd.DataFrame(counts / row_totals[:, None] * 100, index=index, columns=columns),
+            'column_percentage': pd.DataFrame(counts / group_rows[None, :] * 100, index=index, columns=columns),
+            'total_percentage': pd.DataFrame(counts / total * 100 if total else counts * 0.0,
+                                             index=index, columns=columns),
+            'row_totals': pd.Series(row_totals, index=index, name='All'),
+            'column_totals': pd.Series(group_rows, index=columns, name='All'),
+            'total': total,
+        }
@@ -0,0 +1,135 @@
+import numpy as np
+
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .grouping import group_slices
+
+# Galat rank default sketch kuantil (1% dari jumlah data)
+DEFAULT_EPSILON = 0.01
+
+# Di bawah jumlah data ini sketch menyimpan semua nilai dan kuantil dihitung eksak
+EXACT_LIMIT = 100000
+
+# Rasio kapasitas antar level compactor KLL
+LEVEL_RATIO = 2 / 3
+
+MAX_CACHED_SKETCHES = 64
+
+_sketch_cache = BoundedCache(MAX_CACHED_SKETCHES, 'sketches')
+
+
+# Sketch kuantil KLL yang bisa digabung (mergeable). Nilai di level h
+# mewakili 2^h nilai asli; level yang penuh diurutkan lalu separuh isinya
+# (posisi ganjil atau genap secara acak) dinaikkan ke level berikutnya.
+# Selama jumlah data <= exact_limit tidak ada kompaksi dan hasilnya eksak.
+class KLLSketch:
+    def __init__(self, epsilon=DEFAULT_EPSILON, exact_limit=EXACT_LIMIT, seed=0):
+        self.epsilon = epsilon
+        self.k = int(np.ceil(2.0 / epsilon))
+        self.exact_limit = exact_limit
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self):
+        return len(self.levels) == 1
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * LEVEL_RATIO ** depth)))
+
+    def _size(self):
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self):
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _compress(self):
+        if self.is_exact and self.count <= self.exact_limit:
+            return
+
+        while self._size() > self._max_size():
+            for level, items in enumerate(self.levels):
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                items = np.sort(items)
+                # Jumlah ganjil: satu nilai tetap di level ini
+                leftover = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(leftover)]
+                promoted = paired[self._rng.integers(2)::2]
+
+                self.levels[level] = leftover
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                break
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    # Fungsi untuk kuantil (q tunggal atau daftar q). Mode eksak memakai
+    # interpolasi linear seperti np.percentile.
+    def quantile(self, q):
+        scalar = np.ndim(q) == 0
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+
+        if self.count == 0:
+            result = np.full(len(q), np.nan)
+        elif self.is_exact:
+            result = np.quantile(self.levels[0], q)
+        else:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(level_items), 2.0 ** level)
+                                      for level, level_items in enumerate(self.levels)])
+            order = np.argsort(items, kind='stable')
+            items, cumulative = items[order], np.cumsum(weights[order])
+            positions = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+            result = items[np.clip(positions, 0, len(items) - 1)]
+            # Kuantil 0 dan 1 selalu tepat di min dan max
+            result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+
+        return float(result[0]) if scalar else result
+
+
+# Fungsi untuk membangun sketch per grup sekaligus sketch gabungan satu kolom.
+# Dibuat sekali per (sidik jari data, kolom, kolom grup) lalu dipakai ulang.
+def get_sketches(df, column, group_column=None, epsilon=DEFAULT_EPSILON):
+    key = (dataset_fingerprint(df), column, group_column, epsilon)
+    sketches = _sketch_cache.get(key)
+    if sketches is not None:
+        return sketches
+
+    groups = {}
+    combined = KLLSketch(epsilon)
+    for label, values in group_slices(df, column, group_column):
+        sketch = KLLSketch(epsilon).update(values)
+        groups[label] = sketch
+        combined.merge(sketch)
+
+    return _sketch_cache.set(key, {'groups': groups, 'all': combined})
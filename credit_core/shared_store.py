@@ -0,0 +1,236 @@
+import glob
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import suppress
+
+import numpy as np
+import pandas as pd
+
+from .dataset_cache import CACHE_DIR, PARQUET_AVAILABLE, _atomic_write, _cache_key, _cache_name, _resolve_digest, load_cached
+from .fingerprint import dataset_token, register_dataset
+
+# Folder file Arrow yang dipetakan ke memori oleh semua worker
+SHARED_DIR = os.environ.get('CREDIT_SCORE_SHARED_DIR', os.path.join(CACHE_DIR, 'shared'))
+
+# Lama worker menunggu worker lain yang sedang menerbitkan file yang sama
+PUBLISH_WAIT_SECONDS = 30
+PUBLISH_POLL_SECONDS = 0.2
+
+# File kunci yang lebih tua dari ini dianggap milik penerbit yang macet/mati
+STALE_LOCK_SECONDS = 300
+
+# DataFrame yang sudah dipetakan di proses ini, per path file Arrow
+_attached = {}
+_attach_lock = threading.Lock()
+
+
+def _arrow_path(source, digest):
+    return os.path.join(SHARED_DIR, f"{_cache_name(source)}-{_cache_key(digest)}.arrow")
+
+
+# Fungsi untuk mengubah satu kolom pandas menjadi array Arrow. Angka ditulis apa
+# adanya (NaN tetap NaN, tanpa bitmap null) agar bisa dibaca kembali tanpa salinan.
+def _to_arrow(values):
+    import pyarrow as pa
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        indices = pa.array(codes, mask=codes < 0)
+        return pa.DictionaryArray.from_arrays(indices, pa.array(values.cat.categories.to_numpy(dtype=object)))
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return pa.array(values.to_numpy())
+    return pa.array(values.to_numpy(dtype=object), from_pandas=True)
+
+
+# Fungsi untuk menerbitkan DataFrame sebagai file Arrow IPC tanpa kompresi (atomik)
+def publish(df, path):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    table = pa.table({column: _to_arrow(df[column]) for column in df.columns})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def write(tmp_path):
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                # Satu record batch: setiap kolom menjadi satu buffer kontigu di file
+                writer.write_table(table, max_chunksize=max(len(df), 1))
+
+    _atomic_write(path, write)
+
+    # Hapus versi lama dari dataset yang sama
+    prefix = path.rsplit('-', 1)[0]
+    for old_path in glob.glob(f"{glob.escape(prefix)}-{'?' * 16}.arrow"):
+        if old_path != path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+    return path
+
+
+def _from_arrow(column):
+    import pyarrow as pa
+
+    array = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+    if pa.types.is_dictionary(array.type):
+        codes = array.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        return pd.Categorical.from_codes(codes, categories=array.dictionary.to_pandas())
+    if (pa.types.is_integer(array.type) or pa.types.is_floating(array.type)) and array.null_count == 0:
+        # Tampilan langsung ke halaman file yang dipetakan (read-only, tanpa salinan)
+        return array.to_numpy(zero_copy_only=True)
+    return array.to_pandas()
+
+
+# Fungsi untuk memetakan file Arrow ke memori dan membentuk DataFrame di atasnya.
+# Kolom numerik berbagi halaman memori dengan semua proses lain yang memetakan file
+# yang sama; hanya kode kategori dan kolom teks yang disalin.
+def attach(path):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with _attach_lock:
+        df = _attached.get(path)
+        if df is not None:
+            return df
+
+        table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        df = pd.DataFrame({name: _from_arrow(table.column(name)) for name in table.column_names}, copy=False)
+        # Nama file memuat hash isi sumbernya, jadi cukup dipakai sebagai identitas dataset
+        register_dataset(df, dataset_token('arrow', os.path.basename(path)))
+        for old_path in [key for key in _attached if key.rsplit('-', 1)[0] == path.rsplit('-', 1)[0]]:
+            del _attached[old_path]
+        _attached[path] = df
+        return df
+
+
+# Fungsi untuk membuat file kunci penerbitan secara eksklusif. Isinya pid, nama host,
+# waktu pembuatan, dan token acak agar worker lain bisa mengenali kunci yang ditinggal
+# penerbit mati, dan agar setiap kunci bisa dibedakan dari kunci lain di path yang sama.
+# Hasil: isi kunci jika didapat, None jika sudah dipegang worker lain.
+def _acquire_lock(lock_path):
+    try:
+        lock = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return None
+    owner = f"{os.getpid()} {socket.gethostname()} {time.time()} {uuid.uuid4().hex}"
+    with os.fdopen(lock, 'w') as lock_file:
+        lock_file.write(owner)
+    return owner
+
+
+# Fungsi untuk membaca isi dan waktu ubah file kunci (None jika tidak ada)
+def _read_lock(lock_path):
+    try:
+        with open(lock_path) as lock_file:
+            owner = lock_file.read()
+        return owner, os.path.getmtime(lock_path)
+    except FileNotFoundError:
+        return None
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Fungsi untuk mengecek apakah kunci (isi dan waktu ubahnya) ditinggal penerbit yang
+# sudah mati (pid tidak ada lagi di host yang sama) atau sudah terlalu lama
+def _lock_is_stale(owner, modified):
+    fields = owner.split()
+    try:
+        pid, host, created = int(fields[0]), fields[1], float(fields[2])
+    except (IndexError, ValueError):
+        # Penerbit mati sebelum sempat menulis isi kunci
+        return time.time() - modified > PUBLISH_WAIT_SECONDS
+
+    if time.time() - created > STALE_LOCK_SECONDS:
+        return True
+    # Pemeriksaan pid hanya berlaku di host yang sama (os.kill(pid, 0) di Windows mengirim sinyal)
+    return host == socket.gethostname() and os.name != 'nt' and not _pid_alive(pid)
+
+
+# Fungsi untuk memindahkan file kunci ke nama unik lalu memastikan isinya masih kunci
+# yang tadi dinilai basi. Rename bersifat atomik, jadi hanya satu worker yang
+# mendapatkan file itu. Jika ternyata yang terambil adalah kunci baru milik worker lain
+# (kunci basi sudah diganti di antara pemeriksaan dan rename), kunci itu dikembalikan
+# selama belum ada kunci lain di path tersebut.
+def _break_stale_lock(lock_path, stale_owner):
+    claimed_path = f"{lock_path}.{uuid.uuid4().hex}.stale"
+    try:
+        os.rename(lock_path, claimed_path)
+    except FileNotFoundError:
+        return
+    try:
+        with open(claimed_path) as lock_file:
+            owner = lock_file.read()
+        if owner != stale_owner:
+            with suppress(FileExistsError):
+                os.link(claimed_path, lock_path)
+    finally:
+        with suppress(FileNotFoundError):
+            os.remove(claimed_path)
+
+
+# Fungsi untuk melepas kunci hanya jika isinya masih milik worker ini
+def _release_lock(lock_path, owner):
+    lock = _read_lock(lock_path)
+    if lock is not None and lock[0] == owner:
+        with suppress(FileNotFoundError):
+            os.remove(lock_path)
+
+
+# Fungsi untuk mengambil dataset dari penyimpanan bersama. Worker pertama yang
+# tidak menemukan file Arrow menerbitkannya (dijaga file kunci), worker lain
+# menunggu lalu cukup memetakan file yang sama. Kunci milik penerbit yang mati
+# dibongkar (_break_stale_lock) dan penerbitan diambil alih. Jika penerbit lain masih
+# hidup tetapi melewati batas tunggu, worker ini menerbitkan sendiri tanpa kunci:
+# keduanya menulis file yang sama secara atomik, dan hasilnya tetap dipetakan dari
+# file bersama (bukan salinan pribadi yang akan tersimpan selamanya di cache aplikasi).
+def load_shared(source):
+    if not PARQUET_AVAILABLE:
+        return load_cached(source)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    digest = _resolve_digest(source)
+    path = _arrow_path(source, digest)
+    if os.path.exists(path):
+        return attach(path)
+
+    lock_path = f"{path}.lock"
+    deadline = time.monotonic() + PUBLISH_WAIT_SECONDS
+    owner = _acquire_lock(lock_path)
+    while owner is None:
+        if os.path.exists(path):
+            return attach(path)
+        lock = _read_lock(lock_path)
+        if lock is not None and _lock_is_stale(*lock):
+            _break_stale_lock(lock_path, lock[0])
+        elif time.monotonic() >= deadline:
+            break
+        else:
+            time.sleep(PUBLISH_POLL_SECONDS)
+        owner = _acquire_lock(lock_path)
+
+    try:
+        if not os.path.exists(path):
+            publish(load_cached(source), path)
+    finally:
+        if owner is not None:
+            _release_lock(lock_path, owner)
+    return attach(path)
+
+
+# Fungsi untuk mengecek berapa kolom DataFrame yang langsung menunjuk ke memori bersama
+def shared_columns(df):
+    return [column for column in df.columns
+            if isinstance(df[column].to_numpy(), np.ndarray) and not df[column].to_numpy().flags.writeable]
@@ -0,0 +1,370 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .column_types import CATEGORICAL_MAX_UNIQUE
+from .column_profile import PROFILE_BINS
+from .grouping import REPAYMENT_COLUMN
+from .heavy_hitters import TOP_K, SpaceSaving
+from .quantile_sketch import KLLSketch
+
+# Jumlah baris per chunk saat membaca file besar
+CHUNK_SIZE = 100000
+
+# Jumlah maksimum bin halus pada histogram streaming
+MAX_STREAM_BINS = 512
+
+# Kolom dengan nilai unik lebih banyak dari ini berhenti dihitung per nilai (dianggap teks)
+MAX_TRACKED_VALUES = 10000
+
+
+# Akumulator statistik numerik yang bisa digabung (mergeable):
+# momen Welford/Chan, min/max, sketch kuantil KLL, dan histogram halus
+# dengan lebar bin 2^k yang melebar otomatis agar jumlah bin tetap terbatas.
+class NumericAccumulator:
+    def __init__(self):
+        self.sketch = KLLSketch()
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.width = None
+        self.bins = {}
+
+    def _merge_moments(self, count, mean, m2):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    # Lebarkan bin (x2) sampai rentang min-max muat dalam MAX_STREAM_BINS bin
+    def _fit_width(self):
+        if self.width is None:
+            span = self.max - self.min
+            self.width = 2.0 ** np.ceil(np.log2(span / MAX_STREAM_BINS)) if span > 0 else 1.0
+        while np.floor(self.max / self.width) - np.floor(self.min / self.width) + 1 > MAX_STREAM_BINS:
+            self._coarsen()
+
+    def _coarsen(self):
+        self.width *= 2
+        self.bins = _halve_keys(self.bins)
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self.sketch.update(values)
+        batch_mean = values.mean()
+        self._merge_moments(len(values), batch_mean, float(((values - batch_mean) ** 2).sum()))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        self._fit_width()
+        keys, counts = np.unique(np.floor(values / self.width).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.bins[key] = self.bins.get(key, 0) + count
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        self._merge_moments(other.count, other.mean, other.m2)
+        self.sketch.merge(other.sketch)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        other_bins, other_width = dict(other.bins), other.width
+        self._fit_width()
+        while other_width < self.width:
+            other_bins = _halve_keys(other_bins)
+            other_width *= 2
+        while self.width < other_width:
+            self._coarsen()
+        for key, count in other_bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self._fit_width()
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else float('nan')
+
+    def _sorted_bins(self):
+        keys = np.array(sorted(self.bins), dtype=np.int64)
+        counts = np.array([self.bins[key] for key in keys], dtype=np.float64)
+        return keys, counts
+
+    # Fungsi untuk kuantil dari sketch KLL (eksak untuk data kecil)
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    # Fungsi untuk menyusun histogram nbins bin antara min dan max. Jika jumlah per
+    # nilai eksak diberikan (values, counts), hasilnya sama dengan np.histogram pada
+    # data aslinya. Jika tidak, batas bin digeser ke batas bin halus terdekat agar
+    # setiap bin halus masuk utuh ke satu bin (tanpa menebak posisi dari titik tengah).
+    def histogram(self, nbins, exact=None):
+        if self.count == 0:
+            return np.zeros(nbins, dtype=np.int64), np.linspace(0, 1, nbins + 1)
+        edges = np.linspace(self.min, self.max, nbins + 1) if self.max > self.min \
+            else np.linspace(self.min - 0.5, self.max + 0.5, nbins + 1)
+
+        if exact is not None:
+            values, counts = exact
+            return np.histogram(values, bins=edges, weights=counts)[0].astype(np.int64), edges
+
+        keys, counts = self._sorted_bins()
+        if self.max > self.min:
+            edges = np.round(edges / self.width) * self.width
+            edges[0] = np.floor(self.min / self.width) * self.width
+            edges[-1] = (np.floor(self.max / self.width) + 1) * self.width
+            edges = np.maximum.accumulate(edges)
+        positions = np.clip(np.searchsorted(edges, keys * self.width, side='right') - 1, 0, nbins - 1)
+        return np.bincount(positions, weights=counts, minlength=nbins).astype(np.int64), edges
+
+
+def _halve_keys(bins):
+    merged = {}
+    for key, count in bins.items():
+        merged[key // 2] = merged.get(key // 2, 0) + count
+    return merged
+
+
+# Akumulator satu kolom: missing, statistik numerik, peta jumlah per nilai, dan
+# ringkasan Space-Saving yang tetap menyimpan nilai teratas setelah peta jumlah
+# dilepas untuk kolom bernilai unik banyak
+class ColumnAccumulator:
+    def __init__(self):
+        self.rows = 0
+        self.missing = 0
+        self.non_numeric = 0
+        self.numeric = NumericAccumulator()
+        self.value_counts = Counter()
+        self.heavy_hitters = SpaceSaving()
+        self.starts_bracket = False
+        self.ends_bracket = False
+
+    def update(self, values):
+        self.rows += len(values)
+        non_null = values.dropna()
+        self.missing += len(values) - len(non_null)
+
+        if pd.api.types.is_numeric_dtype(non_null) and not pd.api.types.is_bool_dtype(non_null):
+            numbers = non_null.to_numpy(dtype=np.float64)
+            counts = non_null.value_counts()
+        else:
+            # Teks dienkode kamus dulu: parsing angka dan cek format "[...]" cukup
+            # dilakukan sekali per nilai unik, bukan per baris
+            codes, uniques = pd.factorize(non_null)
+            unique_counts = np.bincount(codes, minlength=len(uniques))
+            unique_numbers = pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').to_numpy(
+                dtype=np.float64, na_value=np.nan)
+            numbers = unique_numbers[codes]
+            self.non_numeric += int(unique_counts[np.isnan(unique_numbers)].sum())
+            text = pd.Series(uniques, dtype=object).astype(str)
+            self.starts_bracket = self.starts_bracket or bool(text.str.startswith('[').any())
+            self.ends_bracket = self.ends_bracket or bool(text.str.endswith(']').any())
+            counts = pd.Series(unique_counts, index=uniques)
+        self.numeric.update(numbers)
+
+        self.heavy_hitters.update_counts(counts)
+        if self.value_counts is not None:
+            self.value_counts.update(counts.to_dict())
+            if len(self.value_counts) > MAX_TRACKED_VALUES:
+                self.value_counts = None
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.missing += other.missing
+        self.non_numeric += other.non_numeric
+        self.numeric.merge(other.numeric)
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.starts_bracket = self.starts_bracket or other.starts_bracket
+        self.ends_bracket = self.ends_bracket or other.ends_bracket
+        if self.value_counts is None or other.value_counts is None:
+            self.value_counts = None
+        else:
+            self.value_counts.update(other.value_counts)
+            if len(self.value_counts) > MAX_TRACKED_VALUES:
+                self.value_counts = None
+        return self
+
+    # Fungsi untuk histogram numerik kolom: dari jumlah per nilai jika masih dilacak
+    # (eksak), selain itu dari bin halus NumericAccumulator
+    def histogram(self, nbins):
+        exact = None
+        if self.value_counts is not None:
+            values = pd.to_numeric(pd.Series(list(self.value_counts), dtype=object), errors='coerce')
+            counts = np.fromiter(self.value_counts.values(), dtype=np.float64, count=len(self.value_counts))
+            present = values.notna().to_numpy()
+            exact = (values.to_numpy(dtype=np.float64, na_value=np.nan)[present], counts[present])
+        return self.numeric.histogram(nbins, exact)
+
+    # Tipe kolom dengan aturan yang sama seperti identify_column_types
+    def column_type(self):
+        if self.rows - self.missing == 0:
+            return 'unknown'
+        if self.non_numeric == 0:
+            return 'numeric'
+        if self.starts_bracket and self.ends_bracket:
+            return 'array'
+        if self.value_counts is not None and len(self.value_counts) <= CATEGORICAL_MAX_UNIQUE:
+            return 'categorical'
+        return 'text'
+
+
+# Fungsi untuk membuat state akumulasi kosong (akumulator per kolom, per grup,
+# dan jumlah pasangan nilai-grup). Semua bagiannya bisa digabung, sehingga
+# state yang sama dipakai untuk streaming file besar dan penambahan batch baru.
+def new_stream_state(group_column=REPAYMENT_COLUMN):
+    return {
+        'group_column': group_column,
+        'columns': {},
+        'grouped': {},
+        'pairs': {},
+    }
+
+
+# Fungsi untuk menambahkan satu chunk baris ke state akumulasi
+def accumulate_chunk(state, chunk):
+    group_column = state['group_column']
+    columns, grouped, pairs = state['columns'], state['grouped'], state['pairs']
+    has_group = group_column in chunk.columns
+
+    for column in chunk.columns:
+        columns.setdefault(column, ColumnAccumulator()).update(chunk[column])
+
+        if not has_group or column == group_column:
+            continue
+
+        # Statistik numerik per grup
+        column_groups = grouped.setdefault(column, {})
+        numbers = pd.to_numeric(chunk[column], errors='coerce')
+        for status, values in numbers.groupby(chunk[group_column], sort=False, observed=True):
+            column_groups.setdefault(status, NumericAccumulator()).update(
+                values.to_numpy(dtype=np.float64, na_value=np.nan))
+
+        # Jumlah pasangan (nilai, grup) untuk tabel kontingensi
+        if pairs.get(column, 0) is not None:
+            counts = pairs.setdefault(column, Counter())
+            value_counts = chunk[[column, group_column]].value_counts()
+            counts.update(value_counts[value_counts > 0].to_dict())
+            if len(counts) > MAX_TRACKED_VALUES:
+                pairs[column] = None
+
+    return state
+
+
+# Fungsi untuk melengkapi state dengan profil kolom (format sama seperti build_profile)
+def finish_stream_state(state):
+    return dict(state, profile=_build_stream_profile(state['columns']))
+
+
+# Fungsi untuk membaca file CSV per chunk dan mengakumulasi profil kolom serta
+# perbandingan dengan kolom grup, tanpa pernah memuat seluruh file ke memori.
+def stream_profile(source, group_column=REPAYMENT_COLUMN, chunksize=CHUNK_SIZE):
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+    state = new_stream_state(group_column)
+    for chunk in pd.read_csv(source, chunksize=chunksize, thousands=','):
+        accumulate_chunk(state, chunk)
+
+    return finish_stream_state(state)
+
+
+# Fungsi untuk menyusun profil dengan format yang sama seperti column_profile.build_profile
+def _build_stream_profile(columns):
+    total = next(iter(columns.values())).rows if columns else 0
+    profile_columns = {}
+
+    for column, acc in columns.items():
+        column_type = acc.column_type()
+        entry = {
+            'type': column_type,
+            'count': acc.rows - acc.missing,
+            'missing': acc.missing,
+            'missing_percentage': round(acc.missing / total * 100, 2) if total else 0.0,
+        }
+
+        if column_type == 'numeric':
+            numeric = acc.numeric
+            counts, edges = acc.histogram(PROFILE_BINS)
+            entry['numeric'] = {
+                'count': numeric.count,
+                'min': float(numeric.min) if numeric.count else float('nan'),
+                'max': float(numeric.max) if numeric.count else float('nan'),
+                'mean': float(numeric.mean) if numeric.count else float('nan'),
+                'median': numeric.quantile(0.5),
+                'missing': acc.rows - numeric.count,
+                'bins': [{
+                    'min': float(edges[i]),
+                    'max': float(edges[i + 1]),
+                    'count': int(counts[i])
+                } for i in range(PROFILE_BINS)],
+            }
+        elif column_type in ('categorical', 'array'):
+            value_counts = acc.value_counts.most_common()
+            if acc.missing:
+                value_counts.append(('Missing/Null', acc.missing))
+                value_counts.sort(key=lambda item: item[1], reverse=True)
+            entry['categories'] = [{
+                'value': str(value),
+                'count': int(count),
+                'percentage': round(count / total * 100, 2)
+            } for value, count in value_counts]
+            entry['unique'] = len(acc.value_counts)
+        elif column_type == 'text':
+            # Nilai teratas dari ringkasan Space-Saving (jumlah adalah batas atas)
+            top = acc.heavy_hitters.top(TOP_K)
+            entry['top_values'] = [{'value': value, 'count': count, 'error': error} for value, count, error in top]
+            entry['other'] = max(acc.rows - acc.missing - sum(count for _, count, _ in top), 0)
+            entry['unique'] = len(acc.value_counts) if acc.value_counts is not None else None
+
+        profile_columns[column] = entry
+
+    return {'rows': total, 'columns': profile_columns}
+
+
+# Fungsi untuk histogram kolom numerik dari hasil streaming (format sama dengan histogram_data)
+def stream_histogram(result, column, nbins=20):
+    counts, edges = result['columns'][column].histogram(nbins)
+    return {'column': column, 'edges': edges, 'groups': [column], 'counts': [counts]}
+
+
+# Fungsi perbandingan dengan status pembayaran dari hasil streaming
+# (format sama dengan get_comparison_with_repayment)
+def stream_comparison(result, column, column_type):
+    if column_type == 'categorical':
+        counts = result['pairs'].get(column)
+        if not counts:
+            return None
+
+        table = pd.Series(counts).unstack(fill_value=0).sort_index().sort_index(axis=1)
+        table.index.name = column
+        table.columns.name = result['group_column']
+        percentage = table.div(table.sum(axis=1), axis=0) * 100
+        return {
+            'absolute': table,
+            'percentage': percentage
+        }
+
+    elif column_type == 'numeric':
+        stats = {}
+        for status, acc in result['grouped'].get(column, {}).items():
+            if acc.count == 0:
+                continue
+            stats[status] = {
+                'count': int(acc.count),
+                'min': float(acc.min),
+                'max': float(acc.max),
+                'mean': float(acc.mean),
+                'median': acc.quantile(0.5)
+            }
+        return stats
+
+    return None
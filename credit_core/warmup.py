@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from .association import association_matrix
+from .column_profile import get_profile, value_distribution
+from .column_types import identify_column_types
+from .contingency import contingency_table
+from .dataset_cache import CACHE_DIR
+from .density import grouped_density
+from .filter_index import get_filter_index
+from .fingerprint import dataset_fingerprint
+from .group_stats import get_comparison_with_repayment, grouped_numeric_summary
+from .grouping import REPAYMENT_COLUMN, factorize_groups
+from .heavy_hitters import MAX_WIDGET_OPTIONS, TOP_K, bounded_options
+from .multi_hot import get_multi_hot
+from .woe import woe_iv_table
+
+# Jumlah thread pemanasan cache per proses (dipakai bersama semua penjadwal). Cache
+# turunan hidup di memori proses, jadi dipakai thread (bukan proses); operasi
+# numpy/pandas melepas GIL di bagian beratnya.
+WARMUP_WORKERS = min(4, os.cpu_count() or 1)
+
+# Jumlah dataset yang dipanaskan bersamaan per proses; penjadwal yang lebih lama dibatalkan
+WARMUP_MAX_DATASETS = 2
+
+# Batas kolom yang dipanaskan, agar kolom populer tidak tergusur dari cache LRU
+# (kapasitas cache per kolom seperti sketch dan kontingensi adalah 64 entri)
+WARMUP_MAX_COLUMNS = 40
+
+# File jumlah pemilihan kolom oleh pengguna (dipakai untuk urutan pemanasan)
+POPULARITY_FILE = os.path.join(CACHE_DIR, 'column_popularity.json')
+
+_popularity = None
+_popularity_lock = threading.Lock()
+
+_executor = None
+_schedulers = []
+_scheduler_lock = threading.Lock()
+
+
+def _load_popularity():
+    global _popularity
+    if _popularity is None:
+        try:
+            with open(POPULARITY_FILE) as f:
+                _popularity = Counter(json.load(f))
+        except (OSError, ValueError):
+            _popularity = Counter()
+    return _popularity
+
+
+# Fungsi untuk mencatat satu kali pemilihan kolom (disimpan ke file secara atomik)
+def record_column_use(column):
+    with _popularity_lock:
+        popularity = _load_popularity()
+        popularity[column] += 1
+        try:
+            os.makedirs(os.path.dirname(POPULARITY_FILE) or '.', exist_ok=True)
+            tmp_path = f"{POPULARITY_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(dict(popularity), f)
+            os.replace(tmp_path, POPULARITY_FILE)
+        except OSError:
+            pass
+
+
+# Fungsi untuk mengurutkan kolom dari yang paling sering dipilih (urutan asli jika sama)
+def columns_by_popularity(columns):
+    with _popularity_lock:
+        popularity = dict(_load_popularity())
+    return sorted(columns, key=lambda column: -popularity.get(column, 0))
+
+
+# Fungsi untuk memanaskan cache turunan satu kolom dengan argumen yang sama seperti
+# saat kolom dipilih di main.py dan app.py (app.py: seleksi semua baris sebelum ada
+# filter, top_k=TOP_K). Fungsi tanpa cache (misalnya data histogram/box) tidak dipanggil.
+def warm_column(df, column, group_column=REPAYMENT_COLUMN):
+    column_type = identify_column_types(df).get(column)
+    index = get_filter_index(df)
+    selection = index.all_selection()
+    has_group = group_column in df.columns and column != group_column
+
+    if column_type == 'numeric':
+        index.value_range(column)
+        grouped_density(df, column, selection=selection)
+        if has_group:
+            get_comparison_with_repayment(df, column, 'numeric', group_column)
+    elif column_type == 'array':
+        get_multi_hot(df, column)
+    elif column_type in ('categorical', 'text'):
+        value_distribution(df, column, top_k=TOP_K, selection=selection)
+        if has_group:
+            contingency_table(df, column, group_column, top_k=TOP_K, selection=selection)
+            if column_type == 'categorical':
+                get_comparison_with_repayment(df, column, column_type, group_column)
+        options, _ = bounded_options(df, column, MAX_WIDGET_OPTIONS)
+        if column_type == 'categorical':
+            index.values_selection(column, options)
+
+
+# Fungsi untuk daftar tugas pemanasan: (nama, fungsi, argumen). Tugas 'prepare'
+# dijalankan berurutan lebih dulu karena dipakai semua tugas kolom; tugas kolom
+# diurutkan dari kolom terpopuler; tugas seluruh dataset yang berat di akhir.
+def warmup_plan(df, group_column=REPAYMENT_COLUMN):
+    has_group = group_column in df.columns
+    prepare = [
+        ('column_types', identify_column_types, (df,)),
+        ('profile', get_profile, (df,)),
+        ('filter_index', get_filter_index, (df,)),
+    ]
+    if has_group:
+        prepare += [
+            ('grouping', factorize_groups, (df, group_column)),
+            ('numeric_summary', grouped_numeric_summary, (df, group_column)),
+        ]
+
+    columns = columns_by_popularity(list(df.columns))[:WARMUP_MAX_COLUMNS]
+    tasks = [(column, warm_column, (df, column, group_column)) for column in columns]
+
+    if has_group:
+        tasks.append(('woe_iv', woe_iv_table, (df, group_column)))
+    index = get_filter_index(df)
+    tasks.append(('association', association_matrix, (index, index.all_selection())))
+    return prepare, tasks
+
+
+# Fungsi untuk thread pool pemanasan bersama satu proses (dibuat sekali)
+def _shared_executor():
+    global _executor
+    with _scheduler_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=WARMUP_WORKERS, thread_name_prefix='warmup')
+        return _executor
+
+
+# Penjadwal pemanasan cache di latar belakang. Tugas persiapan dijalankan satu
+# thread koordinator, lalu tugas kolom dikirim ke thread pool bersama sesuai urutan.
+# cancel() membatalkan tugas yang belum mulai; tugas yang sedang berjalan selesai
+# sendiri dan hasilnya tetap masuk cache. Satu penjadwal per dataset cukup untuk
+# satu proses (lihat pemakaian st.cache_resource di app.py dan main.py); penjadwal
+# di luar WARMUP_MAX_DATASETS terbaru dibatalkan.
+class WarmupScheduler:
+    def __init__(self, df, group_column=REPAYMENT_COLUMN):
+        self.fingerprint = dataset_fingerprint(df)
+        self.done = 0
+        self.failed = []
+        self.running = set()
+        self.started_at = time.time()
+        self.finished_at = None
+        self._prepare, self._tasks = warmup_plan(df, group_column)
+        self.total = len(self._prepare) + len(self._tasks)
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._futures = []
+        with _scheduler_lock:
+            _schedulers.append(self)
+            superseded = _schedulers[:-WARMUP_MAX_DATASETS]
+            del _schedulers[:-WARMUP_MAX_DATASETS]
+        for scheduler in superseded:
+            scheduler.cancel()
+        self._thread = threading.Thread(target=self._coordinate, name='warmup-coordinator', daemon=True)
+        self._thread.start()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self):
+        return self.finished_at is not None
+
+    def _run(self, name, func, args):
+        if self.cancelled:
+            return
+        with self._lock:
+            self.running.add(name)
+        try:
+            func(*args)
+        except Exception as e:
+            with self._lock:
+                self.failed.append((name, repr(e)))
+        finally:
+            with self._lock:
+                self.running.discard(name)
+                self.done += 1
+                if self.done == self.total:
+                    self.finished_at = time.time()
+
+    def _coordinate(self):
+        for name, func, args in self._prepare:
+            self._run(name, func, args)
+        if self.cancelled:
+            return
+
+        executor = _shared_executor()
+        with self._lock:
+            self._futures = [executor.submit(self._run, name, func, args) for name, func, args in self._tasks]
+        if self.cancelled:
+            self.cancel()
+
+    # Fungsi untuk menghentikan pemanasan (misalnya saat file baru di-upload)
+    def cancel(self):
+        self._cancelled.set()
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def progress(self):
+        with self._lock:
+            return {
+                'done': self.done,
+                'total': self.total,
+                'failed': list(self.failed),
+                'running': sorted(self.running),
+                'cancelled': self.cancelled,
+                'finished': self.finished,
+                'seconds': (self.finished_at or time.time()) - self.started_at,
+            }
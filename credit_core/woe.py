@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+
+from .column_types import identify_column_types
+from .fingerprint import BoundedCache, dataset_fingerprint
+from .grouping import REPAYMENT_COLUMN
+from .multi_hot import get_multi_hot
+
+# Status yang dihitung sebagai "bad" (event) dan "good" (non-event)
+BAD_STATUS = 'Outstanding'
+GOOD_STATUS = 'Lunas'
+
+# Jumlah bin kuantil untuk kolom numerik
+IV_BINS = 10
+
+# Penambah jumlah per bin agar WoE tetap terhingga pada bin tanpa good/bad
+WOE_SMOOTHING = 0.5
+
+# Jumlah kolom yang dihitung sekaligus agar matriks kode tetap kecil
+COLUMN_BLOCK = 8
+
+MISSING_LABEL = 'Missing/Null'
+
+# Batas IV dan label kekuatan prediktif (aturan umum credit scoring)
+IV_STRENGTH = [
+    (0.02, 'Tidak prediktif'),
+    (0.1, 'Lemah'),
+    (0.3, 'Sedang'),
+    (0.5, 'Kuat'),
+    (np.inf, 'Sangat kuat (periksa kebocoran)'),
+]
+
+MAX_CACHED_RANKINGS = 8
+
+_woe_cache = BoundedCache(MAX_CACHED_RANKINGS, 'woe')
+
+
+def iv_strength(iv):
+    for limit, label in IV_STRENGTH:
+        if iv < limit:
+            return label
+    return IV_STRENGTH[-1][1]
+
+
+# Fungsi untuk membagi kolom numerik ke bin kuantil. Hasil: kode bin per baris
+# (bin terakhir untuk nilai kosong) dan label tiap bin.
+def _numeric_bins(values, nbins):
+    values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    edges = np.unique(np.quantile(values[present], np.linspace(0, 1, nbins + 1))) if present.any() else np.array([0.0])
+
+    inner = edges[1:-1]
+    codes = np.searchsorted(inner, values, side='right')
+    labels = [f"[{low:,.4g}, {high:,.4g})" for low, high in zip(edges[:-1], edges[1:])] or [f"{edges[0]:,.4g}"]
+    if len(labels) > 1:
+        labels[-1] = labels[-1][:-1] + ']'
+
+    codes[~present] = len(labels)
+    return codes, labels + [MISSING_LABEL]
+
+
+# Fungsi untuk kode kategori (kosong menjadi bin tersendiri)
+def _categorical_bins(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values, sort=True)
+    codes = np.where(codes < 0, len(uniques), codes)
+    return codes, [str(value) for value in uniques] + [MISSING_LABEL]
+
+
+# Fungsi untuk jumlah baris dan jumlah "bad" per elemen kolom array (elemen terakhir
+# untuk baris kosong). Satu baris masuk ke setiap elemen yang dimuatnya.
+def _array_bin_counts(df, column, rows, is_bad):
+    multi_hot = get_multi_hot(df, column)
+    status_codes = np.full(len(df), -1, dtype=np.int64)
+    status_codes[rows] = is_bad
+    counts = multi_hot.element_group_counts(status_codes, 2, rows)
+
+    missing = multi_hot.missing[rows]
+    all_counts = np.append(counts.sum(axis=1), missing.sum())
+    bad_counts = np.append(counts[:, 1], (missing & is_bad).sum())
+    return all_counts, bad_counts, [str(value) for value in multi_hot.vocabulary] + [MISSING_LABEL]
+
+
+# Fungsi untuk menghitung WoE dan IV semua kolom terhadap status pembayaran.
+# Kode bin semua kolom dalam satu blok digeser ke rentang masing-masing lalu
+# dihitung bersama dengan satu np.bincount untuk good dan satu untuk bad.
+# Kolom array dihitung per elemen: setiap elemen menjadi satu bin dan baris yang
+# memuat beberapa elemen ikut dihitung di setiap bin tersebut.
+# Hasil di-cache per (sidik jari data, target, jumlah bin).
+def woe_iv_table(df, target_column=REPAYMENT_COLUMN, nbins=IV_BINS, bad=BAD_STATUS, good=GOOD_STATUS):
+    key = (dataset_fingerprint(df), target_column, nbins, bad, good)
+    result = _woe_cache.get(key)
+    if result is not None:
+        return result
+
+    column_types = identify_column_types(df)
+    columns = [col for col, type_ in column_types.items()
+               if type_ in ('numeric', 'categorical', 'array') and col != target_column]
+    skipped = [col for col in column_types if col not in columns and col != target_column]
+
+    target = df[target_column]
+    is_bad = (target == bad).to_numpy()
+    is_good = (target == good).to_numpy()
+    labelled = is_bad | is_good
+    is_bad, rows = is_bad[labelled], np.flatnonzero(labelled)
+    total_bad, total_good = int(is_bad.sum()), int(len(rows) - is_bad.sum())
+
+    summary = []
+    details = {}
+
+    def add_column(column, labels, all_counts, bad_counts):
+        detail = _woe_detail(labels, all_counts, bad_counts, total_bad, total_good)
+        details[column] = detail
+        summary.append({
+            'column': column,
+            'type': column_types[column],
+            'bins': int(len(detail)),
+            'iv': float(detail['iv'].sum()),
+            'missing_percentage': round(float(all_counts[-1] / len(rows) * 100), 2) if len(rows) else 0.0,
+        })
+
+    binned_columns = [col for col in columns if column_types[col] != 'array']
+    for block_start in range(0, len(binned_columns), COLUMN_BLOCK):
+        block_columns = binned_columns[block_start:block_start + COLUMN_BLOCK]
+
+        block_codes, block_labels, offsets = [], [], [0]
+        for column in block_columns:
+            values = df[column].iloc[rows]
+            if column_types[column] == 'numeric':
+                codes, labels = _numeric_bins(values, nbins)
+            else:
+                codes, labels = _categorical_bins(values)
+            block_codes.append(codes + offsets[-1])
+            block_labels.append(labels)
+            offsets.append(offsets[-1] + len(labels))
+
+        flat = np.concatenate(block_codes)
+        bad_flags = np.tile(is_bad, len(block_columns))
+        bad_counts = np.bincount(flat[bad_flags], minlength=offsets[-1])
+        all_counts = np.bincount(flat, minlength=offsets[-1])
+
+        for i, column in enumerate(block_columns):
+            bins = slice(offsets[i], offsets[i + 1])
+            add_column(column, block_labels[i], all_counts[bins], bad_counts[bins])
+
+    for column in columns:
+        if column_types[column] == 'array':
+            all_counts, bad_counts, labels = _array_bin_counts(df, column, rows, is_bad)
+            add_column(column, labels, all_counts, bad_counts)
+
+    summary = pd.DataFrame(summary, columns=['column', 'type', 'bins', 'iv', 'missing_percentage'])
+    summary['strength'] = summary['iv'].map(iv_strength)
+    summary = summary.sort_values('iv', ascending=False, kind='stable').reset_index(drop=True)
+
+    result = {
+        'summary': summary,
+        'details': details,
+        'target_column': target_column,
+        'bad': bad,
+        'good': good,
+        'rows': int(len(rows)),
+        'skipped': skipped,
+    }
+    return _woe_cache.set(key, result)
+
+
+# Fungsi untuk tabel WoE per bin satu kolom (bin kosong tidak ditampilkan)
+def _woe_detail(labels, counts, bad_counts, total_bad, total_good):
+    good_counts = counts - bad_counts
+    keep = counts > 0
+    labels = [label for label, kept in zip(labels, keep) if kept]
+    counts, bad_counts, good_counts = counts[keep], bad_counts[keep], good_counts[keep]
+
+    bins = len(counts)
+    dist_bad = (bad_counts + WOE_SMOOTHING) / (total_bad + WOE_SMOOTHING * bins)
+    dist_good = (good_counts + WOE_SMOOTHING) / (total_good + WOE_SMOOTHING * bins)
+    woe = np.log(dist_good / dist_bad)
+
+    return pd.DataFrame({
+        'bin': labels,
+        'count': counts,
+        'good': good_counts,
+        'bad': bad_counts,
+        'bad_rate': np.round(bad_counts / counts * 100, 2),
+        'woe': woe,
+        'iv': (dist_good - dist_bad) * woe,
+    })
+
+
+# Fungsi untuk tabel WoE semua kolom dalam format panjang (untuk diunduh)
+def woe_detail_table(result):
+    frames = [detail.assign(column=column) for column, detail in result['details'].items()]
+    if not frames:
+        return pd.DataFrame(columns=['column', 'bin', 'count', 'good', 'bad', 'bad_rate', 'woe', 'iv'])
+    table = pd.concat(frames, ignore_index=True)
+    return table[['column'] + [col for col in table.columns if col != 'column']]
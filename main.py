@@ -1,161 +1,136 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import json
+from credit_core.shared_store import load_shared
+from credit_core.column_types import identify_column_types
+from credit_core.fingerprint import dataset_fingerprint
+from credit_core.column_profile import get_profile
+from credit_core.group_stats import get_comparison_with_repayment
+from credit_core.heavy_hitters import OTHER_LABEL
+from credit_core.chart_data import box_data, histogram_data
+from credit_core.charts import box_figure, histogram_figure
+from credit_core.streaming import stream_comparison, stream_histogram, stream_profile
+from credit_core.incremental import IncrementalStore
+from credit_core.warmup import WARMUP_MAX_DATASETS, WarmupScheduler, record_column_use
+from credit_core.instrumentation import METRICS_DIR, Recorder, mark_cache_miss
+from perf_panel import performance_panel, warmup_status
+from ranking_page import feature_ranking_page
 
 st.set_page_config(layout="wide", page_title="Dashboard Analisis Credit Score")
 
 # Judul aplikasi
 st.title("Dashboard Analisis Credit Score dan Status Pembayaran")
 
-# Fungsi untuk mengidentifikasi tipe data kolom
-def identify_column_types(df):
-    column_types = {}
-    
-    for column in df.columns:
-        # Mengambil nilai non-null dari kolom
-        non_null_values = df[column].dropna().astype(str)
-        
-        if non_null_values.empty:
-            column_types[column] = 'unknown'
-            continue
-        
-        # Cek apakah berisi angka
-        if pd.to_numeric(non_null_values, errors='coerce').notna().all():
-            column_types[column] = 'numeric'
-            continue
-        
-        # Cek untuk format array
-        if non_null_values.str.startswith('[').any() and non_null_values.str.endswith(']').any():
-            column_types[column] = 'array'
-            continue
-            
-        # Cek jumlah nilai unik
-        unique_values = non_null_values.nunique()
-        if unique_values <= 20:
-            column_types[column] = 'categorical'
-        else:
-            column_types[column] = 'text'
-    
-    return column_types
-
-# Fungsi untuk mendapatkan statistik kolom kategorikal
-def get_categorical_stats(df, column):
-    value_counts = df[column].value_counts(dropna=False)
-    value_counts.index = value_counts.index.map(lambda x: 'Missing/Null' if pd.isna(x) else str(x))
-    
-    stats = []
-    for value, count in value_counts.items():
-        stats.append({
-            'value': value,
-            'count': count,
-            'percentage': round((count / len(df)) * 100, 2)
-        })
-    
-    return stats
-
-# Fungsi untuk mendapatkan statistik kolom numerik
-def get_numeric_stats(df, column):
-    values = pd.to_numeric(df[column], errors='coerce')
-    stats = {
-        'count': int(values.count()),
-        'min': float(values.min()),
-        'max': float(values.max()),
-        'mean': float(values.mean()),
-        'median': float(values.median()),
-        'missing': int(len(df) - values.count())
-    }
-    
-    # Membuat bins untuk distribusi
-    bins = 5
-    bin_values, bin_edges = np.histogram(values.dropna(), bins=bins)
-    
-    stats['bins'] = [{
-        'min': float(bin_edges[i]),
-        'max': float(bin_edges[i+1]),
-        'count': int(bin_values[i])
-    } for i in range(bins)]
-    
-    return stats
-
-# Fungsi untuk mendapatkan perbandingan dengan status pembayaran
-def get_comparison_with_repayment(df, column, column_type, repayment_column='farmer_repayment_status'):
-    # Mendapatkan nilai unik repayment status
-    repayment_values = df[repayment_column].dropna().unique().tolist()
-    
-    if column_type == 'categorical':
-        # Membuat tabel crosstab
-        cross_tab = pd.crosstab(df[column], df[repayment_column], margins=False)
-        cross_tab_percent = pd.crosstab(df[column], df[repayment_column], normalize='index') * 100
-        
-        return {
-            'absolute': cross_tab,
-            'percentage': cross_tab_percent
-        }
-    
-    elif column_type == 'numeric':
-        # Membuat statistik per status pembayaran
-        stats = {}
-        
-        for status in repayment_values:
-            values = pd.to_numeric(df[df[repayment_column] == status][column], errors='coerce')
-            
-            if values.count() == 0:
-                continue
-                
-            stats[status] = {
-                'count': int(values.count()),
-                'min': float(values.min()),
-                'max': float(values.max()),
-                'mean': float(values.mean()),
-                'median': float(values.median())
-            }
-        
-        return stats
-    
-    return None
-
 # Upload file CSV
 uploaded_file = st.sidebar.file_uploader("Upload file CSV", type=["csv"])
 
-# Load data
-@st.cache_data
+# Panel performa: waktu, memori, cache, dan ukuran grafik per rerun
+show_performance = st.sidebar.checkbox("Tampilkan panel performa")
+recorder = Recorder('main', enabled=show_performance or METRICS_DIR is not None, trace_memory=show_performance)
+
+# Fungsi untuk menampilkan grafik sekaligus mencatat ukuran payload-nya
+def show_chart(fig, name):
+    recorder.record_payload(name, fig)
+    st.plotly_chart(fig, use_container_width=True)
+
+# Load data: dataset dipetakan dari file Arrow bersama (read-only, tanpa salinan per sesi)
+@st.cache_resource
 def load_data(file):
-    df = pd.read_csv(file)
+    mark_cache_miss('load_data')
+    df = load_shared(file)
     return df
 
+# Profil file besar dibaca per chunk, hanya statistik yang disimpan di memori
+@st.cache_data
+def load_stream_profile(file):
+    mark_cache_miss('load_stream_profile')
+    return stream_profile(file)
+
+# Pemanasan cache dijalankan sekali per dataset untuk seluruh proses (semua sesi
+# memakai penjadwal dan thread pool yang sama)
+@st.cache_resource(max_entries=WARMUP_MAX_DATASETS)
+def get_warmup(fingerprint, _df):
+    return WarmupScheduler(_df)
+
+# Riwayat dataset inkremental dibagi antar sesi dalam satu proses
+@st.cache_resource
+def get_store():
+    return IncrementalStore()
+
 # Sidebar untuk konfigurasi
 st.sidebar.title("Konfigurasi")
 
+append_mode = uploaded_file is not None and st.sidebar.checkbox(
+    "Mode append (tambahkan ke riwayat)",
+    help="Tambahkan baris baru dari file ke riwayat data (duplikat per farmer_code dilewati), "
+         "lalu tampilkan statistik seluruh riwayat. Box plot tidak tersedia di mode ini."
+)
+streaming_mode = uploaded_file is not None and not append_mode and st.sidebar.checkbox(
+    "Mode streaming (file besar)",
+    help="Baca file per chunk tanpa memuat seluruh data ke memori. Box plot tidak tersedia di mode ini."
+)
+stream_result = None
+
 # Memuat data
-if uploaded_file is not None:
-    df = load_data(uploaded_file)
+with recorder.section('load_data'):
+    if append_mode:
+        # Hanya batch baru yang diproses; agregat riwayat digabung secara inkremental
+        store = get_store()
+        try:
+            batch_info = store.append(uploaded_file)
+        except ValueError as e:
+            st.sidebar.error(f"Gagal menambahkan batch: {e}")
+            st.stop()
+        if batch_info['already_ingested']:
+            st.sidebar.info("File ini sudah pernah ditambahkan ke riwayat.")
+        else:
+            st.sidebar.success(f"{batch_info['rows_added']:,} baris baru ditambahkan, "
+                               f"{batch_info['duplicates']:,} duplikat dilewati.")
+        st.sidebar.caption(f"Riwayat: {store.rows:,} baris dari {len(store.batches)} batch")
+        stream_result = store.result()
+        df = None
+    elif streaming_mode:
+        stream_result = recorder.track_cache('load_stream_profile', load_stream_profile, uploaded_file)
+        df = None
+    elif uploaded_file is not None:
+        df = recorder.track_cache('load_data', load_data, uploaded_file)
+    else:
+        try:
+            # Default file
+            df = load_shared("credit_score_evaluation.csv")
+            st.sidebar.success("Menggunakan file default: credit_score_evaluation.csv")
+        except:
+            st.sidebar.error("File default tidak ditemukan. Silakan upload file CSV.")
+            st.stop()
+
+# Pemanasan cache semua kolom di latar belakang (dibagi antar sesi per dataset)
+warmup_status(get_warmup(dataset_fingerprint(df), df) if df is not None else None)
+
+if stream_result is not None:
+    # Tipe dan profil kolom sudah dihitung saat streaming
+    profile = stream_result['profile']
+    column_types = {col: entry['type'] for col, entry in profile['columns'].items()}
 else:
-    try:
-        # Default file
-        df = pd.read_csv("credit_score_evaluation.csv")
-        st.sidebar.success("Menggunakan file default: credit_score_evaluation.csv")
-    except:
-        st.sidebar.error("File default tidak ditemukan. Silakan upload file CSV.")
-        st.stop()
+    with recorder.section('profile'):
+        # Identifikasi tipe data kolom (di-cache per sidik jari dataset)
+        column_types = identify_column_types(df)
 
-# Identifikasi tipe data kolom
-column_types = identify_column_types(df)
+        # Profil semua kolom dihitung sekali, pemilihan kolom cukup membaca profil
+        profile = get_profile(df, column_types)
 
 # Informasi dataset
 with st.expander("Informasi Dataset", expanded=True):
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Jumlah Baris", len(df))
+        st.metric("Jumlah Baris", profile['rows'])
     with col2:
-        st.metric("Jumlah Kolom", len(df.columns))
+        st.metric("Jumlah Kolom", len(column_types))
     with col3:
-        if 'farmer_repayment_status' in df.columns:
-            repayment_counts = df['farmer_repayment_status'].value_counts()
-            repayment_info = ", ".join([f"{status}: {count}" for status, count in repayment_counts.items()])
+        if 'farmer_repayment_status' in column_types:
+            repayment_counts = profile['columns']['farmer_repayment_status'].get('categories', [])
+            repayment_info = ", ".join([f"{stat['value']}: {stat['count']}" for stat in repayment_counts
+                                        if stat['value'] != 'Missing/Null'])
             st.metric("Status Pembayaran", repayment_info)
     
     # Tampilkan detail kolom
@@ -163,30 +138,46 @@ with st.expander("Informasi Dataset", expanded=True):
     column_info = {
         'Kolom': list(column_types.keys()),
         'Tipe': list(column_types.values()),
-        'Missing Values': [df[col].isna().sum() for col in column_types.keys()],
-        'Missing Percentage': [round(df[col].isna().sum() / len(df) * 100, 2) for col in column_types.keys()]
+        'Missing Values': [profile['columns'][col]['missing'] for col in column_types.keys()],
+        'Missing Percentage': [profile['columns'][col]['missing_percentage'] for col in column_types.keys()]
     }
     st.dataframe(pd.DataFrame(column_info))
 
-# Sidebar untuk pemilihan kolom dan tipe
-column_type_filter = st.sidebar.radio("Tampilkan tipe kolom:", ["Semua", "Kategorikal", "Numerik"])
+# Pilih halaman: analisis satu kolom atau peringkat semua kolom (butuh data baris)
+pages = ["Analisis Kolom"]
+if df is not None and 'farmer_repayment_status' in column_types:
+    pages.append("Peringkat Fitur (WoE/IV)")
+page = st.sidebar.radio("Halaman:", pages)
 
-# Filter kolom berdasarkan tipe yang dipilih
-filtered_columns = []
-if column_type_filter == "Kategorikal":
-    filtered_columns = [col for col, type_ in column_types.items() if type_ == 'categorical' or type_ == 'array']
-elif column_type_filter == "Numerik":
-    filtered_columns = [col for col, type_ in column_types.items() if type_ == 'numeric']
+selected_column = None
+if page == "Peringkat Fitur (WoE/IV)":
+    with recorder.section('woe_iv'):
+        feature_ranking_page(df, show_chart)
 else:
-    filtered_columns = list(df.columns)
+    # Sidebar untuk pemilihan kolom dan tipe
+    column_type_filter = st.sidebar.radio("Tampilkan tipe kolom:", ["Semua", "Kategorikal", "Numerik"])
+
+    # Filter kolom berdasarkan tipe yang dipilih
+    filtered_columns = []
+    if column_type_filter == "Kategorikal":
+        filtered_columns = [col for col, type_ in column_types.items() if type_ == 'categorical' or type_ == 'array']
+    elif column_type_filter == "Numerik":
+        filtered_columns = [col for col, type_ in column_types.items() if type_ == 'numeric']
+    else:
+        filtered_columns = list(column_types)
 
-# Pencarian kolom
-search_term = st.sidebar.text_input("Cari kolom:")
-if search_term:
-    filtered_columns = [col for col in filtered_columns if search_term.lower() in col.lower()]
+    # Pencarian kolom
+    search_term = st.sidebar.text_input("Cari kolom:")
+    if search_term:
+        filtered_columns = [col for col in filtered_columns if search_term.lower() in col.lower()]
 
-# Pilih kolom untuk analisis
-selected_column = st.sidebar.selectbox("Pilih kolom untuk analisis:", filtered_columns)
+    # Pilih kolom untuk analisis
+    selected_column = st.sidebar.selectbox("Pilih kolom untuk analisis:", filtered_columns)
+    
+    # Catat popularitas kolom (urutan pemanasan cache berikutnya)
+    if selected_column and st.session_state.get('last_selected_column') != selected_column:
+        record_column_use(selected_column)
+        st.session_state['last_selected_column'] = selected_column
 
 # Tampilkan distribusi kolom yang dipilih
 if selected_column:
@@ -198,22 +189,24 @@ if selected_column:
         st.subheader("Informasi Kolom")
         st.write(f"Tipe: {column_types.get(selected_column, 'unknown')}")
         
-        missing_count = df[selected_column].isna().sum()
-        st.write(f"Missing values: {missing_count} ({round(missing_count/len(df)*100, 2)}%)")
+        column_profile = profile['columns'][selected_column]
+        st.write(f"Missing values: {column_profile['missing']} ({column_profile['missing_percentage']}%)")
         
         if column_types.get(selected_column) == 'categorical' or column_types.get(selected_column) == 'array':
-            st.write(f"Nilai unik: {df[selected_column].dropna().nunique()}")
+            st.write(f"Nilai unik: {column_profile['unique']}")
+        elif column_types.get(selected_column) == 'text' and column_profile.get('unique') is not None:
+            st.write(f"Nilai unik: {column_profile['unique']:,}")
         elif column_types.get(selected_column) == 'numeric':
-            numeric_values = pd.to_numeric(df[selected_column], errors='coerce')
-            st.write(f"Minimum: {numeric_values.min():.2f}")
-            st.write(f"Maximum: {numeric_values.max():.2f}")
-            st.write(f"Mean: {numeric_values.mean():.2f}")
-            st.write(f"Median: {numeric_values.median():.2f}")
+            numeric_stats = column_profile['numeric']
+            st.write(f"Minimum: {numeric_stats['min']:.2f}")
+            st.write(f"Maximum: {numeric_stats['max']:.2f}")
+            st.write(f"Mean: {numeric_stats['mean']:.2f}")
+            st.write(f"Median: {numeric_stats['median']:.2f}")
     
-    with col1:
+    with col1, recorder.section('distribusi'):
         if column_types.get(selected_column) == 'categorical' or column_types.get(selected_column) == 'array':
             # Visualisasi untuk kolom kategorikal
-            categorical_stats = get_categorical_stats(df, selected_column)
+            categorical_stats = profile['columns'][selected_column]['categories']
             
             # Ambil top 10 untuk grafik
             chart_data = [stat for stat in categorical_stats if stat['value'] != 'Missing/Null'][:10]
@@ -226,30 +219,61 @@ if selected_column:
                 title=f"Distribusi {selected_column}"
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig, 'kolom_kategorikal_bar')
+            if stream_result is not None and column_types.get(selected_column) == 'array':
+                st.caption("Mode streaming/append: kolom array dihitung per isi daftar utuh, bukan per elemen.")
+            
+        elif column_types.get(selected_column) == 'text' and 'top_values' in column_profile:
+            # Kolom teks bernilai unik banyak: hanya nilai teratas, sisanya satu bar "Lainnya"
+            chart_data = pd.DataFrame(column_profile['top_values'])
+            if column_profile['other']:
+                chart_data = pd.concat([chart_data, pd.DataFrame([{'value': OTHER_LABEL,
+                                                                   'count': column_profile['other']}])],
+                                       ignore_index=True)
+            
+            fig = px.bar(
+                chart_data,
+                x='value',
+                y='count',
+                labels={'value': selected_column, 'count': 'Jumlah'},
+                title=f"{len(column_profile['top_values'])} Nilai Terbanyak {selected_column}"
+            )
+            
+            show_chart(fig, 'kolom_teks_bar')
+            if stream_result is not None:
+                st.caption("Mode streaming/append: jumlah adalah perkiraan batas atas (Space-Saving).")
             
         elif column_types.get(selected_column) == 'numeric':
             # Visualisasi untuk kolom numerik
-            numeric_stats = get_numeric_stats(df, selected_column)
-            
-            # Histogram
-            fig = px.histogram(
-                df, 
-                x=selected_column,
-                nbins=20,
+            # Histogram (jumlah per bin dihitung di server)
+            if stream_result is not None:
+                hist = stream_histogram(stream_result, selected_column, nbins=20)
+            else:
+                hist = histogram_data(df, selected_column, nbins=20)
+            fig = histogram_figure(
+                hist,
+                ['#636EFA'],
                 title=f"Distribusi {selected_column}"
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig, 'kolom_numerik_histogram')
     
     # Perbandingan dengan status pembayaran (jika kolom repayment_status ada)
-    if 'farmer_repayment_status' in df.columns and selected_column != 'farmer_repayment_status':
+    if 'farmer_repayment_status' in column_types and selected_column != 'farmer_repayment_status':
         st.header(f"Perbandingan {selected_column} dengan Status Pembayaran")
         
         column_type = column_types.get(selected_column)
         
         if column_type == 'categorical' or column_type == 'array':
-            comparison = get_comparison_with_repayment(df, selected_column, 'categorical')
+            with recorder.section('comparison'):
+                if stream_result is not None:
+                    comparison = stream_comparison(stream_result, selected_column, 'categorical')
+                    if column_type == 'array':
+                        st.caption("Mode streaming/append: kolom array dibandingkan per isi daftar utuh, "
+                                   "bukan per elemen.")
+                else:
+                    # Kolom array dibandingkan per elemen (representasi multi-hot)
+                    comparison = get_comparison_with_repayment(df, selected_column, column_type)
             
             if comparison:
                 # Tab untuk memilih tampilan absolut atau persentase
@@ -270,7 +294,7 @@ if selected_column:
                         }
                     )
                     
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_chart(fig, 'perbandingan_persentase')
                     
                     # Tampilkan data tabel
                     st.dataframe(comparison['percentage'].round(2))
@@ -290,13 +314,17 @@ if selected_column:
                         }
                     )
                     
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_chart(fig, 'perbandingan_absolut')
                     
                     # Tampilkan data tabel
                     st.dataframe(comparison['absolute'])
                 
         elif column_type == 'numeric':
-            comparison = get_comparison_with_repayment(df, selected_column, 'numeric')
+            with recorder.section('comparison'):
+                if stream_result is not None:
+                    comparison = stream_comparison(stream_result, selected_column, 'numeric')
+                else:
+                    comparison = get_comparison_with_repayment(df, selected_column, 'numeric')
             
             if comparison:
                 # Membuat dataframe dari statistik
@@ -334,23 +362,29 @@ if selected_column:
                     barmode='group'
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, 'perbandingan_mean_median')
                 
-                # Box plot per status pembayaran
-                fig = px.box(
-                    df, 
-                    x='farmer_repayment_status', 
-                    y=selected_column,
-                    title=f"Box Plot {selected_column} per Status Pembayaran",
-                    color='farmer_repayment_status',
-                    color_discrete_map={
+            if comparison and df is not None:
+                # Box plot per status pembayaran (butuh data baris, tidak ada di mode streaming)
+                fig = box_figure(
+                    box_data(df, selected_column, 'farmer_repayment_status'),
+                    {
                         'Outstanding': '#FF8042',
                         'Lunas': '#00C49F',
                         'Drop': '#8884d8'
-                    }
+                    },
+                    selected_column,
+                    'farmer_repayment_status',
+                    title=f"Box Plot {selected_column} per Status Pembayaran"
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, 'perbandingan_box')
+
+# Metrik performa rerun ini: tulis ke folder metrik dan tampilkan panel jika diminta
+recorder.finish()
+recorder.write()
+if show_performance:
+    performance_panel(recorder)
 
 # Footer
 st.sidebar.markdown("---")
@@ -0,0 +1,51 @@
+import pandas as pd
+import streamlit as st
+
+
+# Fungsi untuk menampilkan panel performa rerun terakhir di sidebar
+def performance_panel(recorder):
+    with st.sidebar.expander("Panel Performa", expanded=True):
+        st.caption(f"Total rerun: {recorder.total_seconds * 1000:,.0f} ms")
+
+        if recorder.sections:
+            sections = pd.DataFrame(recorder.sections)
+            sections['ms'] = (sections.pop('seconds') * 1000).round(1)
+            for column in ('allocated_bytes', 'peak_bytes'):
+                if column in sections:
+                    sections[column.replace('_bytes', '_mb')] = (sections.pop(column) / 2 ** 20).round(2)
+            st.markdown("**Waktu per bagian**")
+            st.dataframe(sections.set_index('name'), use_container_width=True)
+
+        caches = pd.DataFrame(recorder.caches).T
+        caches = caches[(caches['hits'] > 0) | (caches['misses'] > 0)]
+        if not caches.empty:
+            st.markdown("**Cache (hit/miss rerun ini)**")
+            st.dataframe(caches[['hits', 'misses']], use_container_width=True)
+
+        if recorder.payloads:
+            payloads = pd.Series(recorder.payloads, name='KB').div(1024).round(1)
+            st.markdown("**Ukuran payload grafik**")
+            st.dataframe(payloads, use_container_width=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("JSON", recorder.to_json(), file_name=f"{recorder.app}_metrics.json",
+                               mime="application/json")
+        with col2:
+            st.download_button("Prometheus", recorder.to_prometheus(), file_name=f"{recorder.app}_metrics.prom",
+                               mime="text/plain")
+
+
+# Fungsi untuk menampilkan status pemanasan cache di sidebar (hilang setelah selesai)
+def warmup_status(scheduler):
+    if scheduler is None:
+        return
+    progress = scheduler.progress()
+    if progress['finished'] or progress['cancelled']:
+        return
+
+    st.sidebar.progress(progress['done'] / progress['total'],
+                        text=f"Menyiapkan cache kolom di latar belakang: {progress['done']}/{progress['total']}")
+    if progress['running']:
+        st.sidebar.caption(f"Sedang dihitung: {', '.join(progress['running'])}")
+    st.sidebar.button("Perbarui status")
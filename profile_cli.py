@@ -0,0 +1,251 @@
+import argparse
+import html
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from credit_core.column_profile import build_profile
+from credit_core.column_types import identify_column_types
+from credit_core.dataset_cache import load_cached
+from credit_core.group_stats import get_comparison_with_repayment
+from credit_core.grouping import REPAYMENT_COLUMN
+
+# Jumlah kolom yang diprofilkan per tugas di process pool
+COLUMNS_PER_TASK = 8
+
+# Jumlah nilai kategori yang ditampilkan per kolom di laporan HTML
+HTML_TOP_CATEGORIES = 20
+
+
+# Fungsi untuk mengubah hasil statistik menjadi nilai yang aman untuk JSON
+def _json_safe(value):
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _table_to_dict(table):
+    return {str(row): {str(col): _json_safe(table.loc[row, col]) for col in table.columns}
+            for row in table.index}
+
+
+# Fungsi untuk memprofilkan sekelompok kolom dari satu file (dijalankan di worker).
+# Worker membaca kolomnya sendiri dari cache Parquet, sehingga DataFrame
+# tidak perlu dikirim antar proses.
+def profile_columns(path, columns, group_column=REPAYMENT_COLUMN):
+    read_columns = list(dict.fromkeys(columns + ([group_column] if group_column else [])))
+    df = load_cached(path, columns=read_columns)
+    column_types = identify_column_types(df)
+    profile = build_profile(df, column_types)
+
+    results = {}
+    for column in columns:
+        entry = dict(profile['columns'][column])
+        column_type = column_types[column]
+        comparison = None
+
+        if group_column in df.columns and column != group_column:
+            if column_type in ('categorical', 'array'):
+                # Kolom array dibandingkan per elemen (array_contingency_table)
+                comparison = get_comparison_with_repayment(df, column, column_type, group_column)
+                comparison = {name: _table_to_dict(table) for name, table in comparison.items()}
+            elif column_type == 'numeric':
+                comparison = get_comparison_with_repayment(df, column, 'numeric', group_column)
+
+        entry['comparison'] = comparison
+        results[column] = _json_safe(entry)
+
+    return results
+
+
+# Fungsi untuk memprofilkan satu atau beberapa file; kolom semua file
+# dibagi menjadi tugas kecil dan dijalankan paralel di process pool
+def profile_files(paths, group_column=REPAYMENT_COLUMN, workers=None):
+    datasets = {}
+    tasks = []
+    for path in paths:
+        # Muat sekali di proses utama untuk menyiapkan cache Parquet bagi worker
+        df = load_cached(path)
+        columns = list(df.columns)
+        datasets[path] = {
+            'file': os.path.abspath(path),
+            'rows': len(df),
+            'group_column': group_column if group_column in df.columns else None,
+            'columns': {},
+        }
+        for start in range(0, len(columns), COLUMNS_PER_TASK):
+            tasks.append((path, columns[start:start + COLUMNS_PER_TASK]))
+        del df
+
+    # Worker menerima kolom grup hasil pengecekan per file (None jika file tidak memilikinya)
+    if workers == 1:
+        results = [profile_columns(path, columns, datasets[path]['group_column']) for path, columns in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(profile_columns, path, columns, datasets[path]['group_column'])
+                       for path, columns in tasks]
+            results = [future.result() for future in futures]
+
+    for (path, columns), result in zip(tasks, results):
+        datasets[path]['columns'].update(result)
+
+    generated_at = time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    for report in datasets.values():
+        report['generated_at'] = generated_at
+    return datasets
+
+
+def _format_number(value):
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return f"{value:,}" if isinstance(value, int) else html.escape(str(value))
+
+
+def _html_table(rows, headers):
+    head = ''.join(f"<th>{html.escape(str(header))}</th>" for header in headers)
+    body = ''.join('<tr>' + ''.join(f"<td>{_format_number(cell)}</td>" for cell in row) + '</tr>'
+                   for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _html_comparison(comparison, column_type):
+    if not comparison:
+        return ''
+    if column_type == 'numeric':
+        stats = ['count', 'min', 'max', 'mean', 'median']
+        rows = [[status] + [values[stat] for stat in stats] for status, values in comparison.items()]
+        return _html_table(rows, ['Status'] + stats)
+
+    percentage = comparison['percentage']
+    statuses = list(next(iter(percentage.values()), {}))
+    rows = [[value] + [comparison['absolute'][value][status] for status in statuses]
+            + [percentage[value][status] for status in statuses] for value in percentage]
+    headers = ['Nilai'] + statuses + [f"{status} (%)" for status in statuses]
+    return _html_table(rows, headers)
+
+
+# Fungsi untuk menyusun laporan HTML statis dari laporan JSON
+def render_html(report):
+    title = f"Profil Dataset: {os.path.basename(report['file'])}"
+    columns = report['columns']
+
+    summary_rows = [[column, entry['type'], entry['count'], entry['missing'], entry['missing_percentage']]
+                    for column, entry in columns.items()]
+    sections = []
+    for column, entry in columns.items():
+        parts = [f"<h3 id=\"{html.escape(column)}\">{html.escape(column)} ({entry['type']})</h3>"]
+        if 'numeric' in entry:
+            stats = entry['numeric']
+            parts.append(_html_table([[stats[stat] for stat in ('count', 'min', 'max', 'mean', 'median')]],
+                                     ['count', 'min', 'max', 'mean', 'median']))
+        elif 'categories' in entry:
+            top = entry['categories'][:HTML_TOP_CATEGORIES]
+            parts.append(_html_table([[stat['value'], stat['count'], stat['percentage']] for stat in top],
+                                     ['Nilai', 'Jumlah', 'Persentase']))
+        comparison = _html_comparison(entry.get('comparison'), entry['type'])
+        if comparison:
+            parts.append(f"<h4>Perbandingan dengan {html.escape(str(report['group_column']))}</h4>")
+            parts.append(comparison)
+        sections.append('\n'.join(parts))
+
+    return f"""<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 1rem; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+th {{ background: #f0f2f6; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+<p>Jumlah baris: {report['rows']:,} &middot; Jumlah kolom: {len(columns)} &middot; Dibuat: {report['generated_at']}</p>
+<h2>Ringkasan Kolom</h2>
+{_html_table(summary_rows, ['Kolom', 'Tipe', 'Terisi', 'Missing', 'Missing (%)'])}
+<h2>Detail Kolom</h2>
+{''.join(sections)}
+</body>
+</html>
+"""
+
+
+# Fungsi untuk nama laporan setiap file: path relatif terhadap folder bersama semua
+# file, tanpa ekstensi dan dengan pemisah folder menjadi "__" (misalnya
+# region_a/farmers.csv -> region_a__farmers), sehingga file bernama sama di folder
+# berbeda tidak saling menimpa. Nama yang tetap sama menghasilkan ValueError.
+def report_names(paths):
+    paths = list(dict.fromkeys(os.path.abspath(path) for path in paths))
+    base = os.path.commonpath([os.path.dirname(path) for path in paths])
+
+    names = {}
+    for path in paths:
+        name = os.path.splitext(os.path.relpath(path, base))[0].replace(os.sep, '__')
+        if name in names.values():
+            other = next(other for other, other_name in names.items() if other_name == name)
+            raise ValueError(f"Nama laporan bentrok: {other} dan {path} sama-sama menjadi '{name}'")
+        names[path] = name
+    return names
+
+
+# Fungsi untuk menulis laporan JSON dan HTML satu dataset ke folder output
+def write_reports(report, output_dir, name=None):
+    os.makedirs(output_dir, exist_ok=True)
+    if name is None:
+        name = os.path.splitext(os.path.basename(report['file']))[0]
+    json_path = os.path.join(output_dir, f"{name}.profile.json")
+    html_path = os.path.join(output_dir, f"{name}.profile.html")
+
+    with open(json_path, 'w') as f:
+        json.dump(report, f, indent=2, allow_nan=False)
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(render_html(report))
+
+    return json_path, html_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Profil dataset credit score tanpa UI: laporan JSON dan HTML per file."
+    )
+    parser.add_argument('files', nargs='+', help="File CSV yang akan diprofilkan")
+    parser.add_argument('-o', '--output-dir', default='reports', help="Folder laporan (default: reports)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="Jumlah proses worker (default: jumlah CPU, 1 = tanpa pool)")
+    parser.add_argument('-g', '--group-column', default=REPAYMENT_COLUMN,
+                        help=f"Kolom pembanding (default: {REPAYMENT_COLUMN})")
+    args = parser.parse_args(argv)
+
+    missing = [path for path in args.files if not os.path.exists(path)]
+    if missing:
+        parser.error(f"File tidak ditemukan: {', '.join(missing)}")
+    try:
+        names = report_names(args.files)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    reports = profile_files(list(names), args.group_column, args.workers)
+    for report in reports.values():
+        json_path, html_path = write_reports(report, args.output_dir, names[report['file']])
+        print(f"{report['file']}: {report['rows']:,} baris, {len(report['columns'])} kolom -> {json_path}, {html_path}")
+    print(f"Selesai dalam {time.perf_counter() - start:.2f} detik")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import plotly.express as px
+import streamlit as st
+
+from credit_core.woe import woe_detail_table, woe_iv_table
+
+
+# Fungsi untuk halaman peringkat fitur berdasarkan Information Value (IV)
+def feature_ranking_page(df, show_chart):
+    st.header("Peringkat Fitur berdasarkan Information Value")
+
+    result = woe_iv_table(df)
+    summary = result['summary']
+    st.caption(f"WoE/IV dihitung terhadap {result['target_column']} ({result['good']} = good, "
+               f"{result['bad']} = bad) dari {result['rows']:,} baris berlabel. "
+               "Klik judul kolom tabel untuk mengurutkan.")
+    if result['skipped']:
+        st.caption(f"Kolom teks/ID tidak diperingkat: {', '.join(result['skipped'])}")
+
+    min_iv = st.slider("IV minimum", 0.0, 0.5, 0.0, 0.01)
+    shown = summary[summary['iv'] >= min_iv]
+    st.dataframe(shown.round({'iv': 4}), use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("Unduh peringkat (CSV)", summary.to_csv(index=False),
+                           file_name="peringkat_iv.csv", mime="text/csv")
+    with col2:
+        st.download_button("Unduh detail WoE per bin (CSV)", woe_detail_table(result).to_csv(index=False),
+                           file_name="detail_woe.csv", mime="text/csv")
+
+    if shown.empty:
+        return
+
+    # Detail WoE per bin untuk satu kolom
+    selected_column = st.selectbox("Lihat WoE per bin:", shown['column'])
+    detail = result['details'][selected_column]
+    fig = px.bar(
+        detail,
+        x='bin',
+        y='woe',
+        color='woe',
+        color_continuous_scale=['#FF8042', '#f0f0f0', '#00C49F'],
+        color_continuous_midpoint=0,
+        hover_data=['count', 'good', 'bad', 'bad_rate'],
+        title=f"Weight of Evidence {selected_column} per Bin",
+    )
+    fig.update_layout(xaxis_title=selected_column, yaxis_title="WoE (ln good/bad)")
+    show_chart(fig, 'woe_per_bin')
+    st.dataframe(detail.round({'woe': 4, 'iv': 4}), use_container_width=True, hide_index=True)
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from credit_core.association import association_columns, association_matrix
+from credit_core.filter_index import get_filter_index
+
+
+# Kolom array tidak diperlakukan sebagai kategori string utuh di matriks asosiasi
+def test_array_columns_are_left_out():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'farmer_age': rng.integers(20, 60, 200),
+        'farmer_gender': rng.choice(['L', 'P'], 200),
+        'farmer_crops': rng.choice(['["padi"]', '["padi", "jagung"]', '["jagung"]'], 200),
+    })
+
+    assert association_columns(df) == ['farmer_age', 'farmer_gender']
+
+    index = get_filter_index(df)
+    result = association_matrix(index, index.all_selection(), list(df.columns))
+    assert list(result['matrix'].index) == ['farmer_age', 'farmer_gender']
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from credit_core.cross_filter import CrossFilter
+from credit_core.filter_index import FilterIndex
+
+
+# Nilai besar (1e9) dengan sebaran kecil: std dari sum kuadrat tanpa pergeseran
+# kehilangan seluruh presisinya
+def _offset_frame(rows=100000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'value': 1e9 + rng.normal(0, 1, rows),
+        'score': rng.uniform(0, 100, rows),
+        'group': rng.choice(['a', 'b'], rows),
+    })
+
+
+def test_std_with_large_offset():
+    df = _offset_frame()
+    cross_filter = CrossFilter(FilterIndex(df), 'group', ['value'])
+
+    summary = cross_filter.group_summary()
+    expected = df.groupby('group')['value'].agg(['mean', 'std'])
+    np.testing.assert_allclose(summary.loc[expected.index, 'std_value'], expected['std'], rtol=1e-6)
+    np.testing.assert_allclose(summary.loc[expected.index, 'mean_value'], expected['mean'], rtol=1e-12)
+
+    overall = cross_filter.describe('value')
+    assert abs(overall['std'] - df['value'].std()) < 1e-6 * df['value'].std()
+
+
+def test_std_with_large_offset_after_incremental_updates():
+    df = _offset_frame()
+    cross_filter = CrossFilter(FilterIndex(df), 'group', ['value'])
+
+    # Perubahan kecil berturut-turut memakai jalur inkremental (tambah/kurangi baris)
+    for high in (90, 80, 85):
+        cross_filter.set_range('score', 0, high)
+    selected = df[df['score'].between(0, 85)]
+
+    summary = cross_filter.group_summary()
+    expected = selected.groupby('group')['value'].std()
+    np.testing.assert_allclose(summary.loc[expected.index, 'std_value'], expected, rtol=1e-6)
+
+    described = cross_filter.describe('value', by_group=True)
+    np.testing.assert_allclose(described.loc[expected.index, 'std'], expected, rtol=1e-6)
@@ -0,0 +1,65 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from credit_core.incremental import STATE_FILE, IncrementalStore, row_keys
+
+
+def _batches(tmp_path, count=6, rows=50):
+    rng = np.random.default_rng(0)
+    paths = []
+    for number in range(count):
+        path = tmp_path / f"batch_{number}.csv"
+        pd.DataFrame({
+            'farmer_code': [f"PTN-{number}-{i}" for i in range(rows)],
+            'farmer_age': rng.integers(20, 60, rows),
+            'farmer_repayment_status': rng.choice(['Lunas', 'Outstanding'], rows),
+        }).to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+def _append(directory, path):
+    return IncrementalStore(directory).append(path)['rows_added']
+
+
+# Beberapa proses menambah batch ke folder yang sama: tidak ada batch yang hilang
+def test_concurrent_appends_keep_every_batch(tmp_path):
+    directory = str(tmp_path / 'store')
+    paths = _batches(tmp_path)
+
+    with ProcessPoolExecutor(max_workers=len(paths)) as pool:
+        added = list(pool.map(_append, [directory] * len(paths), paths))
+
+    store = IncrementalStore(directory)
+    assert added == [50] * len(paths)
+    assert store.rows == 300
+    assert len(store.batches) == len(paths)
+    assert len(store.load()) == 300
+    assert store.result()['columns']['farmer_age'].rows == 300
+
+    # Batch yang sama dari proses lain dikenali sebagai duplikat
+    assert IncrementalStore(directory).append(paths[0])['already_ingested']
+
+
+# State versi 2 (kunci di dalam state.pkl) tetap bisa dibaca dan dilanjutkan
+def test_reads_version_2_state(tmp_path):
+    directory = tmp_path / 'store'
+    paths = _batches(tmp_path, count=2)
+    store = IncrementalStore(str(directory))
+    store.append(paths[0])
+
+    with open(directory / STATE_FILE, 'rb') as f:
+        state = pickle.load(f)
+    state = dict(state, version=2, keys=np.sort(row_keys(pd.read_csv(paths[0]))))
+    del state['key_files']
+    with open(directory / STATE_FILE, 'wb') as f:
+        pickle.dump(state, f)
+
+    store = IncrementalStore(str(directory))
+    assert store.append(paths[0])['already_ingested']
+    info = store.append(paths[1])
+    assert info['rows_added'] == 50 and info['duplicates'] == 0
+    assert IncrementalStore(str(directory)).rows == 100
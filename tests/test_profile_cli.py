@@ -0,0 +1,33 @@
+import json
+
+import pandas as pd
+import pytest
+
+import profile_cli
+from credit_core import dataset_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_cache, 'CACHE_DIR', str(tmp_path / 'cache'))
+
+
+# File tanpa kolom grup (farmer_repayment_status) tetap diprofilkan, tanpa perbandingan
+@pytest.mark.parametrize('workers', [1, 2])
+def test_profile_file_without_group_column(tmp_path, workers):
+    path = tmp_path / 'tanpa_grup.csv'
+    pd.DataFrame({
+        'farmer_age': [25, 31, 47, 52],
+        'farmer_gender': ['Male', 'Female', 'Male', 'Male'],
+    }).to_csv(path, index=False)
+
+    reports = profile_cli.profile_files([str(path)], workers=workers)
+
+    report = reports[str(path)]
+    assert report['group_column'] is None
+    assert set(report['columns']) == {'farmer_age', 'farmer_gender'}
+    assert all(entry['comparison'] is None for entry in report['columns'].values())
+
+    json_path, html_path = profile_cli.write_reports(report, str(tmp_path / 'reports'))
+    with open(json_path) as f:
+        assert json.load(f)['rows'] == 4
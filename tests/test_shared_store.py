@@ -0,0 +1,49 @@
+import os
+import socket
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from credit_core import shared_store
+from credit_core.shared_store import _acquire_lock, _break_stale_lock, _read_lock, load_shared
+
+
+def _dead_owner(lock_path):
+    with open(lock_path, 'w') as f:
+        f.write(f"999999999 {socket.gethostname()} {time.time()} dead")
+
+
+# Kunci milik penerbit yang mati dibongkar dan dataset tetap diterbitkan
+def test_stale_lock_is_taken_over(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_store, 'SHARED_DIR', str(tmp_path / 'shared'))
+    monkeypatch.setattr(shared_store, 'CACHE_DIR', str(tmp_path))
+    source = tmp_path / 'data.csv'
+    pd.DataFrame({'farmer_age': [30, 40], 'farmer_repayment_status': ['Lunas', 'Outstanding']}) \
+        .to_csv(source, index=False)
+
+    path = shared_store._arrow_path(str(source), shared_store._resolve_digest(str(source)))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _dead_owner(f"{path}.lock")
+
+    df = load_shared(str(source))
+    assert list(df['farmer_age']) == [30, 40]
+    assert not os.path.exists(f"{path}.lock")
+
+
+# Kunci baru yang menggantikan kunci basi tidak ikut terhapus oleh worker lain
+def test_breaking_a_replaced_lock_keeps_the_new_owner(tmp_path):
+    lock_path = str(tmp_path / 'data.arrow.lock')
+    _dead_owner(lock_path)
+    stale_owner = _read_lock(lock_path)[0]
+
+    # Worker lain sudah membongkar kunci basi dan memegang kunci baru
+    _break_stale_lock(lock_path, stale_owner)
+    owner = _acquire_lock(lock_path)
+    assert owner is not None
+
+    _break_stale_lock(lock_path, stale_owner)
+    assert _read_lock(lock_path)[0] == owner
+    assert os.listdir(tmp_path) == ['data.arrow.lock']
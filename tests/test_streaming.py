@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from credit_core.streaming import MAX_TRACKED_VALUES, ColumnAccumulator
+
+
+def _accumulate(values, chunk_rows=10000):
+    acc = ColumnAccumulator()
+    for start in range(0, len(values), chunk_rows):
+        acc.update(pd.Series(values[start:start + chunk_rows]))
+    return acc
+
+
+# Nilai diskret yang menumpuk tepat di batas bin (misalnya 791 baris bernilai 100)
+# harus masuk ke bin yang sama seperti np.histogram
+def test_histogram_matches_numpy_for_discrete_spikes():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.integers(0, 1000, 20000).astype(np.float64), np.full(791, 100.0)])
+    rng.shuffle(values)
+
+    acc = _accumulate(values)
+    counts, edges = acc.histogram(10)
+
+    expected, expected_edges = np.histogram(values, bins=10)
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_allclose(edges, expected_edges)
+
+
+# Tanpa jumlah per nilai (terlalu banyak nilai unik), setiap bin halus masuk utuh ke
+# satu bin: jumlah tiap bin sama dengan jumlah data di antara batas yang dilaporkan
+def test_histogram_edges_follow_fine_bins_for_many_unique_values():
+    rng = np.random.default_rng(1)
+    values = rng.normal(500, 100, MAX_TRACKED_VALUES * 3)
+
+    acc = _accumulate(values)
+    assert acc.value_counts is None
+    counts, edges = acc.histogram(20)
+
+    assert len(counts) == 20 and len(edges) == 21
+    assert counts.sum() == len(values)
+    assert edges[0] <= values.min() and edges[-1] > values.max()
+    np.testing.assert_array_equal(counts, np.histogram(values, bins=edges)[0])